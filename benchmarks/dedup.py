@@ -0,0 +1,99 @@
+"""
+Visited store benchmark.
+
+Adds fingerprints of the same URLs to each store implementation and reports
+memory per URL, traced in a separate pass, time per add and, for Bloom
+filters, the share of new URLs reported as visited.
+
+Usage:
+    python benchmarks/dedup.py [--urls 1000000]
+"""
+
+import argparse
+import tracemalloc
+from timeit import default_timer
+from typing import Callable
+
+from illuminate.interface import IVisited
+from illuminate.manager import BloomVisited
+from illuminate.manager import CompactVisited
+from illuminate.manager import SetVisited
+
+
+def urls(size: int, offset: int = 0) -> list[str]:
+    """
+    Creates URLs.
+
+    :param size: Number of URLs
+    :param offset: Number of the first URL
+    :return: URLs
+    """
+    return [
+        f"https://example.com/page/{i}" for i in range(offset, offset + size)
+    ]
+
+
+def fill(visited: IVisited, _urls: list[str]) -> IVisited:
+    """
+    Adds fingerprints of URLs to store.
+
+    :param visited: IVisited object
+    :param _urls: URLs
+    :return: IVisited object
+    """
+    for url in _urls:
+        visited.add(hash(url))
+    return visited
+
+
+def measure(
+    create: Callable[[], IVisited], _urls: list[str], fresh: list[str]
+) -> str:
+    """
+    Measures store filled with URLs.
+
+    :param create: Function that creates IVisited object
+    :param _urls: URLs to add
+    :param fresh: URLs that are not added
+    :return: Results description
+    """
+    tracemalloc.start()
+    visited = fill(create(), _urls)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del visited
+    start = default_timer()
+    visited = fill(create(), _urls)
+    elapsed = default_timer() - start
+    false = sum(hash(url) in visited for url in fresh) / len(fresh)
+    return (
+        f"{memory / len(_urls):.1f} bytes/URL, "
+        f"{elapsed / len(_urls) * 1e6:.2f}us/add, "
+        f"{false:.3%} new URLs reported as visited"
+    )
+
+
+def main() -> None:
+    """
+    Runs benchmark and prints results.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--urls", default=1_000_000, type=int)
+    args = parser.parse_args()
+
+    _urls = urls(args.urls)
+    fresh = urls(100_000, offset=args.urls)
+    print(f"URLs: {args.urls}")
+    for name, create in (
+        ("set", lambda: SetVisited()),
+        ("compact", lambda: CompactVisited()),
+        ("bloom (0.1%)", lambda: BloomVisited(args.urls, 0.001)),
+        ("bloom (1%)", lambda: BloomVisited(args.urls, 0.01)),
+    ):
+        print(f"{name}: {measure(create, _urls, fresh)}")
+
+
+if __name__ == "__main__":
+    main()
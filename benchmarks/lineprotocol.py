@@ -0,0 +1,111 @@
+"""
+Line protocol encoding benchmark.
+
+Encodes the same points, as a list of dictionaries and as a DataFrame, with
+aioinflux's serialization and with LineProtocol class, and compares elapsed
+time. aioinflux's DataFrame serialization relies on np.float, which was
+removed in NumPy 1.24, so it is reported as unavailable on newer NumPy.
+
+Usage:
+    python benchmarks/lineprotocol.py [--points 100000]
+"""
+
+import argparse
+from timeit import default_timer
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from aioinflux import serialization
+
+from illuminate.exporter import LineProtocol
+
+
+def points(size: int) -> list[dict]:
+    """
+    Creates homogeneous dictionaries.
+
+    :param size: Number of points
+    :return: Dictionaries
+    """
+    return [
+        {
+            "measurement": "benchmark",
+            "time": 1_700_000_000_000_000_000 + i,
+            "tags": {"host": f"host-{i % 16}", "url": f"/page/{i}"},
+            "fields": {"load_time": i / 7, "status": 200, "title": f"{i}"},
+        }
+        for i in range(size)
+    ]
+
+
+def frame(size: int) -> pd.DataFrame:
+    """
+    Creates DataFrame with the same points.
+
+    :param size: Number of points
+    :return: DataFrame object
+    """
+    index = np.arange(size, dtype=np.int64) + 1_700_000_000_000_000_000
+    return pd.DataFrame(
+        {
+            "host": [f"host-{i % 16}" for i in range(size)],
+            "url": [f"/page/{i}" for i in range(size)],
+            "load_time": np.arange(size) / 7,
+            "status": np.full(size, 200),
+            "title": [f"{i}" for i in range(size)],
+        },
+        index=pd.to_datetime(index, utc=True),
+    )
+
+
+def measure(encode: Callable[[], bytes]) -> str:
+    """
+    Times encoding function.
+
+    :param encode: Function that returns line protocol bytes
+    :return: Elapsed time description
+    """
+    start = default_timer()
+    try:
+        payload = encode()
+    except AttributeError as exception:
+        return f"unavailable ({exception})"
+    elapsed = default_timer() - start
+    return f"{elapsed * 1000:.0f}ms, {len(payload):,} bytes"
+
+
+def main() -> None:
+    """
+    Runs benchmark and prints results.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", default=100_000, type=int)
+    args = parser.parse_args()
+
+    _points = points(args.points)
+    _frame = frame(args.points)
+    name, tags = "benchmark", ["host", "url"]
+    print(f"Points: {args.points}")
+    print(
+        "aioinflux (dictionaries): "
+        f"{measure(lambda: serialization.serialize(_points))}"
+    )
+    print(
+        "LineProtocol (dictionaries): "
+        f"{measure(lambda: LineProtocol.serialize(_points))}"
+    )
+    print(
+        "aioinflux (DataFrame): "
+        f"{measure(lambda: serialization.serialize(_frame, name, tags))}"
+    )
+    print(
+        "LineProtocol (DataFrame): "
+        f"{measure(lambda: LineProtocol.serialize(_frame, name, tags))}"
+    )
+
+
+if __name__ == "__main__":
+    main()
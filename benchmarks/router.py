@@ -0,0 +1,123 @@
+"""
+Manager router microbenchmark.
+
+Routes synthetic Findings through Manager's router the way Adapters do, so
+every Finding is rejected, and compares it with the former provenance check
+that called inspect.stack() for every Finding. Former check is timed on a
+smaller sample and extrapolated, since it is orders of magnitude slower.
+
+Usage:
+    python benchmarks/router.py [--findings 1000000] [--legacy 2000]
+"""
+
+import argparse
+import inspect
+from timeit import default_timer
+from types import SimpleNamespace
+
+from loguru import logger
+from tornado import ioloop
+
+from illuminate.manager import Manager
+from illuminate.observer import Finding
+
+SETTINGS = SimpleNamespace(
+    CONCURRENCY={"adapters": 1, "exporters": 1, "observations": 1},
+    OBSERVATION_CONFIGURATION={"throttle": {"burst": 1, "rate": 0}},
+)
+
+
+class FindingBenchmark(Finding):
+    """Synthetic Finding."""
+
+
+def provide_manager() -> Manager:
+    """
+    Creates Manager without project files.
+
+    :return: Manager object
+    """
+    return Manager(
+        adapters=[],
+        name="benchmark",
+        observers=[],
+        path=".",
+        sessions={},
+        settings=SETTINGS,
+    )
+
+
+async def legacy_router(item: Finding) -> None:
+    """
+    Former provenance check performed by router for each Finding.
+
+    :param item: Finding object
+    :return: None
+    """
+    if inspect.stack()[1][3] != "__adaptation":
+        return
+
+
+async def legacy(findings: list[Finding]) -> float:
+    """
+    Routes Findings with former provenance check.
+
+    :param findings: Finding objects
+    :return: Elapsed seconds
+    """
+
+    async def __adaptation() -> None:
+        for finding in findings:
+            await legacy_router(finding)
+
+    start = default_timer()
+    await __adaptation()
+    return default_timer() - start
+
+
+async def current(findings: list[Finding]) -> float:
+    """
+    Routes Findings through Manager's router as yielded by Adapter.
+
+    :param findings: Finding objects
+    :return: Elapsed seconds
+    """
+    router = provide_manager()._Manager__router  # type: ignore
+    start = default_timer()
+    for finding in findings:
+        await router(finding, "adaptation")
+    return default_timer() - start
+
+
+def main() -> None:
+    """
+    Runs benchmark and prints results.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--findings", default=1_000_000, type=int)
+    parser.add_argument("--legacy", default=2_000, type=int)
+    args = parser.parse_args()
+    logger.remove()
+
+    findings = [FindingBenchmark() for _ in range(args.findings)]
+    loop = ioloop.IOLoop.current()
+    elapsed = loop.run_sync(lambda: current(findings))
+    sample = loop.run_sync(lambda: legacy(findings[: args.legacy]))
+    estimate = sample / args.legacy * args.findings
+
+    print(f"Findings routed: {args.findings}")
+    print(
+        f"inspect.stack() (estimated from {args.legacy}): "
+        f"{estimate:.2f}s, {args.findings / estimate:,.0f} findings/s"
+    )
+    print(
+        f"stage tag: {elapsed:.2f}s, "
+        f"{args.findings / elapsed:,.0f} findings/s"
+    )
+    print(f"Speedup: {estimate / elapsed:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
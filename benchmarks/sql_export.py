@@ -0,0 +1,117 @@
+"""
+SQL exportation benchmark.
+
+Writes the same number of rows to a temporary SQLite database with
+SQLExporter (ORM unit of work), SQLBulkExporter fed with models and
+SQLBulkExporter fed with dictionaries, and compares elapsed time. SQLite is
+used since it needs no server, executemany gains are larger on Postgres and
+Mysql where each statement is a network round trip.
+
+Usage:
+    python benchmarks/sql_export.py [--rows 10000 100000 1000000]
+"""
+
+import argparse
+import os
+import tempfile
+from timeit import default_timer
+from typing import Callable
+
+from loguru import logger
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from tornado import ioloop
+
+from illuminate.exporter import SQLBulkExporter, SQLExporter
+
+Base = declarative_base()
+
+
+class ModelBenchmark(Base):  # type: ignore
+    """Synthetic model."""
+
+    __tablename__ = "benchmark"
+    id = Column(Integer, primary_key=True)
+    load_time = Column(Float)
+    title = Column(String)
+    url = Column(String)
+
+
+def models(rows: int) -> list[ModelBenchmark]:
+    """
+    Creates model objects.
+
+    :param rows: Number of rows
+    :return: ModelBenchmark objects
+    """
+    return [
+        ModelBenchmark(load_time=float(i), title=f"{i}", url=f"/{i}")
+        for i in range(rows)
+    ]
+
+
+def dictionaries(rows: int) -> list[dict]:
+    """
+    Creates dictionaries.
+
+    :param rows: Number of rows
+    :return: Dictionaries
+    """
+    return [
+        {"load_time": float(i), "title": f"{i}", "url": f"/{i}"}
+        for i in range(rows)
+    ]
+
+
+async def run(rows: int, provide: Callable) -> float:
+    """
+    Exports rows to a fresh database with exporter provided.
+
+    :param rows: Number of rows
+    :param provide: Function that returns exporter object for rows
+    :return: Elapsed seconds, including objects creation
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.db")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session = async_sessionmaker(engine, expire_on_commit=False)
+        start = default_timer()
+        await provide(rows).export(session)
+        elapsed = default_timer() - start
+        await engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    """
+    Runs benchmark and prints results.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows", default=[10_000, 100_000, 1_000_000], nargs="+", type=int
+    )
+    args = parser.parse_args()
+    logger.remove()
+
+    exporters = {
+        "SQLExporter (models)": lambda n: SQLExporter(models(n)),
+        "SQLBulkExporter (models)": lambda n: SQLBulkExporter(models(n)),
+        "SQLBulkExporter (dictionaries)": lambda n: SQLBulkExporter(
+            dictionaries(n), table=ModelBenchmark
+        ),
+    }
+    loop = ioloop.IOLoop.current()
+    for rows in args.rows:
+        print(f"Rows: {rows}")
+        for name, provide in exporters.items():
+            elapsed = loop.run_sync(lambda: run(rows, provide))
+            print(f"  {name}: {elapsed:.2f}s, {rows / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,20 @@ class Adapter(IAdapter):
     adapt must be implemented in a child class.
     """
 
+    concurrency: int = 0
+    """
+    Maximum number of Finding objects Adapter object adapts at the same time,
+    across all adapt workers. Zero means no limit.
+    """
+
+    concurrent: bool = False
+    """
+    If True, Adapter drains adapt method concurrently with other concurrent
+    Adapters subscribed to the same Finding. Adapters that are not concurrent
+    run in sequence, in priority order, and wait for concurrent Adapters with
+    higher priority to finish.
+    """
+
     priority: int
     """
     Place in Adapter list. If two Adapters have the same Finding in subscriber
@@ -41,6 +55,15 @@ class Adapter(IAdapter):
         """
         self.manager = manager
 
+    @property
+    def batched(self) -> bool:
+        """
+        Checks if Adapter implements adapt_batch method.
+
+        :return: bool
+        """
+        return type(self).adapt_batch is not Adapter.adapt_batch
+
     async def adapt(
         self, finding: Finding, *args, **kwargs
     ) -> AsyncGenerator[Union[Exporter, Observation], None]:
@@ -60,3 +83,26 @@ class Adapter(IAdapter):
         raise BasicAdapterException(
             "Method adapt must be implemented in child class"
         )
+
+    async def adapt_batch(
+        self, findings: list[Finding], *args, **kwargs
+    ) -> AsyncGenerator[Union[Exporter, Observation], None]:
+        """
+        Generates Exporter and Observation objects from a batch of Finding
+        objects of the same class. Optional, if implemented in a child class,
+        Manager calls it instead of method adapt.
+
+        Findings are collected by Manager until batch size is reached or batch
+        interval passes, as configured in settings.py. It is meant to be a
+        scope where I/O and computation are shared by the whole batch, like a
+        single database lookup or a vectorized transformation. Since batch is
+        adapted after the rest of subscribed Adapters, batched Adapter must
+        have the lowest priority among them.
+
+        :param findings: List of Finding objects of the same class
+        :return: Async Exporter and Observation object generator
+        :raises BasicAdapterException:
+        """
+        raise BasicAdapterException(
+            "Method adapt_batch must be implemented in child class"
+        )
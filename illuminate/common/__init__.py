@@ -1,5 +1,7 @@
+from .project_definitions import SUPPORTED_HTTP_CLIENTS
 from .project_definitions import SUPPORTED_NOSQL_DATABASES
 from .project_definitions import SUPPORTED_SQL_DATABASES
+from .project_definitions import SUPPORTED_VISITED
 from .project_logging import LOGGING_LEVELS
 from .project_logging import LOGO
 from .project_logging import LOGO_COLOR
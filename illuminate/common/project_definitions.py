@@ -1,2 +1,11 @@
+SUPPORTED_HTTP_CLIENTS = {
+    "curl": "tornado.curl_httpclient.CurlAsyncHTTPClient",
+    "simple": "tornado.simple_httpclient.SimpleAsyncHTTPClient",
+}
 SUPPORTED_NOSQL_DATABASES = ("influxdb",)
 SUPPORTED_SQL_DATABASES = ("mysql", "postgresql")
+SUPPORTED_VISITED = {
+    "bloom": "illuminate.manager.visited.BloomVisited",
+    "compact": "illuminate.manager.visited.CompactVisited",
+    "set": "illuminate.manager.visited.SetVisited",
+}
@@ -313,6 +313,11 @@ _ILLUMINATE_SETTINGS = """
 This file represents project {name}'s settings. It will be imported by a
 framework and used to configure run. The sections are as following:
 
+* ADAPTATION_CONFIGURATION
+Adaptation configuration. Findings passed to Adapters implementing adapt_batch
+method are collected in batches per Finding class. Batch is adapted once it
+holds size Findings or once interval seconds pass, whichever comes first.
+
 * CONCURRENCY
 Number of workers per queue type. I/O heavy queues can have more workers
 assigned to them to exploit longer wait times.
@@ -321,6 +326,22 @@ assigned to them to exploit longer wait times.
 Database related data used by SQLAlchemy to acquire sessions. Sessions are
 obtained at the start of the ETL process and can be accessed by instantiating
 Manager class and access sessions attribute.
+Engine section of SQL database is passed to SQLAlchemy's create_async_engine.
+It sets connection pool size and overflow, connection checks before use and
+recycling, and sizes of SQLAlchemy's compiled query cache and asyncpg's
+prepared statement cache. Engines are disposed at the end of the ETL process.
+
+* EXPORTATION_CONFIGURATION
+Exportation configuration. If InfluxDB batch is set, points of
+InfluxDBExporters with the same name are written in a single request once size
+points or limit bytes are collected, or once interval seconds pass, whichever
+comes first. If InfluxDB gzip is set to compression level, batches are
+compressed and posted with InfluxDB client's HTTP session, or written
+uncompressed if client does not provide it. If SQL batch is set, SQLExporters
+with the same name are exported in a single transaction once size of them is
+collected or once interval seconds pass, whichever comes first. Each
+SQLExporter is written within its own savepoint, so a failed one does not
+affect the others.
 
 * MODELS
 List of SQLAlchemy models affected by illuminate cli when invoking
@@ -331,13 +352,56 @@ Project name.
 
 * OBSERVATION_CONFIGURATION
 General and Observation type specific configuration. Type specific
-configuration is used if Observation is not specifying its own.
+configuration is used if Observation is not specifying its own. If
+canonicalizer is enabled, HTTP Observations are deduplicated by canonical form
+of their URL, while the URL itself is requested unchanged: scheme and host are
+lowercased, default ports and fragments are removed, query parameters matching
+tracking patterns are removed and the rest are sorted, and trailing slash is
+removed if strip_trailing_slash is set. Client section selects Tornado's HTTP
+client implementation (simple or curl) and its limits.
+Implementation curl requires pycurl, keeps connections alive between requests
+and ignores limits other than max_clients. Number of concurrent HTTP requests
+is the lower of max_clients and observations concurrency. Throttle section
+limits the rate of HTTP requests per host, allowing burst requests without
+waiting. If autothrottle is enabled, rate
+and concurrency per host follow host's latency and error rate, within given
+limits. Watermarks is a path to SQLite database, relative to project path,
+where incremental SQL observations keep marks of rows already read, once they
+are adapted and exported without failures. Visited section selects how
+fingerprints of routed Observations are kept to skip duplicates, and of
+observed and not observed ones to count them: set is exact, compact is exact
+and keeps 8 bytes per fingerprint in sorted blocks, merging hot set of size
+fingerprints into them, and bloom keeps a fixed Bloom filter for capacity
+fingerprints, skipping new Observations at error rate.
+
+* QUEUE_CONFIGURATION
+Queue configuration. Maxsize limits the number of objects waiting in queue
+per worker type, so producers wait for consumers once queue is full. Queues
+are unbounded if maxsize is 0. Observations yielded by Adapters, or by the
+last observation worker that is not waiting, are admitted even if queue is
+full, since observation workers wait for Adapters and for each other. If
+process RSS is above rss bytes, new Observations are admitted only after
+exporters drain export queue. If frontier is set, Observations above threshold
+held in memory are spilled to SQLite database at path and loaded back in order,
+so observe queue can outgrow memory. Spilled Observations count towards
+maxsize, so threshold must be below maxsize of observations, otherwise only
+Observations admitted above full queue are spilled. Observations are spilled as
+JSON, so only those with JSON serializable attributes and callbacks that are
+methods of Observers or module level functions are spilled, others are kept in
+memory.
 \"\"\"
 
 import os
 
 from illuminate import __version__
 
+ADAPTATION_CONFIGURATION = {{
+    "batch": {{
+        "interval": 0.5,
+        "size": 100,
+    }},
+}}
+
 CONCURRENCY = {{
     "adapters": 2,
     "exporters": 8,
@@ -346,6 +410,14 @@ CONCURRENCY = {{
 
 DB = {{
     "main": {{
+        "engine": {{
+            "connect_args": {{"prepared_statement_cache_size": 100}},
+            "max_overflow": 10,
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+            "pool_size": 5,
+            "query_cache_size": 500,
+        }},
         "host": "localhost",
         "name": "{name}",
         "pass": os.environ.get("ILLUMINATE_MAIN_DB_PASSWORD"),
@@ -363,6 +435,23 @@ DB = {{
     }},
 }}
 
+EXPORTATION_CONFIGURATION = {{
+    "influxdb": {{
+        "batch": {{
+            "interval": 0.5,
+            "limit": 5242880,
+            "size": 5000,
+        }},
+        "gzip": None,
+    }},
+    "sql": {{
+        "batch": {{
+            "interval": 0.5,
+            "size": 100,
+        }},
+    }},
+}}
+
 MODELS = [
     "models.example.ModelExample",
 ]
@@ -370,7 +459,17 @@ MODELS = [
 NAME = "{name}"
 
 OBSERVATION_CONFIGURATION = {{
-    "delay": 0.1,
+    "canonicalizer": {{
+        "enabled": False,
+        "strip_trailing_slash": False,
+        "tracking": ["fbclid", "gclid", "utm_*"],
+    }},
+    "client": {{
+        "implementation": "simple",
+        "max_body_size": 104857600,
+        "max_buffer_size": 104857600,
+        "max_clients": 10,
+    }},
     "http": {{
         "auth_username": None,
         "auth_password": None,
@@ -390,7 +489,39 @@ OBSERVATION_CONFIGURATION = {{
         "protocol": "http",
         "render": "html",
         "timeout": 30,
-    }}
+    }},
+    "throttle": {{
+        "autothrottle": {{
+            "concurrency": 8,
+            "enabled": False,
+            "errors": 0.1,
+            "latency": 1.0,
+            "max_rate": 100.0,
+            "min_rate": 0.5,
+        }},
+        "burst": 1,
+        "rate": 10.0,
+    }},
+    "visited": {{
+        "capacity": 10000000,
+        "error_rate": 0.001,
+        "implementation": "set",
+        "size": 65536,
+    }},
+    "watermarks": "watermarks.db",
+}}
+
+QUEUE_CONFIGURATION = {{
+    "frontier": {{
+        "path": "frontier.db",
+        "threshold": 1000,
+    }},
+    "maxsize": {{
+        "adapters": 1000,
+        "exporters": 1000,
+        "observations": 100000,
+    }},
+    "rss": 2147483648,
 }}
 
 """
@@ -70,7 +70,7 @@ def show_info(func: Callable) -> Callable:
             f"<yellow>Unsuccessful</yellow> observations: "
             f"<magenta>{len(self.not_observed)}</magenta>"
         )
-        logger.debug(f"Unsuccessful attempts {self.not_observed}")
+        logger.debug(f"Unsuccessful attempts {list(self.unsuccessful)}")
         logger.opt(colors=True).info(
             f"<yellow>Successful</yellow> observations: "
             f"<magenta>{len(self.observed) - len(self.not_observed)}</magenta>"
@@ -1,4 +1,8 @@
 from .exporter import Exporter
 
+from .lineprotocol import LineProtocol
 from .influxdb import InfluxDBExporter
+from .sql import SQLBulkExporter
 from .sql import SQLExporter
+from .sql import SQLUpsertExporter
+from .postgres import PostgresCopyExporter
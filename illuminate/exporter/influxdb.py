@@ -8,6 +8,7 @@ from pandas import DataFrame  # type: ignore
 
 from illuminate.exceptions import BasicExporterException
 from illuminate.exporter import Exporter
+from illuminate.exporter.lineprotocol import LineProtocol
 
 
 class InfluxDBExporter(Exporter):
@@ -19,8 +20,12 @@ class InfluxDBExporter(Exporter):
     single database. Attribute name is used to acquire database session object
     from Manager's sessions attribute.
 
-    Constructor kwargs will be passed to client write method. For more
-    information on write method, visit:
+    Points are encoded to line protocol with LineProtocol class, which
+    encodes DataFrames and lists of homogeneous dictionaries column by column.
+    Constructor kwargs will be passed to client write method. If InfluxDB
+    export batching is configured, Manager serializes points of
+    InfluxDBExporters with the same name and destination and writes them
+    together. For more information on write method, visit:
     https://aioinflux.readthedocs.io/en/stable/api.html
 
     Supported write data objects:
@@ -55,6 +60,32 @@ class InfluxDBExporter(Exporter):
         self.params = kwargs
         self.points = points
 
+    def destination(self) -> dict:
+        """
+        Provides write parameters that select where points are written to.
+
+        :return: Dictionary of db, precision and rp parameters
+        """
+        return {
+            key: value
+            for key, value in self.params.items()
+            if key in ("db", "precision", "rp")
+        }
+
+    def serialize(self) -> bytes:
+        """
+        Serializes points to InfluxDB line protocol with write parameters
+        other than destination ones, such as measurement and extra tags.
+
+        :return: Line protocol bytes
+        """
+        params = {
+            key: value
+            for key, value in self.params.items()
+            if key not in ("db", "precision", "rp")
+        }
+        return LineProtocol.serialize(self.points, **params)
+
     async def export(self, session: InfluxDBClient, *args, **kwargs) -> None:
         """
         Writes data to Influxdb asynchronously.
@@ -64,7 +95,7 @@ class InfluxDBExporter(Exporter):
         :raises BasicExporterException:
         """
         try:
-            await session.write(self.points, **self.params)
+            await session.write(self.serialize(), **self.destination())
         except Exception as exception:
             logger.warning(
                 f'{self}.export(session="{session}") -> {exception}'
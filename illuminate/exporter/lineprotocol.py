@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import gzip
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd  # type: ignore
+from aioinflux import InfluxDBClient  # type: ignore
+from aioinflux import serialization  # type: ignore
+from aioinflux.client import InfluxDBWriteError  # type: ignore
+from loguru import logger
+from pandas.api.types import is_bool_dtype  # type: ignore
+from pandas.api.types import is_float_dtype
+from pandas.api.types import is_integer_dtype
+
+KEY_ESCAPE = str.maketrans(
+    {"\\": "\\\\", ",": "\\,", " ": "\\ ", "=": "\\=", "\n": ""}
+)
+MEASUREMENT_ESCAPE = str.maketrans(
+    {"\\": "\\\\", ",": "\\,", " ": "\\ ", "\n": ""}
+)
+STRING_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": ""})
+
+
+class LineProtocol:
+    """
+    LineProtocol class, encodes points to InfluxDB line protocol with NumPy
+    string operations and writes them to InfluxDB.
+
+    DataFrames and lists of homogeneous dictionaries (same measurement, tags,
+    fields and presence of time) are encoded column by column instead of
+    point by point. Other supported data objects are passed to aioinflux's
+    serialization. Tags are sorted by key, null tags and fields are omitted,
+    and points without any field are dropped.
+    """
+
+    @staticmethod
+    def serialize(
+        data: Any,
+        measurement: Optional[str] = None,
+        tag_columns: Optional[Iterable[str]] = None,
+        **extra_tags,
+    ) -> bytes:
+        """
+        Encodes data objects supported by InfluxDBExporter to line protocol.
+
+        :param data: DataFrame, dict, str, bytes or an iterable of them
+        :param measurement: Measurement name, required for DataFrames and
+        dictionaries without measurement key
+        :param tag_columns: DataFrame's columns written as tags
+        :param extra_tags: Tags added to every point
+        :return: Line protocol bytes
+        """
+        if isinstance(data, pd.DataFrame):
+            return LineProtocol.frame(
+                data, measurement, tag_columns, **extra_tags
+            )
+        if isinstance(data, dict):
+            return LineProtocol.mappings([data], measurement, **extra_tags)
+        if isinstance(data, (list, tuple)) and data:
+            if all(isinstance(i, dict) for i in data):
+                return LineProtocol.mappings(data, measurement, **extra_tags)
+            if any(isinstance(i, pd.DataFrame) for i in data):
+                return b"\n".join(
+                    LineProtocol.serialize(
+                        i, measurement, tag_columns, **extra_tags
+                    )
+                    for i in data
+                )
+        return serialization.serialize(
+            data, measurement, tag_columns, **extra_tags
+        )
+
+    @staticmethod
+    def frame(
+        frame: pd.DataFrame,
+        measurement: Optional[str],
+        tag_columns: Optional[Iterable[str]] = None,
+        **extra_tags,
+    ) -> bytes:
+        """
+        Encodes DataFrame with DatetimeIndex to line protocol.
+
+        :param frame: DataFrame object
+        :param measurement: Measurement name
+        :param tag_columns: Columns written as tags
+        :param extra_tags: Tags added to every point
+        :return: Line protocol bytes
+        :raises ValueError:
+        """
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            raise ValueError("DataFrame index is not DatetimeIndex")
+        return LineProtocol._encode(
+            frame, measurement, tag_columns, frame.index.asi8, **extra_tags
+        )
+
+    @staticmethod
+    def mappings(
+        points: Iterable[dict], measurement: Optional[str] = None, **extra_tags
+    ) -> bytes:
+        """
+        Encodes dictionaries with measurement, time, tags and fields keys to
+        line protocol. Homogeneous dictionaries are converted to columns and
+        encoded at once, others are encoded one by one.
+
+        :param points: Dictionaries collection
+        :param measurement: Measurement name, if missing in dictionaries
+        :param extra_tags: Tags added to every point
+        :return: Line protocol bytes
+        """
+        points = [i for i in points if i.get("fields")]
+        if not points:
+            return b""
+        if not LineProtocol._homogeneous(points):
+            return b"\n".join(
+                serialization.serialize(i, measurement, **extra_tags)
+                for i in points
+            )
+        first = points[0]
+        tags = list(first.get("tags", {}))
+        columns = {
+            key: pd.array([i["tags"][key] for i in points]) for key in tags
+        }
+        for key in first["fields"]:
+            columns[key] = pd.array([i["fields"][key] for i in points])
+        times = None
+        if first.get("time") is not None:
+            times = pd.to_datetime([i["time"] for i in points], utc=True)
+            times = times.asi8
+        return LineProtocol._encode(
+            pd.DataFrame(columns),
+            first.get("measurement", measurement),
+            tags,
+            times,
+            **extra_tags,
+        )
+
+    @staticmethod
+    def compress(payload: bytes, level: int = 6) -> bytes:
+        """
+        Compresses line protocol payload with gzip.
+
+        :param payload: Line protocol bytes
+        :param level: Compression level, from 1 to 9
+        :return: Compressed bytes
+        """
+        return gzip.compress(payload, compresslevel=level)
+
+    @staticmethod
+    async def write(
+        client: InfluxDBClient,
+        payload: bytes,
+        level: Optional[int] = None,
+        **params,
+    ) -> bool:
+        """
+        Writes line protocol payload with InfluxDBClient, as gzip compressed
+        request body if compression level is passed. Since InfluxDBClient's
+        write method does not compress data, compressed payload is posted with
+        client's HTTP session, or written uncompressed if session is not
+        available.
+
+        :param client: InfluxDBClient object
+        :param payload: Line protocol bytes
+        :param level: Gzip compression level, or None for no compression
+        :param params: Write parameters db, precision and rp
+        :return: True if write is successful
+        :raises InfluxDBWriteError:
+        """
+        if level is not None:
+            written = await LineProtocol._post(
+                client, payload, level, **params
+            )
+            if written is not None:
+                return written
+            logger.warning(
+                "InfluxDBClient HTTP session is not available, "
+                "writing uncompressed"
+            )
+        return await client.write(payload, **params)
+
+    @staticmethod
+    async def _post(
+        client: InfluxDBClient, payload: bytes, level: int, **params
+    ) -> Optional[bool]:
+        """
+        Posts gzip compressed payload with InfluxDBClient's HTTP session.
+        Session and URL template are private attributes of aioinflux's client,
+        so None is returned if installed version does not provide them.
+
+        :param client: InfluxDBClient object
+        :param payload: Line protocol bytes
+        :param level: Gzip compression level
+        :param params: Write parameters db, precision and rp
+        :return: True if write is successful, None if session is not available
+        :raises InfluxDBWriteError:
+        """
+        try:
+            if not client._session:
+                await client.create_session()
+            session = client._session
+            url = client.url.format(endpoint="write")
+        except (AttributeError, KeyError, TypeError):
+            return None
+        params = {key: value for key, value in params.items() if value}
+        params["db"] = params.get("db") or client.db
+        async with session.post(
+            url,
+            data=LineProtocol.compress(payload, level),
+            headers={"Content-Encoding": "gzip"},
+            params=params,
+        ) as response:
+            if response.status == 204:
+                return True
+            raise InfluxDBWriteError(response)
+
+    @staticmethod
+    def _encode(
+        frame: pd.DataFrame,
+        measurement: Optional[str],
+        tag_columns: Optional[Iterable[str]],
+        times: Optional[np.ndarray],
+        **extra_tags,
+    ) -> bytes:
+        """
+        Encodes columns of a DataFrame to line protocol. Columns are encoded
+        to NumPy arrays of strings, which are concatenated element-wise.
+
+        :param frame: DataFrame object
+        :param measurement: Measurement name
+        :param tag_columns: Columns written as tags
+        :param times: Integer timestamps in nanoseconds or None
+        :param extra_tags: Tags added to every point
+        :return: Line protocol bytes
+        :raises ValueError:
+        """
+        if measurement is None:
+            raise ValueError("Missing 'measurement'")
+        size = len(frame)
+        if not size:
+            return b""
+        tag_columns = set(tag_columns or ())
+        tags = {
+            str(key): column
+            for key, column in frame.items()
+            if key in tag_columns
+        }
+        for key, value in extra_tags.items():
+            tags[key] = pd.Series(np.full(size, value, dtype=object))
+
+        lines = np.full(
+            size, measurement.translate(MEASUREMENT_ESCAPE), dtype=object
+        )
+        for key in sorted(tags):
+            values, null = LineProtocol._tag(tags[key])
+            prefix = f",{key.translate(KEY_ESCAPE)}="
+            lines = lines + np.where(null, "", prefix + values)
+
+        fields = np.full(size, "", dtype=object)
+        valid = np.zeros(size, dtype=bool)
+        for key, column in frame.items():
+            if key in tag_columns:
+                continue
+            values, null = LineProtocol._field(column)
+            prefix = np.where(valid, ",", "").astype(object)
+            prefix = prefix + f"{str(key).translate(KEY_ESCAPE)}="
+            fields = fields + np.where(null, "", prefix + values)
+            valid |= ~null
+
+        lines = lines + " " + fields
+        if times is not None:
+            lines = lines + " " + times.astype(str).astype(object)
+        return "\n".join(lines[valid].tolist()).encode()
+
+    @staticmethod
+    def _escape(values: np.ndarray, escape: dict) -> np.ndarray:
+        """
+        Converts values to escaped strings. Values are joined and translated
+        at once, unless separator is found in them.
+
+        :param values: NumPy array
+        :param escape: Translation table of special characters
+        :return: NumPy array of strings
+        """
+        strings = [str(value) for value in values.tolist()]
+        text = "\0".join(strings)
+        if text.count("\0") == len(strings) - 1:
+            strings = text.translate(escape).split("\0")
+        else:
+            strings = [value.translate(escape) for value in strings]
+        return np.array(strings, dtype=object)
+
+    @staticmethod
+    def _field(column: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Encodes field values of a column based on its type.
+
+        :param column: Series object
+        :return: NumPy array of encoded values and null mask
+        """
+        null = column.isna().to_numpy()
+        if is_bool_dtype(column.dtype):
+            values = column.to_numpy(dtype=bool, na_value=False)
+            return np.where(values, "true", "false").astype(object), null
+        if is_integer_dtype(column.dtype):
+            values = column.to_numpy(dtype=np.int64, na_value=0)
+            return values.astype(str).astype(object) + "i", null
+        if is_float_dtype(column.dtype):
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+            null |= ~np.isfinite(values)
+            return values.astype(str).astype(object), null
+        values = column.to_numpy(dtype=object, na_value="")
+        return '"' + LineProtocol._escape(values, STRING_ESCAPE) + '"', null
+
+    @staticmethod
+    def _tag(column: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Encodes tag values of a column.
+
+        :param column: Series object
+        :return: NumPy array of encoded values and null mask
+        """
+        values = column.to_numpy(dtype=object, na_value="")
+        values = LineProtocol._escape(values, KEY_ESCAPE)
+        return values, column.isna().to_numpy() | (values == "")
+
+    @staticmethod
+    def _homogeneous(points: list[dict]) -> bool:
+        """
+        Checks if dictionaries share measurement, tags and fields keys and
+        presence of time.
+
+        :param points: Dictionaries collection
+        :return: True if dictionaries can be encoded as columns
+        """
+        first = points[0]
+        measurement = first.get("measurement")
+        tags = first.get("tags", {}).keys()
+        fields = first["fields"].keys()
+        time = first.get("time") is not None
+        return all(
+            i.get("measurement") == measurement
+            and i.get("tags", {}).keys() == tags
+            and i.get("fields", {}).keys() == fields
+            and (i.get("time") is not None) == time
+            for i in points
+        )
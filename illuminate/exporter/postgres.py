@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Sequence, Type, Union
+
+from pandas import DataFrame  # type: ignore
+from sqlalchemy import Table
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from illuminate.exceptions import BasicExporterException
+from illuminate.exporter.sql import SQLExporter
+
+
+class PostgresCopyExporter(SQLExporter):
+    """
+    PostgresCopyExporter class, writes data to Postgres database with COPY
+    protocol. Inherits SQLExporter class and implements write method.
+
+    Rows are streamed through asyncpg's copy_records_to_table on the
+    connection of the session's transaction, so no ORM object or INSERT
+    statement is built per row. Like SQLExporter, attribute name is used to
+    acquire database session object from Manager's sessions attribute and
+    export can be batched with other SQLExporters of the same name.
+
+    Supported rows objects:
+        - Iterable of tuples in columns order
+        - Iterable of dictionaries, keyed by columns
+        - DataFrame, with columns named after table columns
+
+    Supported dialects:
+        - Postgres
+    """
+
+    def __init__(
+        self,
+        rows: Union[DataFrame, Iterable[Union[dict, Sequence]]],
+        table: Union[str, Table, Type[Any]],
+        columns: Optional[Sequence[str]] = None,
+        schema: Optional[str] = None,
+    ):
+        """
+        PostgresCopyExporter's __init__ method.
+
+        :param rows: DataFrame, tuples or dictionaries collection
+        :param table: Table name, SQLAlchemy table or model class
+        :param columns: Columns names, taken from DataFrame or first
+        dictionary if not passed, all table columns are used for tuples
+        :param schema: Schema name, taken from table object if not passed
+        """
+        super().__init__(models=[])
+        self.columns = list(columns) if columns else None
+        self.rows = rows
+        self.schema = schema
+        self.table = table
+
+    def records(self) -> tuple[Optional[list[str]], list[tuple]]:
+        """
+        Turns rows into columns names and records. DataFrame's values are
+        converted to Python objects, with whole float columns converted to
+        integers and missing values, like NaN and NaT, to None, so they are
+        copied as NULL.
+
+        :return: Columns names and list of tuples
+        """
+        if isinstance(self.rows, DataFrame):
+            columns = self.columns or [str(i) for i in self.rows.columns]
+            frame = self.rows[columns].convert_dtypes()
+            frame = frame.astype(object).where(frame.notna(), None)
+            return columns, list(frame.itertuples(index=False, name=None))
+        rows = list(self.rows)
+        columns = self.columns
+        if rows and isinstance(rows[0], dict):
+            columns = columns or list(rows[0])
+            return columns, [tuple(row[c] for c in columns) for row in rows]
+        return columns, [tuple(row) for row in rows]
+
+    def target(self) -> tuple[str, Optional[str]]:
+        """
+        Provides table and schema names.
+
+        :return: Table name and schema name
+        """
+        if isinstance(self.table, str):
+            return self.table, self.schema
+        table = self.table
+        if not isinstance(table, Table):
+            table = inspect(table).local_table
+        return table.name, self.schema or table.schema
+
+    async def write(self, session: AsyncSession, *args, **kwargs) -> None:
+        """
+        Copies records within transaction already opened on session.
+
+        :param session: AsyncSession object with open transaction
+        :return: None
+        :raises BasicExporterException:
+        """
+        connection = await session.connection()
+        if connection.dialect.name != "postgresql":
+            raise BasicExporterException(
+                f"COPY is not supported by {connection.dialect.name} dialect"
+            )
+        columns, records = self.records()
+        if not records:
+            return
+        table, schema = self.target()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(  # type: ignore
+            table, records=records, columns=columns, schema_name=schema
+        )
+
+    def __repr__(self):
+        """
+        PostgresCopyExporter's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return (
+            f"PostgresCopyExporter(table={self.target()[0]},"
+            f"columns={self.columns})"
+        )
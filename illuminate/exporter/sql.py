@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from typing import Type, TypeVar, Union
+from typing import Any, Optional, Type, TypeVar, Union
 
 from loguru import logger
+from sqlalchemy import Table
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from illuminate.exceptions import BasicExporterException
@@ -18,7 +24,9 @@ class SQLExporter(Exporter):
 
     Each SQLExporter object is responsible for a single transaction with a
     single database. Attribute name is used to acquire database session object
-    from Manager's sessions attribute.
+    from Manager's sessions attribute. If export batching is configured,
+    Manager writes SQLExporter objects with the same name in a single
+    transaction, each within its own savepoint.
 
     Supported dialects:
         - Mysql
@@ -50,17 +58,28 @@ class SQLExporter(Exporter):
         :raises BasicExporterException:
         """
         async with session() as session:  # type: ignore
-            async with session.begin():  # type: ignore
-                session.add_all(self.models)  # type: ignore
-                try:
-                    await session.commit()  # type: ignore
-                except Exception as exception:
-                    logger.warning(
-                        f'{self}.export(session="{session}") -> {exception}'
-                    )
-                    raise BasicExporterException
+            try:
+                async with session.begin():  # type: ignore
+                    await self.write(session)  # type: ignore
+            except Exception as exception:
+                logger.warning(
+                    f'{self}.export(session="{session}") -> {exception}'
+                )
+                raise BasicExporterException
         logger.success(f'{self}.export(session="{session}")')
 
+    async def write(self, session: AsyncSession, *args, **kwargs) -> None:
+        """
+        Writes data within transaction already opened on session. Used by
+        export method and by Manager when it exports multiple SQLExporter
+        objects in a single transaction.
+
+        :param session: AsyncSession object with open transaction
+        :return: None
+        """
+        session.add_all(self.models)
+        await session.flush()
+
     def __repr__(self):
         """
         SQLExporter's __repr__ method.
@@ -68,3 +87,224 @@ class SQLExporter(Exporter):
         :return: String representation of an instance
         """
         return f"SQLExporter(models={self.models})"
+
+
+class SQLBulkExporter(SQLExporter):
+    """
+    SQLBulkExporter class, writes data to SQL database asynchronously with
+    SQLAlchemy Core. Inherits SQLExporter class and implements write method.
+
+    Instead of passing models through ORM's unit of work, models and
+    dictionaries are turned into rows and written with a single executemany
+    per table and set of columns. It uses asyncpg's and asyncmy's executemany,
+    so it is meant for large number of rows that are never read back. Models'
+    attributes that are not set are left to column defaults.
+
+    Supported dialects:
+        - Mysql
+        - Postgres
+    """
+
+    def __init__(
+        self,
+        models: Union[list[Union[M, dict]], tuple[Union[M, dict]]],
+        table: Optional[Union[Table, Type[M]]] = None,
+    ):
+        """
+        SQLBulkExporter's __init__ method.
+
+        :param models: SQLAlchemy model objects or dictionaries collection
+        :param table: SQLAlchemy table or model class, required when
+        dictionaries are passed
+        """
+        super().__init__(models)
+        self.table = table
+
+    def rows(self) -> dict[tuple[Table, tuple[str, ...]], list[dict]]:
+        """
+        Groups rows by table and set of columns.
+
+        :return: Dictionary of rows lists per table and columns
+        :raises BasicExporterException:
+        """
+        rows: dict[tuple[Table, tuple[str, ...]], list[dict]] = {}
+        for model in self.models:
+            if isinstance(model, dict):
+                if self.table is None:
+                    raise BasicExporterException(
+                        "Attribute table is required to export dictionaries"
+                    )
+                table, row = self._table(self.table), model
+            else:
+                table, row = self._row(model)
+            rows.setdefault((table, tuple(row)), []).append(row)
+        return rows
+
+    async def write(self, session: AsyncSession, *args, **kwargs) -> None:
+        """
+        Writes rows with one executemany per table and set of columns, within
+        transaction already opened on session.
+
+        :param session: AsyncSession object with open transaction
+        :return: None
+        """
+        connection = await session.connection()
+        for (table, _), rows in self.rows().items():
+            await connection.execute(insert(table), rows)
+
+    @staticmethod
+    def _row(model: Any) -> tuple[Table, dict]:
+        """
+        Turns model object into its table and row of set attributes.
+
+        :param model: SQLAlchemy model object
+        :return: Table and row dictionary
+        """
+        state = inspect(model)
+        row = {
+            prop.columns[0].key: state.dict[prop.key]
+            for prop in state.mapper.column_attrs
+            if prop.key in state.dict
+        }
+        return state.mapper.local_table, row
+
+    @staticmethod
+    def _table(table: Union[Table, Type[Any]]) -> Table:
+        """
+        Provides Table object of a table or model class.
+
+        :param table: SQLAlchemy table or model class
+        :return: Table object
+        """
+        if isinstance(table, Table):
+            return table
+        return inspect(table).local_table
+
+    def __repr__(self):
+        """
+        SQLBulkExporter's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return f"SQLBulkExporter(models={len(self.models)},table={self.table})"
+
+
+class SQLUpsertExporter(SQLBulkExporter):
+    """
+    SQLUpsertExporter class, inserts or updates data in SQL database
+    asynchronously. Inherits SQLBulkExporter class and implements write
+    method.
+
+    Rows are written with a single executemany per table and set of columns,
+    as INSERT ... ON CONFLICT DO UPDATE on Postgres and SQLite, or INSERT ...
+    ON DUPLICATE KEY UPDATE on Mysql. Rows are matched on keys columns, which
+    must be covered by a primary key or unique constraint. If the same keys
+    appear more than once, the last row is written. Rows that already exist
+    are updated with update columns, all columns other than keys by default,
+    or left intact if there are none.
+
+    Supported dialects:
+        - Mysql
+        - Postgres
+        - SQLite
+    """
+
+    def __init__(
+        self,
+        models: Union[list[Union[M, dict]], tuple[Union[M, dict]]],
+        keys: Union[list[str], tuple[str, ...]],
+        table: Optional[Union[Table, Type[M]]] = None,
+        update: Optional[Union[list[str], tuple[str, ...]]] = None,
+    ):
+        """
+        SQLUpsertExporter's __init__ method.
+
+        :param models: SQLAlchemy model objects or dictionaries collection
+        :param keys: Columns names of a primary key or unique constraint
+        :param table: SQLAlchemy table or model class, required when
+        dictionaries are passed
+        :param update: Columns names to update on conflict
+        """
+        super().__init__(models, table)
+        self.keys = tuple(keys)
+        self.update = tuple(update) if update is not None else None
+
+    def rows(self) -> dict[tuple[Table, tuple[str, ...]], list[dict]]:
+        """
+        Groups rows by table and set of columns, keeping the last row with
+        the same keys.
+
+        :return: Dictionary of rows lists per table and columns
+        :raises BasicExporterException:
+        """
+        rows = super().rows()
+        for group, _rows in rows.items():
+            if not set(self.keys).issubset(group[1]):
+                raise BasicExporterException(
+                    f"Rows of table {group[0].name} are missing keys "
+                    f"{self.keys}"
+                )
+            unique = {
+                tuple(row[key] for key in self.keys): row for row in _rows
+            }
+            rows[group] = list(unique.values())
+        return rows
+
+    def statement(self, table: Table, columns: tuple[str, ...], dialect: str):
+        """
+        Provides dialect specific upsert statement.
+
+        :param table: Table object
+        :param columns: Columns names of rows
+        :param dialect: Dialect name
+        :return: Insert object
+        :raises BasicExporterException:
+        """
+        update = [
+            column
+            for column in (self.update if self.update is not None else columns)
+            if column in columns and column not in self.keys
+        ]
+        if dialect == "mysql":
+            statement = mysql.insert(table)
+            if not update:
+                update = list(self.keys)
+            return statement.on_duplicate_key_update(
+                {column: statement.inserted[column] for column in update}
+            )
+        if dialect in ("postgresql", "sqlite"):
+            module = postgresql if dialect == "postgresql" else sqlite
+            statement = module.insert(table)
+            if not update:
+                return statement.on_conflict_do_nothing(
+                    index_elements=self.keys
+                )
+            return statement.on_conflict_do_update(
+                index_elements=self.keys,
+                set_={column: statement.excluded[column] for column in update},
+            )
+        raise BasicExporterException(
+            f"Upsert is not supported by {dialect} dialect"
+        )
+
+    async def write(self, session: AsyncSession, *args, **kwargs) -> None:
+        """
+        Upserts rows with one executemany per table and set of columns,
+        within transaction already opened on session.
+
+        :param session: AsyncSession object with open transaction
+        :return: None
+        :raises BasicExporterException:
+        """
+        connection = await session.connection()
+        for (table, columns), rows in self.rows().items():
+            statement = self.statement(table, columns, connection.dialect.name)
+            await connection.execute(statement, rows)
+
+    def __repr__(self):
+        """
+        SQLUpsertExporter's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return f"SQLUpsertExporter(models={len(self.models)},keys={self.keys})"
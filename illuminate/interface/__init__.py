@@ -5,3 +5,4 @@ from .finding import IFinding
 from .manager import IManager
 from .observation import IObservation
 from .observer import IObserver
+from .visited import IVisited
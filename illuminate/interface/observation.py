@@ -1,6 +1,14 @@
 class IObservation:
     """Interface for Observation class."""
 
+    def fingerprint(self):
+        """Provides deterministic fingerprint of Observation."""
+        raise NotImplementedError
+
+    def identity(self):
+        """Provides string that identifies data Observation reads."""
+        raise NotImplementedError
+
     async def observe(self, *args, **kwargs):
         """Reads data from the source."""
         raise NotImplementedError
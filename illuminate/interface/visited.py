@@ -0,0 +1,14 @@
+class IVisited:
+    """Interface for Visited classes."""
+
+    def __contains__(self, key):
+        """Checks if fingerprint was added."""
+        raise NotImplementedError
+
+    def __len__(self):
+        """Number of added fingerprints."""
+        raise NotImplementedError
+
+    def add(self, key):
+        """Adds fingerprint and tells if it was not added before."""
+        raise NotImplementedError
@@ -1,2 +1,15 @@
+from .admission import AdmissionQueue
+from .admission import Memory
 from .assistant import Assistant
+from .batch import Batch
+from .canonicalizer import Canonicalizer
+from .frontier import Frontier
+from .throttle import AutoThrottle
+from .throttle import Host
+from .throttle import Throttle
+from .throttle import TokenBucket
+from .visited import BloomVisited
+from .visited import CompactVisited
+from .visited import SetVisited
+from .watermarks import Watermarks
 from .manager import Manager
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Optional
+
+from tornado import queues
+
+
+class AdmissionQueue(queues.Queue):
+    """
+    AdmissionQueue class, Tornado's queue that can admit an item even if it
+    is full.
+
+    Producers awaiting put wait while queue holds maxsize items, but forced
+    items are put without waiting. Manager forces items whose producers
+    would otherwise wait for consumers that wait for them.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        AdmissionQueue's __init__ method.
+
+        :param maxsize: Maximum number of items, unbounded if 0
+        """
+        super().__init__(maxsize)
+        self._forced = False
+
+    def force(self, item: Any) -> None:
+        """
+        Puts item into queue without waiting, even if queue is full.
+
+        :param item: Any object
+        :return: None
+        """
+        self._forced = True
+        try:
+            self.put_nowait(item)
+        finally:
+            self._forced = False
+
+    def full(self) -> bool:
+        """
+        Checks if queue holds maxsize items, unless item is being forced.
+
+        :return: True if queue is full
+        """
+        return not self._forced and super().full()
+
+
+class Memory:
+    """
+    Memory class, compares resident set size (RSS) of the process with a
+    high-water mark.
+
+    RSS is read from /proc/self/statm, so the mark is never exceeded on
+    platforms without procfs.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        """
+        Memory's __init__ method.
+
+        :param limit: High-water mark in bytes, disabled if None
+        """
+        self.limit = limit
+
+    def exceeded(self) -> bool:
+        """
+        Checks if RSS is above high-water mark.
+
+        :return: True if RSS is above high-water mark
+        """
+        return bool(self.limit) and self.rss() > self.limit  # type: ignore
+
+    @staticmethod
+    def rss() -> int:
+        """
+        Provides resident set size of the process.
+
+        :return: RSS in bytes, 0 if it is not available
+        """
+        try:
+            with open("/proc/self/statm", "rb") as file:
+                pages = int(file.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return 0
+        return pages * os.sysconf("SC_PAGE_SIZE")
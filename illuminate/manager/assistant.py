@@ -270,6 +270,31 @@ class Assistant(IAssistant):
                 "Framework did not found settings.py in the current directory"
             )
 
+    @staticmethod
+    def __check_pool_size(db: str, settings: ModuleType) -> None:
+        """
+        Warns if connection pool of SQL database allows fewer connections
+        than observations or exporters that can use it concurrently.
+
+        :param db: database name from settings.py module
+        :param settings: settings.py module
+        :return: None
+        """
+        engine = settings.DB[db].get("engine", {})
+        # SQLAlchemy's QueuePool defaults, unlimited overflow is negative
+        overflow = engine.get("max_overflow", 10)
+        if overflow < 0:
+            return
+        size = engine.get("pool_size", 5) + overflow
+        concurrency = getattr(settings, "CONCURRENCY", {})
+        for stage in ("observations", "exporters"):
+            if concurrency.get(stage, 0) > size:
+                logger.warning(
+                    f"Database {db} pool allows {size} connections, "
+                    f"{concurrency[stage] - size} {stage} workers will wait "
+                    f"for connection"
+                )
+
     @staticmethod
     def __log_database_connection(db: str, settings: ModuleType) -> None:
         """
@@ -313,15 +338,21 @@ class Assistant(IAssistant):
         db: str, settings: ModuleType
     ) -> sessionmaker[AsyncSession]:
         """
-        Provides SQL database session.
+        Provides SQL database session. Engine section of database settings
+        is passed to create_async_engine, configuring connection pool and
+        statement caches.
 
         :param db: database name from settings.py module
         :param settings: settings.py module
         :return: AsyncSession created with session maker
         """
         Assistant.__log_database_connection(db, settings)
+        Assistant.__check_pool_size(db, settings)
         return sessionmaker(
-            create_async_engine(Assistant._provide_db_url(db, _async=True)),
+            create_async_engine(
+                Assistant._provide_db_url(db, _async=True),
+                **settings.DB[db].get("engine", {}),
+            ),
             class_=AsyncSession,
             expire_on_commit=False,
         )
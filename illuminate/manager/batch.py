@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional
+
+from tornado import ioloop, queues
+
+
+class Batch:
+    """
+    Batch class, collects items taken from a queue and passes them to flush
+    coroutine together.
+
+    Items are flushed once batch holds size items, once weight of held items
+    reaches limit, or once interval passes since the first item was added,
+    whichever comes first. If count function is passed, size is compared with
+    the sum of counts of held items instead of their number. Queue's task_done
+    is called for each item only after it is flushed, so joining the queue
+    waits for batched items too.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list], Awaitable[None]],
+        queue: queues.Queue,
+        size: int,
+        interval: float,
+        limit: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+        count: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Batch's __init__ method.
+
+        :param flush: Async function that receives list of items
+        :param queue: Queue items were taken from
+        :param size: Maximum number of items held
+        :param interval: Maximum number of seconds item is held
+        :param limit: Maximum weight of items held
+        :param weigh: Function that returns weight of an item
+        :param count: Function that returns count of an item towards size
+        """
+        self._flush = flush
+        self.count = count
+        self.counted = 0
+        self._handle: Optional[object] = None
+        self.interval = interval
+        self.items: list = []
+        self.limit = limit
+        self.queue = queue
+        self.size = max(size, 1)
+        self.weigh = weigh
+        self.weight = 0
+
+    async def put(self, item: Any) -> None:
+        """
+        Adds item to batch and flushes batch if it is full.
+
+        :param item: Any object
+        :return: None
+        """
+        self.items.append(item)
+        self.counted += self.count(item) if self.count else 1
+        if self.weigh:
+            self.weight += self.weigh(item)
+        if self.counted >= self.size or (
+            self.limit and self.weight >= self.limit
+        ):
+            await self.flush()
+        elif not self._handle:
+            self._handle = ioloop.IOLoop.current().call_later(
+                self.interval, self.flush
+            )
+
+    async def flush(self) -> None:
+        """
+        Passes held items to flush coroutine and marks them as done in queue.
+
+        :return: None
+        """
+        if self._handle:
+            ioloop.IOLoop.current().remove_timeout(self._handle)
+            self._handle = None
+        items, self.items = self.items, []
+        self.counted, self.weight = 0, 0
+        if not items:
+            return
+        try:
+            await self._flush(items)
+        finally:
+            for _ in items:
+                self.queue.task_done()
+
+    def __len__(self):
+        """
+        Batch's __len__ method.
+
+        :return: Number of held items
+        """
+        return len(self.items)
+
+    def __repr__(self):
+        """
+        Batch's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return f"Batch(size={self.size},interval={self.interval})"
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from typing import Iterable
+from urllib.parse import unquote_plus
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class Canonicalizer:
+    """
+    Canonicalizer class, rewrites HTTP URLs that point to the same resource
+    to the same string, so they are deduplicated before they are requested.
+    Canonical form is only used for deduplication, never requested.
+
+    Scheme and host are lowercased, default ports and fragments are removed,
+    empty path becomes "/", query parameters matching tracking patterns are
+    removed and the rest are sorted by name, keeping their encoding and order
+    of repeated names. Trailing slash of a non-root path is removed if
+    strip_trailing_slash is True. URLs that are not HTTP or cannot be parsed
+    are returned unchanged.
+    """
+
+    def __init__(
+        self,
+        tracking: Iterable[str] = (),
+        strip_trailing_slash: bool = False,
+    ):
+        """
+        Canonicalizer's __init__ method.
+
+        :param tracking: Shell-style patterns of tracking parameter names,
+        like utm_*
+        :param strip_trailing_slash: Remove trailing slash of non-root path
+        """
+        self.strip_trailing_slash = strip_trailing_slash
+        self.tracking = tuple(tracking)
+
+    def canonicalize(self, url: str) -> str:
+        """
+        Provides canonical form of HTTP URL.
+
+        :param url: HTTP URL
+        :return: Canonical URL
+        """
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parts.hostname:
+            return url
+        host = parts.hostname
+        if ":" in host:
+            host = f"[{host}]"
+        if port and port != DEFAULT_PORTS[scheme]:
+            host = f"{host}:{port}"
+        if "@" in parts.netloc:
+            host = f"{parts.netloc.rpartition('@')[0]}@{host}"
+        path = parts.path or "/"
+        if self.strip_trailing_slash and len(path) > 1:
+            path = path.rstrip("/") or "/"
+        return urlunsplit((scheme, host, path, self.query(parts.query), ""))
+
+    def query(self, query: str) -> str:
+        """
+        Removes tracking parameters from query string and sorts the rest by
+        name.
+
+        :param query: Query string
+        :return: Canonical query string
+        """
+        parameters = [i for i in query.split("&") if i]
+        if self.tracking:
+            parameters = [
+                i
+                for i in parameters
+                if not any(
+                    fnmatchcase(unquote_plus(i.partition("=")[0]), pattern)
+                    for pattern in self.tracking
+                )
+            ]
+        parameters.sort(key=lambda x: x.partition("=")[0])
+        return "&".join(parameters)
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import collections
+import json
+import os
+import sqlite3
+from pydoc import locate
+from typing import Any, Optional
+
+from loguru import logger
+
+from illuminate.manager.admission import AdmissionQueue
+from illuminate.observation import Observation
+from illuminate.observer import Observer
+
+
+class Frontier(AdmissionQueue):
+    """
+    Frontier class, observe queue that spills Observations to a local SQLite
+    database once threshold of them is held in memory.
+
+    Once anything is spilled, following Observations are spilled too, and
+    spilled Observations are loaded back threshold at a time, when memory
+    runs empty, so Observations are taken in FIFO order.
+
+    Observations are stored as JSON of their class path and attributes, and
+    their callback by reference, as name of its Observer and name of its
+    method or as path of a module level function, resolved against Manager's
+    Observers when loaded. Observations that cannot be stored that way are
+    kept in memory, and spilled Observations that cannot be loaded back are
+    logged and skipped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        threshold: int,
+        observers: list[Observer],
+        maxsize: int = 0,
+    ):
+        """
+        Frontier's __init__ method.
+
+        :param path: Path to SQLite database file, recreated on first spill
+        :param threshold: Number of Observations held in memory
+        :param observers: Observer objects callbacks are resolved against
+        :param maxsize: Maximum number of Observations, unbounded if 0
+        """
+        self._connection: Optional[sqlite3.Connection] = None
+        self.observers = observers
+        self.path = path
+        self.spilled = 0
+        self.threshold = max(threshold, 1)
+        super().__init__(maxsize)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Provides connection to SQLite database, replacing database left by
+        previous run. Journal is disabled, since spilled Observations are not
+        kept between runs.
+
+        :return: sqlite3.Connection object
+        """
+        if not self._connection:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute("PRAGMA journal_mode = OFF")
+            self._connection.execute("PRAGMA synchronous = OFF")
+            self._connection.execute(
+                "CREATE TABLE frontier "
+                "(id INTEGER PRIMARY KEY, observation TEXT NOT NULL)"
+            )
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Closes connection to SQLite database and removes it.
+
+        :return: None
+        """
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+            os.remove(self.path)
+
+    def dump(self, item: Observation) -> str:
+        """
+        Serializes Observation to JSON with its callback replaced by a
+        reference.
+
+        :param item: Observation object
+        :return: JSON string
+        :raises TypeError: If callback cannot be referenced or attributes are
+        not JSON serializable
+        """
+        state = dict(item.__dict__)
+        callback = state.pop("_callback", None)
+        owner = getattr(callback, "__self__", None)
+        if isinstance(owner, Observer):
+            reference = {"method": callback.__name__, "observer": owner.NAME}
+        elif callable(callback) and "<" not in callback.__qualname__:
+            reference = {
+                "function": f"{callback.__module__}.{callback.__qualname__}"
+            }
+        else:
+            raise TypeError(f"Callback {callback} cannot be referenced")
+        cls = type(item)
+        return json.dumps(
+            {
+                "callback": reference,
+                "state": state,
+                "type": f"{cls.__module__}.{cls.__qualname__}",
+            }
+        )
+
+    def load(self, data: str) -> Optional[Observation]:
+        """
+        Deserializes Observation from JSON and resolves its callback
+        reference.
+
+        :param data: JSON string
+        :return: Observation object or None if its class or callback cannot be
+        resolved
+        """
+        document = json.loads(data)
+        cls = locate(document["type"])
+        if not isinstance(cls, type) or not issubclass(cls, Observation):
+            logger.warning(f"Observation type {document['type']} not found")
+            return None
+        reference = document["callback"]
+        if "observer" in reference:
+            owner = self.observer(reference["observer"])
+            callback = getattr(owner, reference["method"], None)
+        else:
+            callback = locate(reference["function"])
+        if not callable(callback):
+            logger.warning(f"Observation callback {reference} not found")
+            return None
+        item = cls.__new__(cls)
+        item.__dict__.update(document["state"])
+        item._callback = callback
+        return item
+
+    def observer(self, name: str) -> Optional[Observer]:
+        """
+        Provides Observer by name.
+
+        :param name: Observer name
+        :return: Observer object or None if it is not registered
+        """
+        for observer in self.observers:
+            if observer.NAME == name:
+                return observer
+        return None
+
+    def qsize(self) -> int:
+        """
+        Number of Observations in memory and spilled.
+
+        :return: int
+        """
+        return len(self._queue) + self.spilled
+
+    def _get(self) -> Any:
+        """
+        Takes the first Observation from memory, loading spilled ones if
+        memory runs empty.
+
+        :return: Observation object
+        """
+        item = self._queue.popleft()
+        while not self._queue and self.spilled:
+            self._reload()
+        return item
+
+    def _init(self) -> None:
+        """
+        Creates memory part of the queue.
+
+        :return: None
+        """
+        self._queue: collections.deque = collections.deque()
+
+    def _put(self, item: Any) -> None:
+        """
+        Puts Observation in memory, or spills it if threshold is reached or
+        Observations are already spilled. Observations that cannot be
+        serialized are kept in memory.
+
+        :param item: Observation object
+        :return: None
+        """
+        if item is None or (
+            len(self._queue) < self.threshold and not self.spilled
+        ):
+            self._queue.append(item)
+            return
+        try:
+            data = self.dump(item)
+        except Exception as exception:  # noqa
+            logger.debug(f"{item} kept in memory -> {exception}")
+            self._queue.append(item)
+            return
+        self.connection.execute(
+            "INSERT INTO frontier (observation) VALUES (?)", (data,)
+        )
+        self.spilled += 1
+
+    def _reload(self) -> None:
+        """
+        Loads up to threshold of spilled Observations in FIFO order. Rows are
+        deleted once Observations are loaded, and those that cannot be loaded
+        are skipped and marked as done.
+
+        :return: None
+        """
+        rows = self.connection.execute(
+            "SELECT id, observation FROM frontier ORDER BY id LIMIT ?",
+            (self.threshold,),
+        ).fetchall()
+        items = []
+        for _, data in rows:
+            try:
+                item = self.load(data)
+            except Exception as exception:  # noqa
+                logger.warning(f"Observation {data} skipped -> {exception}")
+                item = None
+            if item is None:
+                self.task_done()
+            else:
+                items.append(item)
+        self.connection.execute(
+            "DELETE FROM frontier WHERE id <= ?", (rows[-1][0],)
+        )
+        self.spilled -= len(rows)
+        self._queue.extend(items)
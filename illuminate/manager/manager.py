@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import asyncio
 import inspect
 import json
 import os
 import traceback
+from collections import deque
+from contextvars import ContextVar
+from pydoc import locate
 from types import ModuleType
-from typing import Type, Union
+from typing import Any, Awaitable, Callable, Hashable, Optional, Type, Union
 
 from aioinflux import InfluxDBClient  # type: ignore
 from alembic import command
@@ -15,30 +17,51 @@ from loguru import logger
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from tornado import gen, ioloop, queues
+from sqlalchemy.orm import sessionmaker
+from tornado import gen, ioloop, locks, queues
+from tornado.httpclient import AsyncHTTPClient
 
 from illuminate.adapter import Adapter
 from illuminate.common import FILES
+from illuminate.common import SUPPORTED_HTTP_CLIENTS
+from illuminate.common import SUPPORTED_VISITED
 from illuminate.decorators import adapt
 from illuminate.decorators import show_info
 from illuminate.decorators import show_logo
 from illuminate.decorators import show_observer_catalogue
 from illuminate.exceptions import BasicExporterException
 from illuminate.exceptions import BasicManagerException
+from illuminate.exceptions import BasicObservationException
 from illuminate.exporter import Exporter
 from illuminate.exporter import InfluxDBExporter
+from illuminate.exporter import LineProtocol
 from illuminate.exporter import SQLExporter
 from illuminate.interface import IManager
+from illuminate.interface import IVisited
+from illuminate.manager import AdmissionQueue
 from illuminate.manager import Assistant
+from illuminate.manager import AutoThrottle
+from illuminate.manager import Batch
+from illuminate.manager import Canonicalizer
+from illuminate.manager import Frontier
+from illuminate.manager import Memory
+from illuminate.manager import Throttle
+from illuminate.manager import Watermarks
 from illuminate.meta.type import Result
 from illuminate.observation import FileObservation
 from illuminate.observation import HTTPObservation
+from illuminate.observation import InfluxDBObservation
 from illuminate.observation import Observation
+from illuminate.observation import SQLIncrementalObservation
+from illuminate.observation import SQLKeysetObservation
 from illuminate.observation import SQLObservation
 from illuminate.observation import SplashObservation
 from illuminate.observer import Finding
 from illuminate.observer import Observer
 
+UNSUCCESSFUL = 100
+WORKER: ContextVar[Optional[int]] = ContextVar("worker", default=None)
+
 
 class Manager(IManager):
     """
@@ -79,26 +102,48 @@ class Manager(IManager):
         self.settings = settings
         self._adapters: list[Adapter] = []
         self._observers: list[Observer] = []
-        self.__observe_queue: queues.Queue = queues.Queue()
-        self.__adapt_queue: queues.Queue = queues.Queue()
-        self.__export_queue: queues.Queue = queues.Queue()
+        maxsize = self.__provide_maxsize()
+        self.__observe_queue = self.__provide_frontier(maxsize["observations"])
+        self.__adapt_queue = AdmissionQueue(maxsize["adapters"])
+        self.__export_queue = AdmissionQueue(maxsize["exporters"])
+        self.__batches: dict[Hashable, Batch] = {}
+        self.__batching: dict[str, Optional[dict]] = self.__provide_batching()
+        self.__blocked: dict[int, int] = {}
+        self.__canonicalizer: Optional[Canonicalizer] = (
+            self.__provide_canonicalizer()
+        )
+        self.__compression: Optional[int] = self.__provide_compression()
+        self.__dispatch: dict[Type[Finding], list[Adapter]] = {}
         self.__exported: set = set()
-        self.__not_observed: set = set()
-        self.__observed: set = set()
-        self.__observing: set = set()
+        self.__failures: int = 0
+        self.__marks: dict[str, Any] = {}
+        self.__memory: Memory = self.__provide_memory()
+        self.__not_observed: IVisited = self.__provide_visited()
+        self.__observed: IVisited = self.__provide_visited()
+        self.__observing: IVisited = self.__provide_visited()
+        self.__pollers: list[Awaitable[None]] = []
+        self.__routed: int = 0
+        self.__semaphores: dict[Adapter, locks.Semaphore] = {}
+        self.__throttle: Throttle = self.__provide_throttle()
+        self.__unsuccessful: deque[str] = deque(maxlen=UNSUCCESSFUL)
+        self.__watermarks: Watermarks = self.__provide_watermarks()
 
     @property
     def exported(self) -> set:
         return self.__exported
 
     @property
-    def not_observed(self) -> set:
+    def not_observed(self) -> IVisited:
         return self.__not_observed
 
     @property
-    def observed(self) -> set:
+    def observed(self) -> IVisited:
         return self.__observed
 
+    @property
+    def unsuccessful(self) -> deque[str]:
+        return self.__unsuccessful
+
     @staticmethod
     @adapt("populate")
     def db_populate(
@@ -232,6 +277,7 @@ class Manager(IManager):
         objects to self.__observation.
 
         :return: None
+        :raises BasicManagerException:
         """
         for adapter in self.adapters:
             self._adapters.append(adapter(manager=self))
@@ -239,6 +285,14 @@ class Manager(IManager):
                 f"Adapter <yellow>{adapter.__name__}</yellow> initialized"
             )
 
+        for _adapter in self._adapters:
+            if _adapter.concurrency:
+                self.__semaphores[_adapter] = locks.Semaphore(
+                    _adapter.concurrency
+                )
+            for subscriber in _adapter.subscribers:
+                self.__subscribed(subscriber)
+
         for observer in self.observers:
             instance = observer(manager=self)
             self._observers.append(instance)
@@ -246,21 +300,27 @@ class Manager(IManager):
                 f"Observer <yellow>{observer.__name__}</yellow> initialized"
             )
             for _observation in instance.initial_observations:
-                await self.__router(_observation)
+                await self.__router(_observation, "start")
 
     async def __router(
-        self, item: Union[Exporter, Finding, Observation]
+        self, item: Union[Exporter, Finding, Observation], stage: str
     ) -> None:
         """
-        Routes object based on its class to proper queue.
+        Routes object based on its class to proper queue. Stage tells which
+        part of the process yielded the object, one of "start", "observation",
+        "poll" or "adaptation". If Canonicalizer is enabled, HTTP Observations
+        are fingerprinted by canonical form of their URL, while URL itself is
+        requested and checked against allowed prefixes unchanged.
 
         :param item: Exporter, Finding or Observation object
+        :param stage: Stage that yielded the object
         :return: None
         """
+        self.__routed += 1
         if isinstance(item, Exporter):
             await self.__export_queue.put(item)
         elif isinstance(item, Finding):
-            if inspect.stack()[1][3] != "__adaptation":
+            if stage != "adaptation":
                 await self.__adapt_queue.put(item)
             else:
                 logger.warning(
@@ -268,32 +328,66 @@ class Manager(IManager):
                     f"thus rejecting item {item}"
                 )
         elif isinstance(item, Observation):
-            _hash = hash(item)
-            if _hash not in self.__observing:
-                self.__observing.add(_hash)
+            if self.__canonicalizer and isinstance(item, HTTPObservation):
+                item.canonical = self.__canonicalizer.canonicalize(item.url)
+            if self.__observing.add(item.fingerprint()):
                 if isinstance(item, HTTPObservation) and not item.allowed:
                     return
-                await self.__observe_queue.put(item)
+                await self.__admit(item, stage)
         else:
             logger.warning(
                 f"Manager rejected item {item} due to unsupported "
                 f"item type {type(item)}"
             )
 
+    async def __admit(self, item: Observation, stage: str) -> None:
+        """
+        Puts Observation to observe queue, waiting while queue is full. If
+        process RSS is above high-water mark, waits for export queue to drain
+        first. Observations yielded by Adapters, or by the last observation
+        worker that is not waiting for queue, are put without waiting, since
+        observation workers wait for Adapters and for each other. Worker is
+        blocked while any of its coroutines waits for queue.
+
+        :param item: Observation object
+        :param stage: Stage that yielded the object
+        :return: None
+        """
+        if self.__memory.exceeded():
+            logger.debug(f"RSS above high-water mark, draining before {item}")
+            await self.__export_queue.join()
+        worker = WORKER.get()
+        if stage != "observation" or worker is None:
+            if stage == "adaptation":
+                self.__observe_queue.force(item)
+            else:
+                await self.__observe_queue.put(item)
+            return
+        blocked = len(self.__blocked) + (worker not in self.__blocked)
+        if blocked >= self.settings.CONCURRENCY["observations"]:
+            self.__observe_queue.force(item)
+            return
+        self.__blocked[worker] = self.__blocked.get(worker, 0) + 1
+        try:
+            await self.__observe_queue.put(item)
+        finally:
+            self.__blocked[worker] -= 1
+            if not self.__blocked[worker]:
+                del self.__blocked[worker]
+
     @logger.catch
-    async def __observe(self) -> None:
+    async def __observe(self, worker: int) -> None:
         """
-        Takes Observation object from self.__observe_queue and, after delay,
-        pass it to self.__observation method.
+        Takes Observation object from self.__observe_queue and pass it to
+        self.__observation method.
 
+        :param worker: Worker number
         :return: None
         """
+        WORKER.set(worker)
         async for item in self.__observe_queue:
             if not item:
                 return
-            await asyncio.sleep(
-                self.settings.OBSERVATION_CONFIGURATION["delay"]
-            )
             await self.__observation_switch(item)
             logger.debug(f"Coroutine observed {item}")
             del item
@@ -308,7 +402,7 @@ class Manager(IManager):
         :return: None
         """
         async with item.observe(xcom=item.xcom) as result:
-            await self.__observation_resolve(result, item.url)
+            await self.__observation_resolve(result, item)
 
     async def __observe_http(self, item: HTTPObservation) -> None:
         """
@@ -322,19 +416,78 @@ class Manager(IManager):
             **self.settings.OBSERVATION_CONFIGURATION["http"],
             **item.configuration,
         }
-        result = await item.observe(xcom=item.xcom)
-        await self.__observation_resolve(result, item.url)
+        await self.__throttle.acquire(item.url)
+        try:
+            result = await item.observe(xcom=item.xcom)
+        finally:
+            self.__throttle.release(item.url, item.request_time, item.code)
+        await self.__observation_resolve(result, item)
+
+    async def __observe_influxdb(self, item: InfluxDBObservation) -> None:
+        """
+        Calls InfluxDBObservation's observe method and pass result to resolve
+        function, while response chunks are still available.
+
+        :param item: InfluxDBObservation object
+        :return: None
+        """
+        session = self.sessions[item.url]
+        async with item.observe(session, xcom=item.xcom) as result:
+            await self.__observation_resolve(result, item)
 
     async def __observe_sql(self, item: SQLObservation) -> None:
         """
-        Calls SQLObservation's observe method and pass result to resolve
-        function.
+        Calls SQLObservation's observe method, or stream method if partition
+        is set, and pass result to resolve function. Partitioned observation
+        is split into observations of column ranges, observed concurrently.
+        Next page of SQLKeysetObservation is routed before current page is
+        resolved.
 
         :param item: SQLObservation object
         :return: None
         """
+        if isinstance(item, SQLIncrementalObservation):
+            await self.__observe_sql_incremental(item)
+            return
+        if item.partitioning:
+            try:
+                items = item.split()
+            except BasicObservationException as exception:
+                logger.warning(f"{item}.split() -> {exception}")
+                await self.__observation_resolve(None, item)
+                return
+            await gen.multi([self.__observe_sql(i) for i in items])
+            return
+        session = self.sessions[item.url]
+        if item.partition:
+            async with item.stream(session, xcom=item.xcom) as result:
+                await self.__observation_resolve(result, item)
+            return
+        result = await item.observe(session, xcom=item.xcom)
+        if isinstance(item, SQLKeysetObservation) and item.following:
+            await self.__router(item.following, "observation")
+        await self.__observation_resolve(result, item)
+
+    async def __observe_sql_incremental(
+        self, item: SQLIncrementalObservation
+    ) -> None:
+        """
+        Calls SQLIncrementalObservation's observe method with the mark of
+        previous run and pass result to resolve function. Highest value read
+        becomes pending mark only if observation is resolved successfully, and
+        is stored once its Findings are adapted and exported. Next run is
+        scheduled if observation has an interval.
+
+        :param item: SQLIncrementalObservation object
+        :return: None
+        """
+        item.mark = self.__watermarks.get(item.name)
         result = await item.observe(self.sessions[item.url], xcom=item.xcom)
-        await self.__observation_resolve(result, f"{item.url}:{item.query}")
+        resolved = await self.__observation_resolve(result, item)
+        if resolved and item.high is not None:
+            self.__marks[item.name] = item.high
+        if item.interval:
+            self.__pollers.append(gen.convert_yielded(self.__poll(item)))
 
     async def __observe_splash(self, item: SplashObservation) -> None:
         """
@@ -348,37 +501,280 @@ class Manager(IManager):
             **self.settings.OBSERVATION_CONFIGURATION["splash"],
             **item.configuration,
         }
-        result = await item.observe(
-            self.settings.OBSERVATION_CONFIGURATION["http"], xcom=item.xcom
+        await self.__throttle.acquire(item.url)
+        try:
+            result = await item.observe(
+                self.settings.OBSERVATION_CONFIGURATION["http"],
+                xcom=item.xcom,
+            )
+        finally:
+            self.__throttle.release(item.url, item.request_time, item.code)
+        await self.__observation_resolve(result, item)
+
+    def __configure_http_client(self) -> None:
+        """
+        Configures Tornado's AsyncHTTPClient implementation and its limits from
+        settings.py module. Client instance is shared by all HTTP and Splash
+        observations, so curl implementation keeps connections alive between
+        them. Implementation curl requires pycurl, if it is not installed,
+        simple implementation is used instead. Curl supports only max_clients
+        limit, others are ignored with a warning.
+
+        :return: None
+        """
+        configuration = {
+            **self.settings.OBSERVATION_CONFIGURATION.get("client", {})
+        }
+        implementation = configuration.pop("implementation", "simple")
+        if implementation not in SUPPORTED_HTTP_CLIENTS:
+            logger.warning(
+                f"HTTP client {implementation} is not supported, "
+                f"using simple instead"
+            )
+            implementation = "simple"
+        if implementation == "curl":
+            try:
+                import pycurl  # type: ignore # noqa: F401
+            except ImportError:
+                logger.warning(
+                    "HTTP client curl requires pycurl, using simple instead"
+                )
+                implementation = "simple"
+        if implementation == "curl":
+            ignored = sorted(i for i in configuration if i != "max_clients")
+            if ignored:
+                logger.warning(f"HTTP client curl ignores {ignored}")
+            configuration = {
+                k: v for k, v in configuration.items() if k == "max_clients"
+            }
+        AsyncHTTPClient.configure(
+            SUPPORTED_HTTP_CLIENTS[implementation], **configuration
+        )
+        clients = configuration.get("max_clients", 10)
+        workers = self.settings.CONCURRENCY["observations"]
+        logger.opt(colors=True).info(
+            f"HTTP client <yellow>{implementation}</yellow> with effective "
+            f"concurrency of <yellow>{min(clients, workers)}</yellow> "
+            f"requests"
+        )
+        if clients < workers:
+            logger.warning(
+                f"HTTP client allows {clients} concurrent requests, "
+                f"{workers - clients} observation workers will wait in queue"
+            )
+
+    def __provide_batching(self) -> dict[str, Optional[dict]]:
+        """
+        Creates batch configuration per batch kind from settings.py module.
+        Adaptation batches are used only by Adapters implementing adapt_batch,
+        so they have defaults, while InfluxDB and SQL export batches are used
+        only if configured.
+
+        :return: Batch configuration dict
+        """
+        adaptation = getattr(self.settings, "ADAPTATION_CONFIGURATION", {})
+        exportation = getattr(self.settings, "EXPORTATION_CONFIGURATION", {})
+        return {
+            "adaptation": {
+                "interval": 0.5,
+                "size": 100,
+                **adaptation.get("batch", {}),
+            },
+            "influxdb": exportation.get("influxdb", {}).get("batch"),
+            "sql": exportation.get("sql", {}).get("batch"),
+        }
+
+    def __provide_compression(self) -> Optional[int]:
+        """
+        Provides gzip compression level of InfluxDB batches from settings.py
+        module.
+
+        :return: Compression level or None if compression is not configured
+        """
+        exportation = getattr(self.settings, "EXPORTATION_CONFIGURATION", {})
+        return exportation.get("influxdb", {}).get("gzip")
+
+    def __provide_visited(self) -> IVisited:
+        """
+        Creates store of Observations' fingerprints from settings.py module,
+        exact set if it is not configured or not supported. Only parameters of
+        selected implementation are passed to it.
+
+        :return: IVisited object
+        """
+        configuration = {
+            **self.settings.OBSERVATION_CONFIGURATION.get("visited", {})
+        }
+        implementation = configuration.pop("implementation", "set")
+        if implementation not in SUPPORTED_VISITED:
+            logger.warning(
+                f"Visited {implementation} is not supported, using set instead"
+            )
+            implementation = "set"
+        cls = locate(SUPPORTED_VISITED[implementation])
+        parameters = inspect.signature(cls).parameters  # type: ignore
+        return cls(  # type: ignore
+            **{k: v for k, v in configuration.items() if k in parameters}
+        )
+
+    def __provide_watermarks(self) -> Watermarks:
+        """
+        Creates Watermarks of incremental observations from settings.py
+        module. Relative path is resolved against project path.
+
+        :return: Watermarks object
+        """
+        configuration = self.settings.OBSERVATION_CONFIGURATION
+        path = configuration.get("watermarks", "watermarks.db")
+        return Watermarks(os.path.join(self.path, path))
+
+    async def __poll(self, item: SQLIncrementalObservation) -> None:
+        """
+        Routes next run of SQLIncrementalObservation after its interval.
+
+        :param item: SQLIncrementalObservation object
+        :return: None
+        """
+        await gen.sleep(item.interval)  # type: ignore
+        await self.__router(item.poll(), "poll")
+
+    def __watermark(self, drained: bool) -> None:
+        """
+        Stores pending marks of incremental observations if their Findings
+        are adapted and exported without failures, otherwise drops them, so
+        rows beyond stored marks are read again.
+
+        :param drained: True if queues are drained without failures
+        :return: None
+        """
+        marks, self.__marks = self.__marks, {}
+        if not drained:
+            if marks:
+                logger.warning(
+                    f"Marks of {list(marks)} not kept, adaptation or "
+                    f"exportation failed"
+                )
+            return
+        for name, mark in marks.items():
+            try:
+                self.__watermarks.set(name, mark)
+            except TypeError as exception:
+                logger.warning(f"{name} mark not kept -> {exception}")
+
+    def __provide_canonicalizer(self) -> Optional[Canonicalizer]:
+        """
+        Creates Canonicalizer of HTTP URLs from settings.py module.
+
+        :return: Canonicalizer object or None if it is not enabled
+        """
+        configuration = {
+            **self.settings.OBSERVATION_CONFIGURATION.get("canonicalizer", {})
+        }
+        if not configuration.pop("enabled", False):
+            return None
+        return Canonicalizer(**configuration)
+
+    def __provide_frontier(self, maxsize: int) -> AdmissionQueue:
+        """
+        Creates observe queue, Frontier spilling Observations to disk if it is
+        configured in settings.py module. Relative path is resolved against
+        project path. Spilled Observations count towards maxsize, so threshold
+        that is not below maxsize is reported, since only Observations forced
+        above full queue are spilled then.
+
+        :param maxsize: Maximum number of Observations, unbounded if 0
+        :return: AdmissionQueue or Frontier object
+        """
+        configuration = getattr(self.settings, "QUEUE_CONFIGURATION", {})
+        frontier = configuration.get("frontier")
+        if not frontier:
+            return AdmissionQueue(maxsize)
+        if 0 < maxsize <= frontier["threshold"]:
+            logger.warning(
+                f"Frontier threshold {frontier['threshold']} is not below "
+                f"observations maxsize {maxsize}, only forced Observations "
+                f"are spilled"
+            )
+        return Frontier(
+            os.path.join(self.path, frontier["path"]),
+            frontier["threshold"],
+            self._observers,
+            maxsize,
         )
-        await self.__observation_resolve(result, item.url)
+
+    def __provide_maxsize(self) -> dict[str, int]:
+        """
+        Provides maximum size of queue per worker type from settings.py
+        module. Queues are unbounded if it is not configured.
+
+        :return: Maximum size dict
+        """
+        configuration = getattr(self.settings, "QUEUE_CONFIGURATION", {})
+        return {
+            "adapters": 0,
+            "exporters": 0,
+            "observations": 0,
+            **configuration.get("maxsize", {}),
+        }
+
+    def __provide_memory(self) -> Memory:
+        """
+        Creates Memory with RSS high-water mark from settings.py module.
+
+        :return: Memory object
+        """
+        configuration = getattr(self.settings, "QUEUE_CONFIGURATION", {})
+        return Memory(configuration.get("rss"))
+
+    def __provide_throttle(self) -> Throttle:
+        """
+        Creates per host Throttle from settings.py module, or AutoThrottle if
+        it is enabled. Projects that still define global delay are throttled to
+        one request per delay per host.
+
+        :return: Throttle or AutoThrottle object
+        """
+        configuration = self.settings.OBSERVATION_CONFIGURATION
+        if "throttle" in configuration:
+            throttle = {**configuration["throttle"]}
+            autothrottle = {**throttle.pop("autothrottle", {})}
+            if autothrottle.pop("enabled", False):
+                return AutoThrottle(**throttle, **autothrottle)
+            return Throttle(**throttle)
+        delay = configuration.get("delay")
+        return Throttle(rate=1 / delay if delay else 0, burst=1)
 
     async def __observation_resolve(
-        self, result: Union[None, Result], url: str
-    ):
+        self, result: Union[None, Result], item: Observation
+    ) -> bool:
         """
-        Resolves Observation.
+        Resolves Observation, keeping its fingerprint as observed or not
+        observed. URLs of the last UNSUCCESSFUL not observed Observations are
+        kept for logging.
 
         :param result: Result
-        :param url: URL str
-        :return: None
+        :param item: Observation object
+        :return: True if Result is resolved without exception
         """
         if not result:
-            self.__not_observed.add(url)
-            return
-        self.__observed.add(url)
+            self.__not_observed.add(item.fingerprint())
+            self.__unsuccessful.append(str(item.url))
+            return False
+        self.__observed.add(item.fingerprint())
         try:
             if inspect.isawaitable(result):
                 await result
             if inspect.isasyncgen(result):
                 async for _item in result:
-                    await self.__router(_item)
+                    await self.__router(_item, "observation")
         except Exception:  # noqa
             stack = traceback.format_exc().strip().replace("<", "\\<")
             logger.opt(colors=True).warning(
                 "Observation callback throws the following exception\n"
                 f"<red>{stack}</red>"
             )
+            return False
+        return True
 
     async def __observation_switch(self, item: Observation) -> None:
         """
@@ -394,6 +790,8 @@ class Manager(IManager):
                 await self.__observe_http(item)
         elif isinstance(item, FileObservation):
             await self.__observe_file(item)
+        elif isinstance(item, InfluxDBObservation):
+            await self.__observe_influxdb(item)
         elif isinstance(item, SQLObservation):
             await self.__observe_sql(item)
         else:
@@ -412,27 +810,148 @@ class Manager(IManager):
         async for item in self.__adapt_queue:
             if not item:
                 return
-            await self.__adaptation(item)
+            batched = await self.__adaptation(item)
             logger.debug(f"Coroutine adapted {item}")
             del item
-            self.__adapt_queue.task_done()
+            if not batched:
+                self.__adapt_queue.task_done()
 
-    async def __adaptation(self, item: Finding) -> None:
+    async def __adaptation(self, item: Finding) -> bool:
         """
-        Passes Finding object to Adapter's instance adapt method.
+        Passes Finding object to subscribed Adapter's instance adapt method.
+        Consecutive concurrent Adapters adapt Finding at the same time, while
+        other Adapters adapt it in sequence, in priority order. If any of
+        subscribed Adapters implements adapt_batch, Finding is added to the
+        batch of its class, which is marked as done once it is adapted.
+        Finding whose batched Adapters are not ordered last is dropped.
 
         :param item: Finding object
+        :return: True if Finding is batched, otherwise False
+        """
+        batched = False
+        concurrent: list[Adapter] = []
+        try:
+            adapters = self.__subscribed(type(item))
+        except BasicManagerException as exception:
+            logger.warning(f"{item} not adapted -> {exception}")
+            return False
+        for adapter in adapters:
+            if adapter.batched:
+                batched = True
+                continue
+            if adapter.concurrent:
+                concurrent.append(adapter)
+                continue
+            if concurrent:
+                await gen.multi([self.__adapt_by(i, item) for i in concurrent])
+                concurrent = []
+            await self.__adapt_by(adapter, item)
+        if concurrent:
+            await gen.multi([self.__adapt_by(i, item) for i in concurrent])
+        if batched:
+            batch = self.__batch(
+                ("adaptation", type(item)),
+                self.__adaptation_batch,
+                self.__adapt_queue,
+                self.__batching["adaptation"],
+            )
+            await batch.put(item)
+        return batched
+
+    async def __adaptation_batch(self, items: list[Finding]) -> None:
+        """
+        Passes batch of Finding objects of the same class to subscribed
+        Adapter's instance adapt_batch method, in priority order.
+
+        :param items: List of Finding objects
         :return: None
         """
-        for adapter in self._adapters:
-            for subscriber in adapter.subscribers:
-                if isinstance(item, subscriber):
-                    try:
-                        items = adapter.adapt(item)
-                        async for _item in items:  # type: ignore
-                            await self.__router(_item)
-                    except Exception as exception:
-                        logger.warning(f"{self}.adapt() -> {exception}")
+        for adapter in self.__subscribed(type(items[0])):
+            if adapter.batched:
+                await self.__adapt_by(adapter, items)
+
+    async def __adapt_by(
+        self, adapter: Adapter, item: Union[Finding, list[Finding]]
+    ) -> None:
+        """
+        Drains Adapter's instance adapt method, or adapt_batch method if list
+        of Findings is passed, and routes yielded objects, respecting
+        Adapter's concurrency.
+
+        :param adapter: Adapter object
+        :param item: Finding object or list of Finding objects
+        :return: None
+        """
+        semaphore = self.__semaphores.get(adapter)
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            if isinstance(item, list):
+                items = adapter.adapt_batch(item)
+            else:
+                items = adapter.adapt(item)
+            async for _item in items:  # type: ignore
+                await self.__router(_item, "adaptation")
+        except Exception as exception:
+            self.__failures += 1
+            logger.warning(f"{self}.adapt() -> {exception}")
+        finally:
+            if semaphore:
+                semaphore.release()
+
+    def __batch(
+        self,
+        key: Hashable,
+        flush: Callable[[list], Awaitable[None]],
+        queue: queues.Queue,
+        configuration: dict,
+    ) -> Batch:
+        """
+        Provides Batch for a key, creating it if needed.
+
+        :param key: Batch key
+        :param flush: Async function that receives list of batched items
+        :param queue: Queue batched items are taken from
+        :param configuration: Batch configuration from settings.py module
+        :return: Batch object
+        """
+        batch = self.__batches.get(key)
+        if not batch:
+            batch = Batch(flush, queue, **configuration)
+            self.__batches[key] = batch
+        return batch
+
+    def __subscribed(self, finding: Type[Finding]) -> list[Adapter]:
+        """
+        Provides Adapters subscribed to Finding class, ordered by priority.
+        Adapter is subscribed if any of its subscribers is found in Finding
+        class MRO. Result is resolved on first sight of Finding class and kept
+        in self.__dispatch, so each following Finding costs a single lookup.
+
+        Batched Adapters adapt Findings only once their batch is flushed, so
+        they must have lower priority than every other Adapter subscribed to
+        the same Finding class, otherwise priority order would be broken.
+
+        :param finding: Finding class
+        :return: List of Adapter objects
+        :raises BasicManagerException:
+        """
+        adapters = self.__dispatch.get(finding)
+        if adapters is None:
+            mro = set(finding.__mro__)
+            adapters = [
+                adapter
+                for adapter in self._adapters
+                if mro.intersection(adapter.subscribers)
+            ]
+            batched = [i.batched for i in adapters]
+            if batched != sorted(batched):
+                raise BasicManagerException(
+                    f"Batched Adapters subscribed to {finding.__name__} must "
+                    f"have lower priority than other subscribed Adapters"
+                )
+            self.__dispatch[finding] = adapters
+        return adapters
 
     @logger.catch
     async def __export(self) -> None:
@@ -445,20 +964,36 @@ class Manager(IManager):
         async for item in self.__export_queue:
             if not item:
                 return
-            await self.__export_to(item)
+            batched = await self.__export_to(item)
             logger.debug(f"Coroutine exported {item}")
             del item
-            self.__export_queue.task_done()
+            if not batched:
+                self.__export_queue.task_done()
 
-    async def __export_to(self, item: Exporter) -> None:
+    async def __export_to(self, item: Exporter) -> bool:
         """
-        Passes Exporter object to proper method based on its class.
+        Passes Exporter object to proper method based on its class. If
+        InfluxDB or SQL export batching is configured, InfluxDBExporter or
+        SQLExporter object is added to the batch of its database, which is
+        marked as done once it is exported.
 
         :param item: Exporter object
-        :return: None
+        :return: True if Exporter is batched, otherwise False
         """
+        if isinstance(item, InfluxDBExporter) and self.__batching["influxdb"]:
+            return await self.__export_to_influxdb(item)
+        if isinstance(item, SQLExporter) and self.__batching["sql"]:
+            batch = self.__batch(
+                ("sql", item.name),
+                self.__export_to_database_batch,
+                self.__export_queue,
+                self.__batching["sql"],  # type: ignore
+            )
+            await batch.put(item)
+            return True
         if isinstance(item, (InfluxDBExporter, SQLExporter)):
             await self.__export_to_database(item)
+        return False
 
     async def __export_to_database(
         self, item: Union[InfluxDBExporter, SQLExporter]
@@ -475,17 +1010,134 @@ class Manager(IManager):
             await item.export(session)
             self.__exported.add(item)
         except BasicExporterException:
-            pass
+            self.__failures += 1
         except KeyError:
+            self.__failures += 1
             logger.warning(f"Database {item.name} of is not found in context")
 
+    async def __export_to_influxdb(self, item: InfluxDBExporter) -> bool:
+        """
+        Serializes InfluxDBExporter's points and adds them to the batch of its
+        database and destination. Batch is written once it holds size points
+        or limit bytes, or once interval seconds pass.
+
+        :param item: InfluxDBExporter object
+        :return: True if Exporter is batched, otherwise False
+        """
+        if item.name not in self.sessions:
+            self.__failures += 1
+            logger.warning(f"Database {item.name} of is not found in context")
+            return False
+        try:
+            payload = item.serialize()
+        except Exception as exception:
+            self.__failures += 1
+            logger.warning(f"{item}.serialize() -> {exception}")
+            return False
+        destination = item.destination()
+        batch = self.__batch(
+            ("influxdb", item.name, tuple(sorted(destination.items()))),
+            self.__export_to_influxdb_batch,
+            self.__export_queue,
+            {
+                "count": lambda x: x[1].count(b"\n") + 1,
+                "weigh": lambda x: len(x[1]),
+                **self.__batching["influxdb"],  # type: ignore
+            },
+        )
+        await batch.put((item, payload))
+        return True
+
+    async def __export_to_influxdb_batch(
+        self, items: list[tuple[InfluxDBExporter, bytes]]
+    ) -> None:
+        """
+        Writes serialized points of InfluxDBExporter objects with the same
+        name and destination as a single line protocol payload, compressed
+        with gzip if configured.
+
+        :param items: List of InfluxDBExporter objects and their payloads
+        :return: None
+        """
+        item = items[0][0]
+        payload = b"\n".join(payload for _, payload in items if payload)
+        try:
+            await LineProtocol.write(
+                self.sessions[item.name],
+                payload,
+                self.__compression,
+                **item.destination(),
+            )
+        except Exception as exception:
+            self.__failures += 1
+            logger.warning(
+                f"Batch of {len(items)} exports to database {item.name} "
+                f"failed -> {exception}"
+            )
+            return
+        self.__exported.update(_item for _item, _ in items)
+        logger.success(
+            f"Batch of {len(items)} exports to database {item.name} written "
+            f"({len(payload)} bytes)"
+        )
+
+    async def __export_to_database_batch(
+        self, items: list[SQLExporter]
+    ) -> None:
+        """
+        Acquires database session based on Exporters' name and writes all
+        SQLExporter objects in a single transaction. Each SQLExporter is
+        written within its own savepoint, so the failure of one does not
+        prevent the others from being exported.
+
+        :param items: List of SQLExporter objects with the same name
+        :return: None
+        """
+        name = items[0].name
+        if name not in self.sessions:
+            self.__failures += 1
+            logger.warning(f"Database {name} of is not found in context")
+            return
+        exported = []
+        try:
+            async with self.sessions[name]() as session:  # type: ignore
+                async with session.begin():
+                    for item in items:
+                        try:
+                            async with session.begin_nested():
+                                await item.write(session)
+                            exported.append(item)
+                        except Exception as exception:
+                            self.__failures += 1
+                            logger.warning(
+                                f'{item}.export(session="{session}") -> '
+                                f"{exception}"
+                            )
+        except Exception as exception:
+            self.__failures += 1
+            logger.warning(
+                f"Batch of {len(items)} exports to database {name} "
+                f"failed -> {exception}"
+            )
+            return
+        self.__exported.update(exported)
+        logger.success(
+            f"Batch of {len(exported)}/{len(items)} exports to database "
+            f"{name} committed"
+        )
+
     @logger.catch
     async def _observe_start(self) -> None:
         """
-        Starts producer/consumer ETL process.
+        Starts producer/consumer ETL process. Queues are joined until a pass
+        over all of them routes no new objects, since batched objects can be
+        flushed after their queue is joined, and while incremental
+        observations are polled. Pending marks of incremental observations are
+        stored after each pass without failures.
 
         :return: None
         """
+        self.__configure_http_client()
         self.adapters.sort(key=lambda x: x.priority, reverse=True)
 
         _adapters = self.settings.CONCURRENCY["adapters"]
@@ -494,12 +1146,19 @@ class Manager(IManager):
 
         adapters = gen.multi([self.__adapt() for _ in range(_adapters)])
         exporters = gen.multi([self.__export() for _ in range(_exporters)])
-        observations = gen.multi([self.__observe() for _ in range(_obs)])
+        observations = gen.multi([self.__observe(i) for i in range(_obs)])
 
         await self.__start()
-        await self.__observe_queue.join()
-        await self.__adapt_queue.join()
-        await self.__export_queue.join()
+        routed = None
+        while routed != self.__routed or self.__pollers:
+            routed = self.__routed
+            failures = self.__failures
+            await self.__observe_queue.join()
+            await self.__adapt_queue.join()
+            await self.__export_queue.join()
+            self.__watermark(failures == self.__failures)
+            if self.__pollers:
+                await self.__pollers.pop(0)
 
         for _ in range(_obs):
             await self.__observe_queue.put(None)
@@ -512,6 +1171,14 @@ class Manager(IManager):
         await exporters
         await observations
 
+        for batch in self.__batches.values():
+            await batch.flush()
+
         for session in self.sessions:
             if isinstance(self.sessions[session], InfluxDBClient):
                 await self.sessions[session].close()  # type: ignore
+            elif isinstance(self.sessions[session], sessionmaker):
+                await self.sessions[session].kw["bind"].dispose()
+        self.__watermarks.close()
+        if isinstance(self.__observe_queue, Frontier):
+            self.__observe_queue.close()
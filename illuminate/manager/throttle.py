@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Optional
+from urllib.parse import urlsplit
+
+from tornado import locks
+
+
+class TokenBucket:
+    """
+    TokenBucket class, limits the rate of acquisitions to a single resource.
+
+    Bucket holds up to burst tokens and refills them at rate tokens per
+    second. Each acquisition takes one token and waits if none are left.
+    Tokens are reserved in the order of acquisition, so concurrent callers are
+    served first come, first served.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        TokenBucket's __init__ method.
+
+        :param rate: Number of tokens added per second
+        :param burst: Maximum number of tokens bucket can hold
+        """
+        self.burst = max(burst, 1)
+        self.rate = rate
+        self.tokens: float = self.burst
+        self.updated = monotonic()
+
+    async def acquire(self) -> None:
+        """
+        Takes a token from the bucket, waiting until one is available.
+
+        :return: None
+        """
+        if self.rate <= 0:
+            return
+        now = monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+    def __repr__(self):
+        """
+        TokenBucket's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return f"TokenBucket(rate={self.rate},burst={self.burst})"
+
+
+class Throttle:
+    """
+    Throttle class, limits the rate of requests per host.
+
+    Each host (URL's netloc) gets its own TokenBucket, so a slow rate towards a
+    single host does not limit requests towards other hosts.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Throttle's __init__ method.
+
+        :param rate: Number of requests per second allowed per host, zero or
+        less disables throttling
+        :param burst: Number of requests allowed per host without waiting
+        """
+        self.burst = burst
+        self.rate = rate
+        self.buckets: dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def host(url: str) -> str:
+        """
+        Extracts host from URL.
+
+        :param url: URL string
+        :return: Host string
+        """
+        return urlsplit(url).netloc.lower()
+
+    async def acquire(self, url: str) -> None:
+        """
+        Waits until request towards URL's host is allowed.
+
+        :param url: URL string
+        :return: None
+        """
+        await self.bucket(url).acquire()
+
+    def release(
+        self, url: str, latency: Optional[float], code: Optional[int]
+    ) -> None:
+        """
+        Marks request towards URL's host as finished.
+
+        :param url: URL string
+        :param latency: Response time in seconds or None
+        :param code: Response code or None
+        :return: None
+        """
+
+    def bucket(self, url: str) -> TokenBucket:
+        """
+        Provides TokenBucket for URL's host, creating it if needed.
+
+        :param url: URL string
+        :return: TokenBucket object
+        """
+        host = self.host(url)
+        bucket: Optional[TokenBucket] = self.buckets.get(host)
+        if not bucket:
+            bucket = TokenBucket(self.rate, self.burst)
+            self.buckets[host] = bucket
+        return bucket
+
+    def __repr__(self):
+        """
+        Throttle's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return f"Throttle(rate={self.rate},burst={self.burst})"
+
+
+class Host:
+    """
+    Host class, holds AutoThrottle state of a single host.
+    """
+
+    def __init__(self, bucket: TokenBucket):
+        """
+        Host's __init__ method.
+
+        :param bucket: Host's TokenBucket object
+        """
+        self.bucket = bucket
+        self.condition = locks.Condition()
+        self.decreased: float = 0.0
+        self.errors: float = 0.0
+        self.latency: Optional[float] = None
+        self.limit: int = 1
+        self.running: int = 0
+
+    def __repr__(self):
+        """
+        Host's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return (
+            f"Host(rate={self.bucket.rate:.2f},limit={self.limit},"
+            f"latency={self.latency},errors={self.errors:.2f})"
+        )
+
+
+class AutoThrottle(Throttle):
+    """
+    AutoThrottle class, adapts the rate and concurrency of requests per host
+    to observed latency and error rate.
+
+    Follows additive increase, multiplicative decrease (AIMD) approach. While
+    moving averages of host's latency and error rate are below their targets,
+    rate and concurrency grow by a fixed step after each response. Once either
+    of them is above the target, rate and concurrency are multiplied by
+    decrease factor, at most once per average latency, so responses to
+    requests already in flight do not punish the host twice.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        concurrency: int = 8,
+        errors: float = 0.1,
+        latency: float = 1.0,
+        max_rate: float = 100.0,
+        min_rate: float = 0.5,
+        decrease: float = 0.5,
+        increase: float = 1.0,
+        smoothing: float = 0.3,
+    ):
+        """
+        AutoThrottle's __init__ method.
+
+        :param rate: Initial number of requests per second allowed per host
+        :param burst: Number of requests allowed per host without waiting
+        :param concurrency: Maximum number of concurrent requests per host
+        :param errors: Target error rate, from 0 to 1
+        :param latency: Target latency in seconds
+        :param max_rate: Maximum number of requests per second per host
+        :param min_rate: Minimum number of requests per second per host
+        :param decrease: Multiplicative decrease factor
+        :param increase: Additive increase of rate in requests per second
+        :param smoothing: Weight of the latest response in moving averages
+        """
+        super().__init__(rate, burst)
+        self.concurrency = max(concurrency, 1)
+        self.decrease = decrease
+        self.errors = errors
+        self.increase = increase
+        self.latency = latency
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.smoothing = smoothing
+        self.hosts: dict[str, Host] = {}
+
+    async def acquire(self, url: str) -> None:
+        """
+        Waits until host's concurrency and rate allow request towards URL's
+        host. Concurrency slot is taken before waiting for the rate and given
+        back if waiting is cancelled.
+
+        :param url: URL string
+        :return: None
+        """
+        host = self.state(url)
+        while host.running >= host.limit:
+            await host.condition.wait()
+        host.running += 1
+        try:
+            await host.bucket.acquire()
+        except BaseException:
+            host.running -= 1
+            host.condition.notify()
+            raise
+
+    def release(
+        self, url: str, latency: Optional[float], code: Optional[int]
+    ) -> None:
+        """
+        Marks request towards URL's host as finished and adapts host's rate
+        and concurrency. Missing response, server errors and throttling
+        responses (429) are counted as errors.
+
+        :param url: URL string
+        :param latency: Response time in seconds or None
+        :param code: Response code or None
+        :return: None
+        """
+        host = self.state(url)
+        host.running = max(host.running - 1, 0)
+        error = not code or code >= 500 or code == 429
+        host.errors += self.smoothing * (float(error) - host.errors)
+        if latency is not None:
+            if host.latency is None:
+                host.latency = latency
+            host.latency += self.smoothing * (latency - host.latency)
+        if host.errors > self.errors or (host.latency or 0) > self.latency:
+            now = monotonic()
+            if now - host.decreased >= (host.latency or self.latency):
+                host.decreased = now
+                host.limit = max(int(host.limit * self.decrease), 1)
+                host.bucket.rate = max(
+                    host.bucket.rate * self.decrease, self.min_rate
+                )
+        else:
+            host.limit = min(host.limit + 1, self.concurrency)
+            host.bucket.rate = min(
+                host.bucket.rate + self.increase, self.max_rate
+            )
+        host.condition.notify(max(host.limit - host.running, 0))
+
+    def state(self, url: str) -> Host:
+        """
+        Provides Host object for URL's host, creating it if needed.
+
+        :param url: URL string
+        :return: Host object
+        """
+        name = self.host(url)
+        host: Optional[Host] = self.hosts.get(name)
+        if not host:
+            host = Host(self.bucket(url))
+            self.hosts[name] = host
+        return host
+
+    def __repr__(self):
+        """
+        AutoThrottle's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return (
+            f"AutoThrottle(rate={self.rate},burst={self.burst},"
+            f"concurrency={self.concurrency},latency={self.latency},"
+            f"errors={self.errors})"
+        )
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from illuminate.interface import IVisited
+
+MASK = 0xFFFFFFFFFFFFFFFF
+
+
+class SetVisited(IVisited):
+    """
+    SetVisited class, keeps fingerprints of visited Observations in a Python
+    set. Exact, but every fingerprint takes a Python int and a set slot.
+    """
+
+    def __contains__(self, key: int) -> bool:
+        """
+        Checks if fingerprint was added.
+
+        :param key: Fingerprint
+        :return: True if fingerprint was added
+        """
+        return key in self.keys
+
+    def __init__(self):
+        """
+        SetVisited's __init__ method.
+        """
+        self.keys: set[int] = set()
+
+    def __len__(self) -> int:
+        """
+        Number of added fingerprints.
+
+        :return: int
+        """
+        return len(self.keys)
+
+    def __repr__(self):
+        """
+        SetVisited's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return f"SetVisited(len={len(self)})"
+
+    def add(self, key: int) -> bool:
+        """
+        Adds fingerprint.
+
+        :param key: Fingerprint
+        :return: True if fingerprint was not added before
+        """
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        return True
+
+
+class CompactVisited(IVisited):
+    """
+    CompactVisited class, keeps 64-bit fingerprints of visited Observations
+    in sorted NumPy uint64 blocks, 8 bytes per fingerprint.
+
+    Fingerprints are added to a small hot set, which is sorted into a new
+    block once it holds size fingerprints. Adjacent blocks of similar size are
+    merged, so there are only logarithmically many blocks to binary search.
+    Exact, fingerprints are compared in full.
+    """
+
+    def __contains__(self, key: int) -> bool:
+        """
+        Checks if fingerprint was added.
+
+        :param key: Fingerprint
+        :return: True if fingerprint was added
+        """
+        key &= MASK
+        if key in self.hot:
+            return True
+        _key = np.uint64(key)
+        for block in self.blocks:
+            i = block.searchsorted(_key)
+            if i < block.size and block[i] == _key:
+                return True
+        return False
+
+    def __init__(self, size: int = 65536):
+        """
+        CompactVisited's __init__ method.
+
+        :param size: Number of fingerprints held in hot set before it is
+        sorted into a block
+        """
+        self.blocks: list[np.ndarray] = []
+        self.count = 0
+        self.hot: set[int] = set()
+        self.size = max(size, 1)
+
+    def __len__(self) -> int:
+        """
+        Number of added fingerprints.
+
+        :return: int
+        """
+        return self.count
+
+    def __repr__(self):
+        """
+        CompactVisited's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return f"CompactVisited(len={len(self)},size={self.size})"
+
+    def add(self, key: int) -> bool:
+        """
+        Adds fingerprint, sorting hot set into a block if it is full.
+
+        :param key: Fingerprint
+        :return: True if fingerprint was not added before
+        """
+        key &= MASK
+        if key in self:
+            return False
+        self.hot.add(key)
+        self.count += 1
+        if len(self.hot) >= self.size:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """
+        Sorts hot set into a new block and merges last blocks while the
+        previous one is not more than twice as large.
+
+        :return: None
+        """
+        if not self.hot:
+            return
+        block = np.fromiter(self.hot, dtype=np.uint64, count=len(self.hot))
+        block.sort()
+        self.hot.clear()
+        self.blocks.append(block)
+        while (
+            len(self.blocks) > 1
+            and self.blocks[-2].size <= 2 * self.blocks[-1].size
+        ):
+            last = self.blocks.pop()
+            merged = np.concatenate((self.blocks.pop(), last))
+            merged.sort(kind="stable")
+            self.blocks.append(merged)
+
+
+class BloomVisited(IVisited):
+    """
+    BloomVisited class, keeps fingerprints of visited Observations in a
+    Bloom filter sized for capacity fingerprints at error rate.
+
+    Memory is fixed, about 1.2 bytes per fingerprint at 1% error rate, but
+    not exact: at error rate, a new Observation is reported as visited and is
+    not observed. Error rate grows once more than capacity fingerprints are
+    added.
+    """
+
+    def __contains__(self, key: int) -> bool:
+        """
+        Checks if fingerprint was possibly added.
+
+        :param key: Fingerprint
+        :return: True if fingerprint was possibly added
+        """
+        return all(
+            self.bits[i >> 3] & (1 << (i & 7)) for i in self._positions(key)
+        )
+
+    def __init__(
+        self,
+        capacity: int = 10_000_000,
+        error_rate: float = 0.001,
+    ):
+        """
+        BloomVisited's __init__ method.
+
+        :param capacity: Expected number of fingerprints
+        :param error_rate: False positive rate at capacity
+        """
+        capacity = max(capacity, 1)
+        self.count = 0
+        self.size = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def __len__(self) -> int:
+        """
+        Number of added fingerprints.
+
+        :return: int
+        """
+        return self.count
+
+    def __repr__(self):
+        """
+        BloomVisited's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return (
+            f"BloomVisited(len={len(self)},size={self.size},"
+            f"hashes={self.hashes})"
+        )
+
+    def add(self, key: int) -> bool:
+        """
+        Adds fingerprint.
+
+        :param key: Fingerprint
+        :return: True if fingerprint was not possibly added before
+        """
+        added = False
+        for i in self._positions(key):
+            byte, bit = i >> 3, 1 << (i & 7)
+            if not self.bits[byte] & bit:
+                self.bits[byte] |= bit
+                added = True
+        self.count += added
+        return added
+
+    def _positions(self, key: int) -> list[int]:
+        """
+        Provides bit positions of fingerprint, double hashing halves of
+        fingerprint mixed with SplitMix64 finalizer.
+
+        :param key: Fingerprint
+        :return: List of bit positions
+        """
+        z = (key + 0x9E3779B97F4A7C15) & MASK
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK
+        z ^= z >> 31
+        first, second = z & 0xFFFFFFFF, (z >> 32) | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
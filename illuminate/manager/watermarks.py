@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional
+
+TYPES: dict[str, type] = {
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "str": str,
+    "decimal": Decimal,
+    "datetime": datetime,
+    "date": date,
+    "time": time,
+}
+
+
+class Watermarks:
+    """
+    Watermarks class, keeps high-water marks of incremental observations in a
+    local SQLite database, so consecutive runs continue where previous ones
+    stopped.
+
+    Marks are kept by observation name as JSON of their type name and value,
+    dates and times in ISO format, so numbers, strings, datetimes and decimals
+    are restored with their type. Database is created on first access and
+    every mark is committed as soon as it is set.
+    """
+
+    def __init__(self, path: str):
+        """
+        Watermarks' __init__ method.
+
+        :param path: Path to SQLite database file
+        """
+        self._connection: Optional[sqlite3.Connection] = None
+        self.path = path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Provides connection to SQLite database, creating watermarks table if
+        it does not exist.
+
+        :return: sqlite3.Connection object
+        """
+        if not self._connection:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks "
+                "(name TEXT PRIMARY KEY, mark TEXT NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Closes connection to SQLite database if it is open.
+
+        :return: None
+        """
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def decode(data: str) -> Any:
+        """
+        Restores mark from JSON.
+
+        :param data: JSON string
+        :return: Mark
+        """
+        document = json.loads(data)
+        cls, value = TYPES[document["type"]], document["value"]
+        if cls in (date, datetime, time):
+            return cls.fromisoformat(value)  # type: ignore
+        return cls(value)
+
+    @staticmethod
+    def encode(mark: Any) -> str:
+        """
+        Serializes mark to JSON with its type name.
+
+        :param mark: Mark
+        :return: JSON string
+        :raises TypeError: If mark's type is not supported
+        """
+        for name, cls in TYPES.items():
+            if isinstance(mark, cls):
+                break
+        else:
+            raise TypeError(f"Mark of type {type(mark)} is not supported")
+        if cls in (date, datetime, time):
+            value = mark.isoformat()
+        elif cls is Decimal:
+            value = str(mark)
+        else:
+            value = cls(mark)
+        return json.dumps({"type": name, "value": value})
+
+    def get(self, name: str) -> Any:
+        """
+        Provides mark of an observation.
+
+        :param name: Observation name
+        :return: Mark or None if observation has no mark
+        """
+        row = self.connection.execute(
+            "SELECT mark FROM watermarks WHERE name = ?", (name,)
+        ).fetchone()
+        return self.decode(row[0]) if row else None
+
+    def set(self, name: str, mark: Any) -> None:
+        """
+        Stores mark of an observation.
+
+        :param name: Observation name
+        :param mark: Mark
+        :return: None
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO watermarks (name, mark) VALUES (?, ?)",
+            (name, self.encode(mark)),
+        )
+        self.connection.commit()
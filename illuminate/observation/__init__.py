@@ -2,5 +2,8 @@ from .observation import Observation
 
 from .file import FileObservation
 from .http import HTTPObservation
+from .influxdb import InfluxDBObservation
+from .sql import SQLIncrementalObservation
+from .sql import SQLKeysetObservation
 from .sql import SQLObservation
 from .http import SplashObservation
@@ -18,13 +18,13 @@ class FileObservation(Observation):
     Observation class and implements observe method.
     """
 
-    def __hash__(self) -> int:
+    def identity(self) -> str:
         """
-        FileObservation object hash value.
+        FileObservation object identity.
 
-        :return: int
+        :return: Identity string
         """
-        return hash(self.url)
+        return self.url
 
     def __init__(
         self,
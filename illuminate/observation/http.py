@@ -6,6 +6,7 @@ from typing import Any, Callable, Optional, Union
 
 from loguru import logger
 from tornado import httpclient
+from tornado.httpclient import HTTPClientError
 from tornado.httpclient import HTTPResponse
 
 from illuminate.meta.type import Result
@@ -18,15 +19,15 @@ class HTTPObservation(Observation):
     Observation class and implements observe method.
     """
 
-    def __hash__(self) -> int:
+    def identity(self) -> str:
         """
-        HTTPObservation object hash value.
+        HTTPObservation object identity.
 
-        :return: int
+        :return: Identity string
         """
         body = self.configuration.get("body")
-        method = self.configuration.get("method")
-        return hash(f"{method}|{self.url}|:{body}")
+        method = (self.configuration.get("method") or "GET").upper()
+        return f"{method}|{self.canonical or self.url}|:{body}"
 
     def __init__(
         self,
@@ -51,7 +52,10 @@ class HTTPObservation(Observation):
         super().__init__(url, xcom=xcom)
         self._allowed = allowed
         self._callback = callback
+        self.canonical: Optional[str] = None
+        self.code: Optional[int] = None
         self.configuration = kwargs
+        self.request_time: Optional[float] = None
 
     @property
     def allowed(self) -> bool:
@@ -65,6 +69,26 @@ class HTTPObservation(Observation):
                 return True
         return False
 
+    def measure(
+        self,
+        response: Optional[HTTPResponse] = None,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        """
+        Keeps response code and request time of the last request, taken from
+        response or exception raised while requesting.
+
+        :param response: HTTPResponse object
+        :param exception: Exception raised while requesting
+        :return: None
+        """
+        if not response and isinstance(exception, HTTPClientError):
+            response = exception.response
+            self.code = exception.code
+        if response:
+            self.code = response.code
+            self.request_time = response.request_time
+
     async def observe(self, *args, **kwargs) -> Union[None, Result]:
         """
         Requests data from HTTP server, passes response object to a callback
@@ -76,9 +100,11 @@ class HTTPObservation(Observation):
             response = await httpclient.AsyncHTTPClient().fetch(
                 self.url, **self.configuration
             )
+            self.measure(response)
             logger.info(f"{self}.observe() -> {response}")
             return self._callback(response, *args, **kwargs)
         except Exception as exception:
+            self.measure(exception=exception)
             logger.warning(f"{self}.observe() -> {exception}")
             return None
 
@@ -103,13 +129,13 @@ class SplashObservation(HTTPObservation):
     in Splash service URL.
     """
 
-    def __hash__(self) -> int:
+    def identity(self) -> str:
         """
-        SplashObservation object hash value.
+        SplashObservation object identity.
 
-        :return: int
+        :return: Identity string
         """
-        return hash(self.service)
+        return self.service
 
     @property
     def service(self):
@@ -149,9 +175,11 @@ class SplashObservation(HTTPObservation):
             response = await httpclient.AsyncHTTPClient().fetch(
                 self.service, **configuration
             )
+            self.measure(response)
             logger.info(f"{self}.observe() -> {response}")
             return self._callback(response, *args, **kwargs)
         except Exception as exception:
+            self.measure(exception=exception)
             logger.warning(f"{self}.observe() -> {exception}")
             return None
 
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Optional, Union
+
+from aioinflux import InfluxDBClient  # type: ignore
+from aioinflux import serialization  # type: ignore
+from loguru import logger
+
+from illuminate.meta.type import Result
+from illuminate.observation import Observation
+
+
+class InfluxDBObservation(Observation):
+    """
+    InfluxDBObservation class, reads data from InfluxDB asynchronously.
+    Inherits Observation class and implements observe method.
+
+    Query is sent with chunked response, so the callback receives an async
+    iterator of chunks instead of the whole response. Chunks are read from
+    the connection as the callback iterates over them, so query results never
+    have to be held in memory at once. Chunks are in client's output format,
+    or DataFrames if dataframe is True.
+    """
+
+    def identity(self) -> str:
+        """
+        InfluxDBObservation object identity.
+
+        :return: Identity string
+        """
+        return f"{self.url}|:{self.query}"
+
+    def __init__(
+        self,
+        query: str,
+        url: str,
+        /,
+        callback: Callable[[AsyncIterator, tuple, dict], Result],
+        chunk_size: Optional[int] = None,
+        dataframe: bool = False,
+        epoch: str = "ns",
+        xcom: Optional[Any] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        InfluxDBObservation's __init__ method.
+
+        :param query: InfluxQL query string
+        :param url: Database name in project settings
+        :param callback: Async function/method that iterates over chunks and
+        returns Result
+        :param chunk_size: Maximum number of points per chunk, InfluxDB's
+        default is used if not passed
+        :param dataframe: Parse chunks into DataFrames
+        :param epoch: Precision of returned timestamps
+        :param xcom: Cross communication object
+        """
+        super().__init__(url, xcom=xcom)
+        self._callback = callback
+        self.chunk_size = chunk_size
+        self.dataframe = dataframe
+        self.epoch = epoch
+        self.query = query
+
+    async def chunks(self, session: InfluxDBClient) -> AsyncIterator:
+        """
+        Sends query and yields response chunks as they arrive.
+
+        :param session: InfluxDBClient object
+        :return: AsyncIterator of chunks
+        """
+        chunks = await session.query(
+            self.query,
+            chunk_size=self.chunk_size,
+            chunked=True,
+            epoch=self.epoch,
+        )
+        try:
+            async for chunk in chunks:
+                if self.dataframe and isinstance(chunk, dict):
+                    chunk = serialization.dataframe.parse(chunk)
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    @asynccontextmanager
+    async def observe(
+        self, session: InfluxDBClient, *args, **kwargs
+    ) -> AsyncIterator[Union[None, Result]]:
+        """
+        Passes async iterator of query response chunks to a callback and
+        returns None or Result as a context manager. Response is released
+        once context manager exits.
+
+        :param session: InfluxDBClient object
+        :return: AsyncIterator with None or Result
+        """
+        _chunks = None
+        _items = None
+        try:
+            _chunks = self.chunks(session)
+            logger.info(f'{self}.observe(session="{session}")')
+            _items = self._callback(_chunks, *args, **kwargs)
+        except Exception as exception:
+            logger.warning(f"{self}.observe() -> {exception}")
+        try:
+            yield _items
+        finally:
+            if _chunks:
+                await _chunks.aclose()
+
+    def __repr__(self):
+        """
+        InfluxDBObservation's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return (
+            f'InfluxDBObservation("{self.query}","{self.url}",'
+            f'callback="{self._callback}")'
+        )
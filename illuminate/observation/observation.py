@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from typing import Any, Optional
 
 from illuminate.exceptions import BasicObservationException
@@ -9,19 +10,23 @@ from illuminate.interface import IObservation
 class Observation(IObservation):
     """
     Observation class, reads data from the source. Class must be inherited and
-    method observe must be implemented in a child class.
+    methods identity and observe must be implemented in a child class.
+
+    Observations are deduplicated by fingerprint, 64-bit BLAKE2b digest of
+    their identity. Unlike Python's hash of a string, it does not change
+    between processes, so it can be persisted, shared or used for sharding.
+    Fingerprint is computed once, on first call. Child classes that implement
+    __hash__ instead of identity are fingerprinted by their hash value, which
+    may differ between processes.
     """
 
-    def __hash__(self):
+    def __hash__(self) -> int:
         """
         Observation object hash value.
 
-        :return: None
-        :raises BasicObservationException:
+        :return: int
         """
-        raise BasicObservationException(
-            "Property hash must be implemented in child class"
-        )
+        return self.fingerprint()
 
     def __init__(self, url: Any, xcom: Optional[Any] = None):
         """
@@ -30,9 +35,43 @@ class Observation(IObservation):
         :param url: Data's URL
         :param xcom: Cross communication object
         """
+        self._fingerprint: Optional[int] = None
         self.url = url
         self.xcom = xcom
 
+    def fingerprint(self) -> int:
+        """
+        Provides deterministic 64-bit fingerprint of Observation's identity,
+        or hash value of Observation if child class implements __hash__
+        instead of identity.
+
+        :return: Unsigned 64-bit int
+        """
+        cls = type(self)
+        if (
+            cls.identity is Observation.identity
+            and cls.__hash__ is not Observation.__hash__
+        ):
+            return hash(self) & 0xFFFFFFFFFFFFFFFF
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(
+                self.identity().encode(), digest_size=8
+            ).digest()
+            self._fingerprint = int.from_bytes(digest, "big")
+        return self._fingerprint
+
+    def identity(self) -> str:
+        """
+        Provides string that identifies data Observation reads. Must be
+        implemented in a child class.
+
+        :return: Identity string
+        :raises BasicObservationException:
+        """
+        raise BasicObservationException(
+            "Method identity must be implemented in child class"
+        )
+
     async def observe(self, *args, **kwargs):
         """
         Reads data from the source. Must be implemented in a child class.
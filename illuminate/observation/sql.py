@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Any, Callable, Optional, Type, Union
 
+import numpy as np
+import pandas as pd
 from loguru import logger
+from sqlalchemy import and_
+from sqlalchemy import or_
+from sqlalchemy import true
 from sqlalchemy.engine.result import Result as AlchemyResult
+from sqlalchemy.engine.row import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.sql.selectable import Select
 
+from illuminate.exceptions import BasicObservationException
 from illuminate.meta.type import Result
 from illuminate.observation import Observation
 
@@ -16,23 +26,47 @@ class SQLObservation(Observation):
     """
     SQLObservation class, reads data from database asynchronously. Inherits
     Observation class and implements observe method.
+
+    If partition is passed, result is streamed with server side cursor and
+    callback receives an async iterator of lists with up to partition rows,
+    fetched while callback iterates over them. Cursor and transaction stay
+    open until stream context manager exits, so memory is bounded by the size
+    of a partition rather than the size of the result.
+
+    If partitioning is passed, Manager splits observation into a number of
+    observations reading ranges of partitioning column, which are observed
+    concurrently, each with its own connection. Like Spark's JDBC source,
+    lower and upper bounds only decide range strides and do not filter rows:
+    the first range includes values below lower bound and NULL values, and
+    the last one includes values above upper bound.
+
+    If columnar is passed, result, or each streamed partition, is passed to
+    a callback as a DataFrame ("dataframe") or a NumPy record array
+    ("records") built from fetched rows, with columns named after selected
+    columns, instead of AlchemyResult.
     """
 
-    def __hash__(self) -> int:
+    COLUMNAR = ("dataframe", "records")
+
+    def identity(self) -> str:
         """
-        SQLObservation object hash value.
+        SQLObservation object identity.
 
-        :return: int
+        :return: Identity string
         """
-        query = str(self.query)
-        return hash(f"{self.url}|:{query}")
+        return f"{self.url}|:{self.query}"
 
     def __init__(
         self,
         query: Union[Select, TextClause],
         url: str,
         /,
-        callback: Callable[[AlchemyResult, tuple, dict], Result],
+        callback: Callable[
+            [Union[AlchemyResult, AsyncIterator], tuple, dict], Result
+        ],
+        partition: Optional[int] = None,
+        partitioning: Optional[dict] = None,
+        columnar: Optional[str] = None,
         xcom: Optional[Any] = None,
         *args,
         **kwargs,
@@ -43,11 +77,26 @@ class SQLObservation(Observation):
         :param query: SQLAlchemy query object.
         :param url: Database name in project settings.
         :param callback: Async function/method that manipulates AlchemyResult
-        object and returns Result.
+        object, or async iterator of partitions if partition is passed, and
+        returns Result.
+        :param partition: Number of rows per streamed partition
+        :param partitioning: Dictionary with keys column (numeric or
+        timestamp column), lower, upper (bounds) and partitions (number of
+        ranges)
+        :param columnar: Pass result as "dataframe" or "records" instead of
+        AlchemyResult
         :param xcom: Cross communication object
+        :raises BasicObservationException:
         """
         super().__init__(url, xcom=xcom)
+        if columnar and columnar not in self.COLUMNAR:
+            raise BasicObservationException(
+                f"Columnar must be one of {self.COLUMNAR}, not {columnar}"
+            )
         self._callback = callback
+        self.columnar = columnar
+        self.partition = partition
+        self.partitioning = partitioning
         self.query = query
 
     async def observe(
@@ -65,11 +114,164 @@ class SQLObservation(Observation):
                     query = self.query
                     response = await session.execute(query)  # type: ignore
             logger.info(f'{self}.observe(session="{session}")')
-            return self._callback(response, *args, **kwargs)
+            return self._callback(self._deliver(response), *args, **kwargs)
         except Exception as exception:
             logger.warning(f"{self}.observe() -> {exception}")
             return None
 
+    def split(self) -> list[SQLObservation]:
+        """
+        Splits observation into observations of partitioning column ranges.
+
+        :return: List of SQLObservation objects
+        :raises BasicObservationException:
+        """
+        if not self.partitioning:
+            return [self]
+        if not isinstance(self.query, Select):
+            raise BasicObservationException(
+                "Only select queries can be partitioned"
+            )
+        column = self.partitioning["column"]
+        bounds = self.bounds(
+            self.partitioning["lower"],
+            self.partitioning["upper"],
+            self.partitioning["partitions"],
+        )
+        conditions = [true()]
+        if bounds:
+            conditions = [or_(column < bounds[0], column.is_(None))]
+            for i in range(1, len(bounds)):
+                conditions.append(
+                    and_(column >= bounds[i - 1], column < bounds[i])
+                )
+            conditions.append(column >= bounds[-1])
+        return [
+            SQLObservation(
+                self.query.where(condition),
+                self.url,
+                callback=self._callback,
+                partition=self.partition,
+                columnar=self.columnar,
+                xcom=self.xcom,
+            )
+            for condition in conditions
+        ]
+
+    @staticmethod
+    def bounds(lower: Any, upper: Any, partitions: int) -> list[Any]:
+        """
+        Provides boundaries between equal ranges of values from lower to
+        upper bound. Integer boundaries are rounded down and integer ranges
+        are never narrower than one.
+
+        :param lower: Lower bound, number or datetime
+        :param upper: Upper bound, number or datetime
+        :param partitions: Number of ranges
+        :return: List of partitions - 1 boundaries
+        """
+        if upper <= lower:
+            return []
+        if isinstance(lower, int) and isinstance(upper, int):
+            partitions = min(partitions, upper - lower)
+            return [
+                lower + (upper - lower) * i // partitions
+                for i in range(1, partitions)
+            ]
+        return [
+            lower + (upper - lower) * i / partitions
+            for i in range(1, partitions)
+        ]
+
+    @asynccontextmanager
+    async def stream(
+        self, session: Type[AsyncSession], *args, **kwargs
+    ) -> AsyncIterator[Union[None, Result]]:
+        """
+        Streams data from database with server side cursor, passes async
+        iterator of partitions to a callback and returns None or Result as a
+        context manager.
+
+        :return: AsyncIterator with None or Result
+        """
+        _items = None
+        async with AsyncExitStack() as stack:
+            try:
+                _session = await stack.enter_async_context(session())
+                await stack.enter_async_context(_session.begin())
+                response = await _session.stream(self.query)
+                stack.push_async_callback(response.close)
+                logger.info(f'{self}.stream(session="{_session}")')
+                partitions = response.partitions(self.partition)
+                if self.columnar:
+                    partitions = self._partitions(
+                        partitions, list(response.keys())
+                    )
+                _items = self._callback(partitions, *args, **kwargs)
+            except Exception as exception:
+                logger.warning(f"{self}.stream() -> {exception}")
+            yield _items
+
+    def _columns(
+        self, rows: list[Row], keys: list[str]
+    ) -> Union[pd.DataFrame, np.recarray]:
+        """
+        Provides rows as a DataFrame or a NumPy record array.
+
+        :param rows: List of SQLAlchemy rows
+        :param keys: Column names
+        :return: DataFrame or NumPy record array
+        """
+        frame = pd.DataFrame.from_records(rows, columns=keys)
+        if self.columnar == "records":
+            return frame.to_records(index=False)
+        return frame
+
+    def _deliver(
+        self, response: AlchemyResult
+    ) -> Union[AlchemyResult, pd.DataFrame, np.recarray]:
+        """
+        Provides object passed to a callback, response itself or its rows in
+        columnar form.
+
+        :param response: AlchemyResult object
+        :return: AlchemyResult, DataFrame or NumPy record array
+        """
+        if not self.columnar:
+            return response
+        keys = list(response.keys())
+        return self._columns(response.fetchall(), keys)
+
+    async def _partitions(
+        self, partitions: AsyncIterator, keys: list[str]
+    ) -> AsyncIterator:
+        """
+        Provides streamed partitions in columnar form.
+
+        :param partitions: AsyncIterator of lists of rows
+        :param keys: Column names
+        :return: AsyncIterator of DataFrames or NumPy record arrays
+        """
+        async for partition in partitions:
+            yield self._columns(partition, keys)
+
+    @staticmethod
+    def _value(row: Union[Row, Any], column: ColumnElement) -> Any:
+        """
+        Provides column value of a row, selected as a column or as an
+        attribute of selected model object.
+
+        :param row: SQLAlchemy row or model object
+        :param column: Column value is provided for
+        :return: Column value
+        """
+        mapping = getattr(row, "_mapping", None)
+        if mapping is None:
+            return getattr(row, column.key)  # type: ignore
+        if column in mapping:
+            return mapping[column]
+        return getattr(row[0], column.key)  # type: ignore
+
     def __repr__(self):
         """
         SQLObservation's __repr__ method.
@@ -80,3 +282,252 @@ class SQLObservation(Observation):
             f'SQLObservation("{self.query}","{self.url}",'
             f'callback="{self._callback}")'
         )
+
+
+class SQLKeysetObservation(SQLObservation):
+    """
+    SQLKeysetObservation class, reads data from database a page at a time
+    with keyset pagination. Inherits SQLObservation class and implements
+    observe method.
+
+    Each observation reads a single page of up to size rows ordered by key
+    column, starting after last key. If page is full, observation of the next
+    page is created and Manager routes it before resolving current page, so
+    pages are read by other observation workers while current page is still
+    adapted and exported. Key column must be selected by query and its values
+    must be unique.
+    """
+
+    def identity(self) -> str:
+        """
+        SQLKeysetObservation object identity.
+
+        :return: Identity string
+        """
+        return f"{self.url}|:{self.query}|:{self.key}|:{self.last}"
+
+    def __init__(
+        self,
+        query: Select,
+        url: str,
+        /,
+        callback: Callable[[AlchemyResult, tuple, dict], Result],
+        key: ColumnElement,
+        size: int = 1000,
+        last: Optional[Any] = None,
+        columnar: Optional[str] = None,
+        xcom: Optional[Any] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        SQLKeysetObservation's __init__ method.
+
+        :param query: SQLAlchemy select object
+        :param url: Database name in project settings
+        :param callback: Async function/method that manipulates AlchemyResult
+        object of a page and returns Result
+        :param key: Column page is ordered by
+        :param size: Maximum number of rows per page
+        :param last: Key of the last row of previous page, None for first page
+        :param columnar: Pass page as "dataframe" or "records" instead of
+        AlchemyResult
+        :param xcom: Cross communication object
+        """
+        super().__init__(
+            query, url, callback=callback, columnar=columnar, xcom=xcom
+        )
+        self.following: Optional[SQLKeysetObservation] = None
+        self.key = key
+        self.last = last
+        self.size = size
+
+    def page(self) -> Select:
+        """
+        Provides query of the page. Ordering of the query is replaced by key
+        column, since pages are filtered by key of the last row.
+
+        :return: SQLAlchemy select object
+        """
+        query = self.query
+        if self.last is not None:
+            query = query.where(self.key > self.last)
+        return query.order_by(None).order_by(self.key).limit(self.size)
+
+    async def observe(
+        self, session: Type[AsyncSession], *args, **kwargs
+    ) -> Union[None, Result]:
+        """
+        Reads page from database, creates observation of the next page if
+        page is full, passes response object to a callback and returns None
+        or Result.
+
+        :return: None or Result
+        """
+        try:
+            async with session() as session:  # type: ignore
+                async with session.begin():  # type: ignore
+                    response = await session.execute(  # type: ignore
+                        self.page()
+                    )
+                    frozen = response.freeze()
+            logger.info(f'{self}.observe(session="{session}")')
+            rows = frozen.data
+            if len(rows) >= self.size:
+                self.following = self.__class__(
+                    self.query,
+                    self.url,
+                    callback=self._callback,
+                    key=self.key,
+                    size=self.size,
+                    last=self._value(rows[-1], self.key),
+                    columnar=self.columnar,
+                    xcom=self.xcom,
+                )
+            return self._callback(self._deliver(frozen()), *args, **kwargs)
+        except Exception as exception:
+            logger.warning(f"{self}.observe() -> {exception}")
+            return None
+
+    def __repr__(self):
+        """
+        SQLKeysetObservation's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return (
+            f'SQLKeysetObservation("{self.query}","{self.url}",'
+            f'key="{self.key}",last={self.last},'
+            f'callback="{self._callback}")'
+        )
+
+
+class SQLIncrementalObservation(SQLObservation):
+    """
+    SQLIncrementalObservation class, reads only rows added or changed since
+    previous run. Inherits SQLObservation class and implements observe
+    method.
+
+    Rows are filtered by watermark column, such as an autoincrement id or an
+    updated_at timestamp, being greater than the mark of previous run. Marks
+    are kept by name in a local SQLite database by Manager and the highest
+    value read is stored only after observation is resolved successfully, so
+    rows of a failed run are read again. If interval is passed, Manager
+    observes it again interval seconds after each run, for as long as the
+    process is running.
+    """
+
+    def identity(self) -> str:
+        """
+        SQLIncrementalObservation object identity.
+
+        :return: Identity string
+        """
+        return f"{self.url}|:{self.query}|:{self.column}|:{self.generation}"
+
+    def __init__(
+        self,
+        query: Select,
+        url: str,
+        /,
+        callback: Callable[[AlchemyResult, tuple, dict], Result],
+        column: ColumnElement,
+        name: Optional[str] = None,
+        interval: Optional[float] = None,
+        columnar: Optional[str] = None,
+        xcom: Optional[Any] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        SQLIncrementalObservation's __init__ method.
+
+        :param query: SQLAlchemy select object
+        :param url: Database name in project settings
+        :param callback: Async function/method that manipulates AlchemyResult
+        object of new rows and returns Result
+        :param column: Watermark column, selected by query
+        :param name: Name mark is kept by, derived from url, column and query
+        if not passed
+        :param interval: Number of seconds between runs, observed once if not
+        passed
+        :param columnar: Pass new rows as "dataframe" or "records" instead of
+        AlchemyResult
+        :param xcom: Cross communication object
+        """
+        super().__init__(
+            query, url, callback=callback, columnar=columnar, xcom=xcom
+        )
+        self.column = column
+        self.generation = 0
+        self.high: Optional[Any] = None
+        self.interval = interval
+        self.mark: Optional[Any] = None
+        self.name = name or f"{url}:{column}:{query}"
+
+    def increment(self) -> Select:
+        """
+        Provides query of rows beyond the mark.
+
+        :return: SQLAlchemy select object
+        """
+        query = self.query
+        if self.mark is not None:
+            query = query.where(self.column > self.mark)
+        return query.order_by(self.column)
+
+    async def observe(
+        self, session: Type[AsyncSession], *args, **kwargs
+    ) -> Union[None, Result]:
+        """
+        Reads rows beyond the mark from database, keeps the highest watermark
+        value read, passes response object to a callback and returns None or
+        Result.
+
+        :return: None or Result
+        """
+        try:
+            async with session() as session:  # type: ignore
+                async with session.begin():  # type: ignore
+                    response = await session.execute(  # type: ignore
+                        self.increment()
+                    )
+                    frozen = response.freeze()
+            logger.info(f'{self}.observe(session="{session}")')
+            values = (self._value(i, self.column) for i in frozen.data)
+            self.high = max((i for i in values if i is not None), default=None)
+            return self._callback(self._deliver(frozen()), *args, **kwargs)
+        except Exception as exception:
+            logger.warning(f"{self}.observe() -> {exception}")
+            return None
+
+    def poll(self) -> SQLIncrementalObservation:
+        """
+        Provides observation of the next run.
+
+        :return: SQLIncrementalObservation object
+        """
+        observation = self.__class__(
+            self.query,
+            self.url,
+            callback=self._callback,
+            column=self.column,
+            name=self.name,
+            interval=self.interval,
+            columnar=self.columnar,
+            xcom=self.xcom,
+        )
+        observation.generation = self.generation + 1
+        return observation
+
+    def __repr__(self):
+        """
+        SQLIncrementalObservation's __repr__ method.
+
+        :return: String representation of an instance
+        """
+        return (
+            f'SQLIncrementalObservation("{self.query}","{self.url}",'
+            f'column="{self.column}",mark={self.mark},'
+            f'callback="{self._callback}")'
+        )
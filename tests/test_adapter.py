@@ -15,3 +15,28 @@ class TestAdapter:
         """
         adapter = Adapter()
         adapter.adapt(None)
+
+    @pytest.mark.asyncio
+    async def test_not_implemented_adapt_batch(self):
+        """
+        Given: Adapter class is not inherited and instantiated
+        When: awaiting adapt_batch method
+        Expected: BasicAdapterException is raised
+        """
+        adapter = Adapter()
+        with pytest.raises(BasicAdapterException):
+            await adapter.adapt_batch([])
+
+    def test_batched(self):
+        """
+        Given: Adapter class is inherited with adapt_batch implemented
+        When: Checking if Adapter objects are batched
+        Expected: Only Adapter implementing adapt_batch is batched
+        """
+
+        class AdapterBatched(Adapter):
+            async def adapt_batch(self, findings, *args, **kwargs):
+                yield findings
+
+        assert AdapterBatched().batched
+        assert not Adapter().batched
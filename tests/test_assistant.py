@@ -3,6 +3,7 @@ import shutil
 
 import pytest
 from alembic.operations import Operations
+from loguru import logger
 
 from illuminate.exceptions import BasicManagerException
 from illuminate.manager import Assistant
@@ -190,6 +191,31 @@ class TestAssistantClass(Test):
             assert Assistant._provide_sessions()["main"]
             assert Assistant._provide_sessions()["measurements"]
 
+    def test__provide_sessions_engine_successfully(self):
+        """
+        Given: Current directory is a project directory with engine section
+        of a pool smaller than observations concurrency
+        When: Calling Assistant._provide_sessions
+        Expected: Engine is created with pool settings and warning is logged
+        """
+        messages = []
+        with self.path():
+            name = "example"
+            Manager.project_setup(name, ".")
+            settings = Assistant._provide_settings()
+            engine = settings.DB["main"]["engine"]
+            engine.update({"max_overflow": 0, "pool_size": 2})
+            handler = logger.add(messages.append, level="WARNING")
+            try:
+                session = Assistant._provide_sessions()["main"]
+            finally:
+                logger.remove(handler)
+            pool = session.kw["bind"].pool
+            assert pool.size() == 2
+            assert pool._max_overflow == 0
+            assert pool._pre_ping
+            assert any("6 observations workers" in i for i in messages)
+
     @pytest.mark.xfail(raises=BasicManagerException)
     def test__provide_settings_unsuccessfully(self):
         """
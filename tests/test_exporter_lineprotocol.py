@@ -0,0 +1,128 @@
+import gzip
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from illuminate.exporter import LineProtocol
+
+
+class TestLineProtocol:
+    def test_frame_successfully(self):
+        """
+        Given: DataFrame with DatetimeIndex, tag and typed field columns
+        When: Encoding DataFrame
+        Expected: Tags are sorted, null fields are omitted and fields are
+        encoded by type
+        """
+        frame = pd.DataFrame(
+            {
+                "url": ["a b", "c,d"],
+                "host": ["h", "h"],
+                "count": [1, 2],
+                "load": [0.5, np.nan],
+                "ok": [True, False],
+                "title": ['say "hi"', "x"],
+            },
+            index=pd.to_datetime([1, 2], utc=True),
+        )
+        payload = LineProtocol.serialize(
+            frame, "page view", ["url", "host"], env="test"
+        )
+        assert payload.decode().split("\n") == [
+            "page\\ view,env=test,host=h,url=a\\ b count=1i,load=0.5,ok=true,"
+            'title="say \\"hi\\"" 1',
+            'page\\ view,env=test,host=h,url=c\\,d count=2i,ok=false,title="x"'
+            " 2",
+        ]
+
+    @pytest.mark.xfail(raises=ValueError)
+    def test_frame_unsuccessfully(self):
+        """
+        Given: DataFrame without DatetimeIndex
+        When: Encoding DataFrame
+        Expected: ValueError is raised
+        """
+        LineProtocol.serialize(pd.DataFrame({"value": [1]}), "m")
+
+    def test_mappings_successfully(self):
+        """
+        Given: Homogeneous dictionaries with null tag and field values
+        When: Encoding dictionaries
+        Expected: Null tags and fields are omitted and integer field stays
+        integer
+        """
+        points = [
+            {
+                "measurement": "m",
+                "time": "2024-01-01T00:00:00Z",
+                "tags": {"host": None if i else "h"},
+                "fields": {"count": None if i == 1 else i, "value": 1.5},
+            }
+            for i in range(3)
+        ]
+        assert LineProtocol.serialize(points).decode().split("\n") == [
+            "m,host=h count=0i,value=1.5 1704067200000000000",
+            "m value=1.5 1704067200000000000",
+            "m count=2i,value=1.5 1704067200000000000",
+        ]
+
+    def test_mappings_heterogeneous_successfully(self):
+        """
+        Given: Dictionaries with different fields
+        When: Encoding dictionaries
+        Expected: Dictionaries are encoded one by one
+        """
+        points = [
+            {"measurement": "m", "fields": {"a": 1}},
+            {"measurement": "m", "fields": {"b": 2.0}},
+            {"measurement": "m", "fields": {}},
+        ]
+        assert LineProtocol.serialize(points) == b"m a=1i \nm b=2.0 "
+
+    def test_compress_successfully(self):
+        """
+        Given: Line protocol payload
+        When: Compressing payload
+        Expected: Payload is restored by gzip
+        """
+        payload = b"m value=1i\n" * 100
+        compressed = LineProtocol.compress(payload)
+        assert len(compressed) < len(payload)
+        assert gzip.decompress(compressed) == payload
+
+    @pytest.mark.asyncio
+    async def test_write_compressed_successfully(self, mocker):
+        """
+        Given: InfluxDB client with HTTP session
+        When: Writing payload with compression level
+        Expected: Compressed payload is posted with gzip content encoding
+        """
+        response = mocker.MagicMock(status=204)
+        context = mocker.MagicMock()
+        context.__aenter__.return_value = response
+        session = mocker.MagicMock()
+        session.post.return_value = context
+        client = SimpleNamespace(
+            _session=session,
+            db="test",
+            url="http://localhost:8086/{endpoint}",
+        )
+        assert await LineProtocol.write(client, b"m v=1i", 1, rp="short")
+        args, kwargs = session.post.call_args
+        assert args == ("http://localhost:8086/write",)
+        assert gzip.decompress(kwargs["data"]) == b"m v=1i"
+        assert kwargs["headers"] == {"Content-Encoding": "gzip"}
+        assert kwargs["params"] == {"db": "test", "rp": "short"}
+
+    @pytest.mark.asyncio
+    async def test_write_compressed_fallback(self, mocker):
+        """
+        Given: InfluxDB client without HTTP session attributes
+        When: Writing payload with compression level
+        Expected: Payload is written uncompressed with client's write method
+        """
+        client = SimpleNamespace(write=mocker.AsyncMock(return_value=True))
+        assert await LineProtocol.write(client, b"m v=1i", 1, rp="short")
+        client.write.assert_awaited_once_with(b"m v=1i", rp="short")
@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+
+import pytest
+from pandas import DataFrame
+from pandas import NaT
+from pandas import Timestamp
+
+from illuminate.exceptions import BasicExporterException
+from illuminate.exporter import PostgresCopyExporter
+from illuminate.manager import Manager
+from tests.unit import Test
+
+
+class TestExporterPostgresCopy(Test):
+    def test_records_successfully(self):
+        """
+        Given: Rows as tuples, dictionaries and DataFrame
+        When: Turning rows into records
+        Expected: Same records and columns are returned
+        """
+        columns = ["title", "url"]
+        rows = [("A", "https://a.com"), ("B", "https://b.com")]
+        dictionaries = [dict(zip(columns, row)) for row in rows]
+        frame = DataFrame(rows, columns=columns)
+        exporter = PostgresCopyExporter(rows, "example", columns=columns)
+        assert exporter.records() == (columns, rows)
+        exporter = PostgresCopyExporter(dictionaries, "example")
+        assert exporter.records() == (columns, rows)
+        exporter = PostgresCopyExporter(frame, "example")
+        assert exporter.records() == (columns, rows)
+        exporter = PostgresCopyExporter(frame, "example", columns=["url"])
+        assert exporter.records() == (["url"], [(i[1],) for i in rows])
+
+    def test_records_missing_successfully(self):
+        """
+        Given: DataFrame with missing values in float, integer, datetime and
+        string columns
+        When: Turning rows into records
+        Expected: Missing values are None, integers are not turned into floats
+        and values are Python objects
+        """
+        frame = DataFrame(
+            {
+                "count": [1, None],
+                "ratio": [0.5, float("nan")],
+                "created": [Timestamp("2024-01-01"), NaT],
+                "title": ["A", None],
+            }
+        )
+        columns, records = PostgresCopyExporter(frame, "example").records()
+        assert columns == ["count", "ratio", "created", "title"]
+        assert records == [
+            (1, 0.5, Timestamp("2024-01-01"), "A"),
+            (None, None, None, None),
+        ]
+        assert type(records[0][0]) is int
+        assert type(records[0][1]) is float
+
+    def test_target_successfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Passing table as name or model class
+        Expected: Table and schema names are returned
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            from models.example import ModelExample
+
+            exporter = PostgresCopyExporter([], ModelExample)
+            assert exporter.target() == ("example", None)
+            exporter = PostgresCopyExporter([], "example", schema="public")
+            assert exporter.target() == ("example", "public")
+
+    @pytest.mark.asyncio
+    async def test_write_successfully(self, mocker):
+        """
+        Given: Session connected to Postgres database
+        When: Writing rows
+        Expected: Records are copied through driver connection
+        """
+        driver = SimpleNamespace(copy_records_to_table=mocker.AsyncMock())
+        raw = SimpleNamespace(driver_connection=driver)
+        connection = SimpleNamespace(
+            dialect=SimpleNamespace(name="postgresql"),
+            get_raw_connection=mocker.AsyncMock(return_value=raw),
+        )
+        session = SimpleNamespace(
+            connection=mocker.AsyncMock(return_value=connection)
+        )
+        rows = [{"title": "A", "url": "https://a.com"}]
+        exporter = PostgresCopyExporter(rows, "example", schema="public")
+        await exporter.write(session)
+        driver.copy_records_to_table.assert_awaited_once_with(
+            "example",
+            records=[("A", "https://a.com")],
+            columns=["title", "url"],
+            schema_name="public",
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.xfail(raises=BasicExporterException)
+    async def test_export_unsuccessfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Exporting rows to database other than Postgres
+        Expected: BasicExporterException is raised
+        """
+        with self.path() as path:
+            Manager.project_setup("example", ".")
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            exporter = PostgresCopyExporter([("A",)], "example", ["title"])
+            await exporter.export(self.session_async)
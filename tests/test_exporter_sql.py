@@ -4,7 +4,9 @@ import os
 import pytest
 
 from illuminate.exceptions import BasicExporterException
+from illuminate.exporter import SQLBulkExporter
 from illuminate.exporter import SQLExporter
+from illuminate.exporter import SQLUpsertExporter
 from illuminate.manager import Manager
 from tests.unit import Test
 
@@ -62,3 +64,139 @@ class TestExporterSQL(Test):
             )
             assert query[0].title == title
             assert query[0].url == url
+
+
+class TestExporterSQLBulk(Test):
+    @pytest.mark.asyncio
+    async def test_export_models_successfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Exporting models with different sets of attributes in bulk
+        Expected: Data is placed in database and defaults are applied
+        """
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            models = [
+                ModelExample(load_time=1.0, title="A", url="https://a.com"),
+                ModelExample(title="B", url="https://b.com"),
+                ModelExample(load_time=3.0, title="C", url="https://c.com"),
+            ]
+            exporter = SQLBulkExporter(models=models)
+            assert len(exporter.rows()) == 2
+            await exporter.export(self.session_async)
+            query = self.session.query(ModelExample).all()
+            assert sorted(i.title for i in query) == ["A", "B", "C"]
+            assert len({i.id for i in query}) == 3
+
+    @pytest.mark.asyncio
+    async def test_export_dictionaries_successfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Exporting dictionaries in bulk with model class as table
+        Expected: Data is placed in database
+        """
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            rows = [
+                {"load_time": float(i), "title": f"{i}", "url": f"{i}"}
+                for i in range(100)
+            ]
+            exporter = SQLBulkExporter(models=rows, table=ModelExample)
+            await exporter.export(self.session_async)
+            assert self.session.query(ModelExample).count() == 100
+
+    @pytest.mark.asyncio
+    @pytest.mark.xfail(raises=BasicExporterException)
+    async def test_export_dictionaries_unsuccessfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Exporting dictionaries in bulk without table
+        Expected: BasicExporterException is raised
+        """
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            exporter = SQLBulkExporter(models=[{"title": "A"}])
+            await exporter.export(self.session_async)
+
+
+class TestExporterSQLUpsert(Test):
+    @pytest.mark.asyncio
+    async def test_export_successfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Upserting rows twice with the same keys
+        Expected: Rows are inserted once and updated with the last values
+        """
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            rows = [{"id": i, "title": "A", "url": f"{i}"} for i in range(10)]
+            exporter = SQLUpsertExporter(rows, ["id"], table=ModelExample)
+            await exporter.export(self.session_async)
+            rows = [{"id": i, "title": "B", "url": f"{i}"} for i in range(5)]
+            rows.append({"id": 0, "title": "C", "url": "0"})
+            exporter = SQLUpsertExporter(
+                rows, ["id"], table=ModelExample, update=["title"]
+            )
+            await exporter.export(self.session_async)
+            query = self.session.query(ModelExample).order_by("id").all()
+            assert len(query) == 10
+            assert [i.title for i in query] == ["C"] + ["B"] * 4 + ["A"] * 5
+
+    @pytest.mark.asyncio
+    async def test_export_nothing_to_update_successfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Upserting existing models with no columns to update
+        Expected: Existing rows are left intact
+        """
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            models = [ModelExample(id=1, title="A", url="https://a.com")]
+            await SQLUpsertExporter(models, ["id"]).export(self.session_async)
+            models = [ModelExample(id=1, title="B", url="https://b.com")]
+            exporter = SQLUpsertExporter(models, ["id"], update=[])
+            await exporter.export(self.session_async)
+            query = self.session.query(ModelExample).all()
+            assert [i.title for i in query] == ["A"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.xfail(raises=BasicExporterException)
+    async def test_export_unsuccessfully(self):
+        """
+        Given: Current directory is a project directory
+        When: Upserting rows missing keys columns
+        Expected: BasicExporterException is raised
+        """
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            rows = [{"title": "A", "url": "https://a.com"}]
+            exporter = SQLUpsertExporter(rows, ["id"], table=ModelExample)
+            await exporter.export(self.session_async)
@@ -3,16 +3,28 @@ import io
 import math
 import os
 from os import walk
+from types import SimpleNamespace
 
 import pytest
 from sqlalchemy import inspect
+from tornado import gen
+from tornado.httpclient import AsyncHTTPClient
 from tornado.httpclient import HTTPRequest
 from tornado.httpclient import HTTPResponse
+from tornado.ioloop import IOLoop
+from tornado.simple_httpclient import SimpleAsyncHTTPClient
 
+from illuminate.adapter import Adapter
 from illuminate.common import FILES
 from illuminate.exceptions import BasicManagerException
+from illuminate.exporter import InfluxDBExporter
+from illuminate.exporter import SQLExporter
 from illuminate.manager import Assistant
 from illuminate.manager import Manager
+from illuminate.manager.manager import WORKER
+from illuminate.observation import FileObservation
+from illuminate.observer import Finding
+from illuminate.observer import Observer
 from tests.unit import Test
 
 
@@ -213,3 +225,532 @@ class TestManagerObserveCommandGroup(Test):
             assert len(query) == 1
             assert query[0].url == "https://example.com"
             assert query[0].title == "Example"
+
+
+class TestManagerHTTPClient(Test):
+    def test_configure_http_client_successfully(self):
+        """
+        Given: Current working directory is already configured project with
+        HTTP client max_clients set
+        When: Manager configures HTTP client
+        Expected: HTTP client uses configured implementation and limits
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            configuration = context["settings"].OBSERVATION_CONFIGURATION
+            configuration["client"]["max_clients"] = 32
+            manager = Manager(**context, sessions={})
+            try:
+                manager._Manager__configure_http_client()
+                client = AsyncHTTPClient(force_instance=True)
+                assert isinstance(client, SimpleAsyncHTTPClient)
+                assert client.max_clients == 32
+                client.close()
+            finally:
+                AsyncHTTPClient.configure(None)
+
+    def test_configure_http_client_fallback(self):
+        """
+        Given: Current working directory is already configured project with
+        unsupported HTTP client implementation
+        When: Manager configures HTTP client
+        Expected: HTTP client falls back to simple implementation
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            configuration = context["settings"].OBSERVATION_CONFIGURATION
+            configuration["client"]["implementation"] = "unknown"
+            manager = Manager(**context, sessions={})
+            try:
+                manager._Manager__configure_http_client()
+                client = AsyncHTTPClient(force_instance=True)
+                assert isinstance(client, SimpleAsyncHTTPClient)
+                client.close()
+            finally:
+                AsyncHTTPClient.configure(None)
+
+
+class TestManagerRouter(Test):
+    @pytest.mark.asyncio
+    async def test_router_rejects_finding_from_adaptation(self):
+        """
+        Given: Manager is initialized
+        When: Routing Findings yielded by observation and adaptation stages
+        Expected: Only Finding yielded by observation stage is queued
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={})
+            router = manager._Manager__router
+            await router(Finding(), "observation")
+            await router(Finding(), "adaptation")
+            assert manager._Manager__adapt_queue.qsize() == 1
+
+
+class ObserverFanOut(Observer):
+    """Test Observer yielding Observations of all files from the first."""
+
+    NAME = "fan-out"
+
+    def __init__(self, manager=None):
+        super().__init__(manager=manager)
+        self.initial_observations = [
+            FileObservation("0.txt", callback=self.observe)
+        ]
+
+    async def observe(self, *args, **kwargs):
+        for i in range(1, 20):
+            yield FileObservation(f"{i}.txt", callback=self.read)
+
+    async def read(self, file, *args, **kwargs):
+        await file.read()
+
+
+class TestManagerAdmission(Test):
+    @pytest.mark.asyncio
+    async def test_observe_start_bounded_successfully(self):
+        """
+        Given: Single observation worker and observe queue of a single item
+        When: Observation yields more Observations than queue holds
+        Expected: Worker is not waiting for itself and all files are observed
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            for i in range(20):
+                with open(f"{i}.txt", "w") as file:
+                    file.write(str(i))
+            context = Assistant.provide_context(sessions=False)
+            settings = context["settings"]
+            settings.CONCURRENCY["observations"] = 1
+            settings.QUEUE_CONFIGURATION["maxsize"]["observations"] = 1
+            context["observers"] = [ObserverFanOut]
+            manager = Manager(**context, sessions={})
+            await asyncio.wait_for(manager._observe_start(), 10)
+            assert len(manager.observed) == 20
+
+    @pytest.mark.asyncio
+    async def test_observe_start_frontier_successfully(self):
+        """
+        Given: Frontier holding two Observations in memory
+        When: Observation yields more Observations than memory holds
+        Expected: All files are observed and frontier database is removed
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            for i in range(20):
+                with open(f"{i}.txt", "w") as file:
+                    file.write(str(i))
+            context = Assistant.provide_context(sessions=False)
+            settings = context["settings"]
+            settings.QUEUE_CONFIGURATION["frontier"]["threshold"] = 2
+            settings.QUEUE_CONFIGURATION["maxsize"]["observations"] = 0
+            context["observers"] = [ObserverFanOut]
+            manager = Manager(**context, sessions={})
+            await asyncio.wait_for(manager._observe_start(), 10)
+            assert len(manager.observed) == 20
+            assert not os.path.exists("frontier.db")
+
+    @pytest.mark.asyncio
+    async def test_admit_adaptation_successfully(self):
+        """
+        Given: Observe queue holding maxsize Observations
+        When: Routing Observation yielded by adaptation stage
+        Expected: Observation is queued above maxsize without waiting
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            settings = context["settings"]
+            settings.QUEUE_CONFIGURATION["maxsize"]["observations"] = 1
+            manager = Manager(**context, sessions={})
+            router = manager._Manager__router
+            await router(FileObservation("a", callback=print), "start")
+            await asyncio.wait_for(
+                router(FileObservation("b", callback=print), "adaptation"), 1
+            )
+            assert manager._Manager__observe_queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_admit_blocked_per_worker_successfully(self):
+        """
+        Given: Two observation workers and observe queue holding maxsize
+        Observations
+        When: Routing Observations from two coroutines of the same worker and
+        from a poll
+        Expected: Worker is counted as blocked once, poll is not counted and
+        Observations wait for queue
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            settings = context["settings"]
+            settings.CONCURRENCY["observations"] = 2
+            settings.QUEUE_CONFIGURATION["maxsize"]["observations"] = 1
+            manager = Manager(**context, sessions={})
+            router = manager._Manager__router
+            await router(FileObservation("a", callback=print), "start")
+            token = WORKER.set(0)
+            waiting = [
+                asyncio.ensure_future(
+                    router(FileObservation(i, callback=print), "observation")
+                )
+                for i in ("b", "c")
+            ]
+            WORKER.reset(token)
+            waiting.append(
+                asyncio.ensure_future(
+                    router(FileObservation("d", callback=print), "poll")
+                )
+            )
+            await gen.sleep(0.01)
+            assert manager._Manager__blocked == {0: 2}
+            assert manager._Manager__observe_queue.qsize() == 1
+            for _ in range(4):
+                await manager._Manager__observe_queue.get()
+            await asyncio.wait_for(asyncio.gather(*waiting), 1)
+            assert manager._Manager__blocked == {}
+
+
+class FindingParent(Finding):
+    """Test Finding."""
+
+
+class FindingChild(FindingParent):
+    """Test Finding inheriting FindingParent."""
+
+
+class AdapterParent(Adapter):
+    """Test Adapter subscribed to FindingParent."""
+
+    priority = 1
+    subscribers = (FindingParent,)
+
+
+class AdapterChild(Adapter):
+    """Test Adapter subscribed to FindingChild."""
+
+    priority = 2
+    subscribers = (FindingChild,)
+
+
+class TestManagerDispatch(Test):
+    @pytest.mark.asyncio
+    async def test_subscribed_resolved_through_mro(self):
+        """
+        Given: Adapters are subscribed to parent and child Finding classes
+        When: Manager resolves Adapters subscribed to Finding classes
+        Expected: Child Finding gets both Adapters ordered by priority, while
+        parent and unrelated Findings get only matching Adapters
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            context["adapters"] = [AdapterParent, AdapterChild]
+            context["observers"] = []
+            manager = Manager(**context, sessions={})
+            manager.adapters.sort(key=lambda x: x.priority, reverse=True)
+            await manager._Manager__start()
+            subscribed = manager._Manager__subscribed
+            child = [type(i) for i in subscribed(FindingChild)]
+            parent = [type(i) for i in subscribed(FindingParent)]
+            assert child == [AdapterChild, AdapterParent]
+            assert parent == [AdapterParent]
+            assert subscribed(Finding) == []
+            assert subscribed(FindingChild) is subscribed(FindingChild)
+
+
+class AdapterSlow(Adapter):
+    """Test Adapter that takes time to adapt FindingParent."""
+
+    concurrent = True
+    priority = 3
+    subscribers = (FindingParent,)
+    events: list = []
+
+    async def adapt(self, finding, *args, **kwargs):
+        self.events.append(f"{self.__class__.__name__}:start")
+        await gen.sleep(0.1)
+        self.events.append(f"{self.__class__.__name__}:end")
+        return
+        yield
+
+
+class AdapterSlowToo(AdapterSlow):
+    """Test Adapter that takes time to adapt FindingParent."""
+
+
+class AdapterSequential(AdapterSlow):
+    """Test Adapter that adapts FindingParent in sequence."""
+
+    concurrent = False
+    priority = 1
+
+
+class AdapterLimited(AdapterSlow):
+    """Test Adapter that adapts one FindingParent at the time."""
+
+    concurrency = 1
+
+
+class TestManagerConcurrentAdaptation(Test):
+    @pytest.mark.asyncio
+    async def test_adaptation_concurrent_and_sequential(self):
+        """
+        Given: Two concurrent and one sequential Adapter with lower priority
+        are subscribed to the same Finding
+        When: Manager adapts Finding
+        Expected: Concurrent Adapters run at the same time, sequential Adapter
+        starts after both have finished
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            context["adapters"] = [
+                AdapterSequential,
+                AdapterSlow,
+                AdapterSlowToo,
+            ]
+            context["observers"] = []
+            manager = Manager(**context, sessions={})
+            manager.adapters.sort(key=lambda x: x.priority, reverse=True)
+            await manager._Manager__start()
+            AdapterSlow.events.clear()
+            start = IOLoop.current().time()
+            await manager._Manager__adaptation(FindingParent())
+            elapsed = IOLoop.current().time() - start
+            assert AdapterSlow.events[:2] == [
+                "AdapterSlow:start",
+                "AdapterSlowToo:start",
+            ]
+            assert set(AdapterSlow.events[2:4]) == {
+                "AdapterSlow:end",
+                "AdapterSlowToo:end",
+            }
+            assert AdapterSlow.events[4:] == [
+                "AdapterSequential:start",
+                "AdapterSequential:end",
+            ]
+            assert elapsed >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_adaptation_concurrency_limit(self):
+        """
+        Given: Concurrent Adapter has concurrency of 1
+        When: Manager adapts two Findings at the same time
+        Expected: Adapter adapts them one after the other
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            context["adapters"] = [AdapterLimited]
+            context["observers"] = []
+            manager = Manager(**context, sessions={})
+            await manager._Manager__start()
+            AdapterSlow.events.clear()
+            adaptation = manager._Manager__adaptation
+            await gen.multi(
+                [adaptation(FindingParent()), adaptation(FindingParent())]
+            )
+            assert AdapterSlow.events == [
+                "AdapterLimited:start",
+                "AdapterLimited:end",
+                "AdapterLimited:start",
+                "AdapterLimited:end",
+            ]
+
+
+class AdapterBatched(Adapter):
+    """Test Adapter that adapts batches of FindingParent."""
+
+    priority = 1
+    subscribers = (FindingParent,)
+    batches: list = []
+
+    async def adapt_batch(self, findings, *args, **kwargs):
+        self.batches.append(findings)
+        return
+        yield
+
+
+class AdapterBatchedFirst(AdapterBatched):
+    """Test Adapter that adapts batches of FindingParent first."""
+
+    priority = 2
+
+
+class AdapterBatchedLast(AdapterBatched):
+    """Test Adapter that adapts batches of FindingParent last."""
+
+    async def adapt_batch(self, findings, *args, **kwargs):
+        AdapterSlow.events.append(f"{self.__class__.__name__}:batch")
+        return
+        yield
+
+
+class TestManagerBatchAdaptation(Test):
+    @pytest.mark.asyncio
+    async def test_adaptation_batch(self):
+        """
+        Given: Adapter implementing adapt_batch is subscribed to Finding and
+        batch size is 2
+        When: Manager adapts 3 Findings taken from adapt queue
+        Expected: Findings are adapted in batches of up to 2, and adapt queue
+        is joined once all of them are adapted
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            context["adapters"] = [AdapterBatched]
+            context["observers"] = []
+            context["settings"].ADAPTATION_CONFIGURATION["batch"] = {
+                "interval": 0.05,
+                "size": 2,
+            }
+            manager = Manager(**context, sessions={})
+            await manager._Manager__start()
+            AdapterBatched.batches.clear()
+            queue = manager._Manager__adapt_queue
+            worker = gen.convert_yielded(manager._Manager__adapt())
+            findings = [FindingParent() for _ in range(3)]
+            for finding in findings:
+                await queue.put(finding)
+            await queue.join()
+            await queue.put(None)
+            await worker
+            assert AdapterBatched.batches == [findings[:2], findings[2:]]
+
+    @pytest.mark.asyncio
+    async def test_adaptation_batch_ordered(self):
+        """
+        Given: Adapter implementing adapt_batch is subscribed to Finding with
+        lower priority than concurrent Adapter
+        When: Manager adapts Finding
+        Expected: Finding is adapted by concurrent Adapter before its batch is
+        adapted
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            context["adapters"] = [AdapterBatchedLast, AdapterSlow]
+            context["observers"] = []
+            context["settings"].ADAPTATION_CONFIGURATION["batch"] = {
+                "interval": 0.05,
+                "size": 1,
+            }
+            manager = Manager(**context, sessions={})
+            manager.adapters.sort(key=lambda x: x.priority, reverse=True)
+            await manager._Manager__start()
+            AdapterSlow.events.clear()
+            queue = manager._Manager__adapt_queue
+            worker = gen.convert_yielded(manager._Manager__adapt())
+            await queue.put(FindingParent())
+            await queue.join()
+            await queue.put(None)
+            await worker
+            assert AdapterSlow.events == [
+                "AdapterSlow:start",
+                "AdapterSlow:end",
+                "AdapterBatchedLast:batch",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_adaptation_batch_ordered_unsuccessfully(self):
+        """
+        Given: Adapter implementing adapt_batch is subscribed to Finding with
+        higher priority than sequential Adapter
+        When: Manager starts
+        Expected: BasicManagerException is raised
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            context["adapters"] = [AdapterSequential, AdapterBatchedFirst]
+            context["observers"] = []
+            manager = Manager(**context, sessions={})
+            manager.adapters.sort(key=lambda x: x.priority, reverse=True)
+            with pytest.raises(BasicManagerException):
+                await manager._Manager__start()
+
+
+class TestManagerBatchExportation(Test):
+    @pytest.mark.asyncio
+    async def test_export_sql_batch(self):
+        """
+        Given: SQL export batching is configured and one of three SQLExporters
+        violates table's constraint
+        When: Manager exports SQLExporters taken from export queue
+        Expected: Valid SQLExporters are committed in a single transaction,
+        while failed one is isolated
+        """
+        with self.path() as path:
+            Manager.project_setup("example", ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            context = Assistant.provide_context(sessions=False)
+            context["settings"].EXPORTATION_CONFIGURATION["sql"]["batch"] = {
+                "interval": 0.05,
+                "size": 10,
+            }
+            manager = Manager(**context, sessions={"main": self.session_async})
+            exporters = [
+                SQLExporter(models=[ModelExample(id=1, url="1")]),
+                SQLExporter(models=[ModelExample(id=1, url="2")]),
+                SQLExporter(models=[ModelExample(id=2, url="3")]),
+            ]
+            queue = manager._Manager__export_queue
+            worker = gen.convert_yielded(manager._Manager__export())
+            for exporter in exporters:
+                exporter.name = "main"
+                await queue.put(exporter)
+            await queue.join()
+            await queue.put(None)
+            await worker
+            query = self.session.query(ModelExample).all()
+            assert [i.url for i in query] == ["1", "3"]
+            assert manager.exported == {exporters[0], exporters[2]}
+
+    @pytest.mark.asyncio
+    async def test_export_influxdb_batch(self, mocker):
+        """
+        Given: InfluxDB export batching is configured with size of 3 points
+        When: Manager exports InfluxDBExporters with two destinations
+        Expected: Points are written in one request per destination, on size
+        and on interval
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            context["settings"].EXPORTATION_CONFIGURATION["influxdb"][
+                "batch"
+            ] = {"interval": 0.05, "limit": 1024, "size": 3}
+            context["settings"].EXPORTATION_CONFIGURATION["influxdb"][
+                "gzip"
+            ] = None
+            session = SimpleNamespace(write=mocker.AsyncMock())
+            manager = Manager(**context, sessions={"measurements": session})
+            point = {"measurement": "m", "fields": {"value": 1}}
+            exporters = [
+                InfluxDBExporter(points=[point, point]),
+                InfluxDBExporter(points=point, rp="short"),
+                InfluxDBExporter(points=point, url="1"),
+            ]
+            queue = manager._Manager__export_queue
+            worker = gen.convert_yielded(manager._Manager__export())
+            for exporter in exporters:
+                exporter.name = "measurements"
+                await queue.put(exporter)
+            await asyncio.sleep(0)
+            assert session.write.await_count == 1
+            await queue.join()
+            await queue.put(None)
+            await worker
+            assert session.write.await_args_list == [
+                mocker.call(b"m value=1i\nm value=1i\nm,url=1 value=1i"),
+                mocker.call(b"m value=1i", rp="short"),
+            ]
+            assert manager.exported == set(exporters)
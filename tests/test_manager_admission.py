@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from tornado import queues
+
+from illuminate.manager import AdmissionQueue
+from illuminate.manager import Memory
+
+
+class TestAdmissionQueue:
+    @pytest.mark.asyncio
+    async def test_force_successfully(self):
+        """
+        Given: AdmissionQueue holding maxsize items
+        When: Forcing another item
+        Expected: Item is put above maxsize, while put_nowait still raises
+        """
+        queue = AdmissionQueue(1)
+        await queue.put(1)
+        queue.force(2)
+        assert queue.qsize() == 2
+        assert queue.full()
+        with pytest.raises(queues.QueueFull):
+            queue.put_nowait(3)
+
+    @pytest.mark.asyncio
+    async def test_put_waits_successfully(self):
+        """
+        Given: AdmissionQueue holding maxsize items
+        When: Putting another item
+        Expected: Producer waits until consumer takes an item
+        """
+        queue = AdmissionQueue(1)
+        await queue.put(1)
+        put = asyncio.ensure_future(queue.put(2))
+        await asyncio.sleep(0)
+        assert not put.done()
+        assert await queue.get() == 1
+        await put
+        assert queue.qsize() == 1
+
+
+class TestMemory:
+    def test_exceeded_successfully(self):
+        """
+        Given: Memory objects with and without high-water mark
+        When: Checking if RSS is above high-water mark
+        Expected: Only mark below RSS is exceeded
+        """
+        assert Memory.rss() > 0
+        assert Memory(1).exceeded()
+        assert not Memory(None).exceeded()
+        assert not Memory(1 << 60).exceeded()
@@ -0,0 +1,99 @@
+import pytest
+from tornado import queues
+
+from illuminate.manager import Batch
+
+
+class TestBatch:
+    @staticmethod
+    async def queue_with(items):
+        """
+        Creates queue and takes items from it, as workers do.
+
+        :param items: list
+        :return: tornado.queues.Queue
+        """
+        queue = queues.Queue()
+        for item in items:
+            await queue.put(item)
+            await queue.get()
+        return queue
+
+    @pytest.mark.asyncio
+    async def test_put_flushes_on_size(self):
+        """
+        Given: Batch is initialized with size of 3 items
+        When: Adding 3 items
+        Expected: Items are flushed together and marked as done in queue
+        """
+        flushed = []
+
+        async def flush(items):
+            flushed.append(items)
+
+        queue = await self.queue_with(range(3))
+        batch = Batch(flush, queue, size=3, interval=60)
+        for i in range(3):
+            await batch.put(i)
+        assert flushed == [[0, 1, 2]]
+        await queue.join()
+
+    @pytest.mark.asyncio
+    async def test_put_flushes_on_weight(self):
+        """
+        Given: Batch is initialized with weight limit of 10
+        When: Adding items which weights reach the limit
+        Expected: Items are flushed together
+        """
+        flushed = []
+
+        async def flush(items):
+            flushed.append(items)
+
+        queue = await self.queue_with(["aaaaa", "bbbbbb"])
+        batch = Batch(flush, queue, size=100, interval=60, limit=10, weigh=len)
+        await batch.put("aaaaa")
+        assert not flushed
+        await batch.put("bbbbbb")
+        assert flushed == [["aaaaa", "bbbbbb"]]
+        assert batch.weight == 0
+
+    @pytest.mark.asyncio
+    async def test_put_flushes_on_count(self):
+        """
+        Given: Batch is initialized with size of 5 and count function
+        When: Adding items which counts reach the size
+        Expected: Items are flushed together
+        """
+        flushed = []
+
+        async def flush(items):
+            flushed.append(items)
+
+        queue = await self.queue_with([[0, 1], [2, 3, 4]])
+        batch = Batch(flush, queue, size=5, interval=60, count=len)
+        await batch.put([0, 1])
+        assert not flushed
+        await batch.put([2, 3, 4])
+        assert flushed == [[[0, 1], [2, 3, 4]]]
+        assert batch.counted == 0
+
+    @pytest.mark.asyncio
+    async def test_put_flushes_on_interval(self):
+        """
+        Given: Batch is initialized with interval of 0.05 seconds
+        When: Adding item and waiting
+        Expected: Queue join waits until item is flushed
+        """
+        flushed = []
+
+        async def flush(items):
+            flushed.append(items)
+
+        queue = await self.queue_with([0])
+        batch = Batch(flush, queue, size=100, interval=0.05)
+        await batch.put(0)
+        assert not flushed
+        await queue.join()
+        assert flushed == [[0]]
+        assert not len(batch)
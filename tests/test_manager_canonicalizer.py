@@ -0,0 +1,99 @@
+import pytest
+
+from illuminate.manager import Assistant
+from illuminate.manager import Canonicalizer
+from illuminate.manager import Manager
+from illuminate.observation import HTTPObservation
+from tests.unit import Test
+
+
+class TestCanonicalizer:
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("HTTP://Example.COM/x?b=1&a=2", "http://example.com/x?a=2&b=1"),
+            ("http://example.com:80", "http://example.com/"),
+            ("https://example.com:8443/x/", "https://example.com:8443/x"),
+            (
+                "https://example.com/?utm_source=a&q=a+b&q=c&fbclid=1#top",
+                "https://example.com/?q=a+b&q=c",
+            ),
+            ("https://u:P@Example.com/", "https://u:P@example.com/"),
+            ("http://[::1]:8080/", "http://[::1]:8080/"),
+            ("http://example.com:port/", "http://example.com:port/"),
+            ("mailto:a@example.com", "mailto:a@example.com"),
+        ],
+    )
+    def test_canonicalize_successfully(self, url, expected):
+        """
+        Given: Canonicalizer with tracking patterns
+        When: Canonicalizing URL
+        Expected: URL is in canonical form, or unchanged if it is not HTTP or
+        cannot be parsed
+        """
+        canonicalizer = Canonicalizer(["utm_*", "fbclid"], True)
+        assert canonicalizer.canonicalize(url) == expected
+
+    def test_canonicalize_trailing_slash_successfully(self):
+        """
+        Given: Canonicalizer with default configuration
+        When: Canonicalizing URL with trailing slash
+        Expected: Trailing slash is kept
+        """
+        canonicalizer = Canonicalizer()
+        url = "http://example.com/x/"
+        assert canonicalizer.canonicalize(url) == url
+
+
+class TestManagerCanonicalizer(Test):
+    @pytest.mark.asyncio
+    async def test_router_canonicalizes_successfully(self):
+        """
+        Given: Manager with canonicalizer enabled
+        When: Routing HTTPObservations of differently written URLs of the same
+        resource
+        Expected: Observation is queued once with its URL unchanged
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            configuration = context["settings"].OBSERVATION_CONFIGURATION
+            configuration["canonicalizer"]["enabled"] = True
+            manager = Manager(**context, sessions={})
+            for url in (
+                "http://a.com/x?b=1&a=2",
+                "http://A.com/x?a=2&b=1",
+                "http://a.com:80/x?a=2&b=1&utm_source=x",
+            ):
+                await manager._Manager__router(
+                    HTTPObservation(
+                        url, allowed=("http://a.com",), callback=print
+                    ),
+                    "start",
+                )
+            queue = manager._Manager__observe_queue
+            assert queue.qsize() == 1
+            item = await queue.get()
+            assert item.url == "http://a.com/x?b=1&a=2"
+            assert item.canonical == "http://a.com/x?a=2&b=1"
+
+    @pytest.mark.asyncio
+    async def test_router_canonicalizer_disabled_successfully(self):
+        """
+        Given: Manager with default configuration
+        When: Routing HTTPObservations of differently written URLs of the same
+        resource
+        Expected: Observations are queued as distinct
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={})
+            for url in ("http://a.com/x?b=1&a=2", "http://a.com/x?a=2&b=1"):
+                await manager._Manager__router(
+                    HTTPObservation(
+                        url, allowed=("http://a.com",), callback=print
+                    ),
+                    "start",
+                )
+            assert manager._Manager__observe_queue.qsize() == 2
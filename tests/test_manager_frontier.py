@@ -0,0 +1,127 @@
+import asyncio
+import os
+
+import pytest
+
+from illuminate.manager import Assistant
+from illuminate.manager import Frontier
+from illuminate.manager import Manager
+from illuminate.observation import FileObservation
+from illuminate.observer import Observer
+from tests.unit import Test
+
+
+class ObserverFrontier(Observer):
+    """Test Observer owning callbacks of spilled Observations."""
+
+    NAME = "frontier"
+
+    async def observe(self, *args, **kwargs):
+        yield
+
+
+class TestFrontier(Test):
+    @pytest.mark.asyncio
+    async def test_spill_successfully(self):
+        """
+        Given: Frontier holding two Observations in memory
+        When: Putting five Observations and taking them all
+        Expected: Three are spilled, all are taken in FIFO order with
+        callbacks resolved and database is removed on close
+        """
+        with self.path():
+            observer = ObserverFrontier()
+            frontier = Frontier("frontier.db", 2, [observer])
+            for i in range(5):
+                await frontier.put(
+                    FileObservation(f"{i}.txt", callback=observer.observe)
+                )
+            assert frontier.spilled == 3
+            assert frontier.qsize() == 5
+            items = [await frontier.get() for _ in range(5)]
+            assert [i.url for i in items] == [f"{i}.txt" for i in range(5)]
+            assert all(i._callback == observer.observe for i in items)
+            assert frontier.empty()
+            frontier.close()
+            assert not os.path.exists("frontier.db")
+
+    @pytest.mark.asyncio
+    async def test_spill_unsuccessfully(self):
+        """
+        Given: Frontier holding a single Observation in memory
+        When: Putting Observation with callback that cannot be referenced
+        Expected: Observation is kept in memory
+        """
+        with self.path():
+            frontier = Frontier("frontier.db", 1, [])
+            for i in range(2):
+                await frontier.put(
+                    FileObservation(f"{i}.txt", callback=lambda x: x)
+                )
+            assert frontier.spilled == 0
+            assert frontier.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_reload_unresolved_successfully(self):
+        """
+        Given: Frontier with Observations spilled by an Observer that is no
+        longer registered
+        When: Taking Observations
+        Expected: Unresolved Observations are skipped and marked as done,
+        resolved ones are taken and spilled rows are deleted
+        """
+        with self.path():
+            observer = ObserverFrontier()
+            frontier = Frontier("frontier.db", 1, [observer])
+            for i in range(4):
+                await frontier.put(
+                    FileObservation(f"{i}.txt", callback=observer.observe)
+                )
+            frontier.connection.execute(
+                "UPDATE frontier SET observation = "
+                "replace(observation, '\"frontier\"', '\"missing\"') "
+                "WHERE id = 2"
+            )
+            items = [await frontier.get() for _ in range(3)]
+            assert [i.url for i in items] == ["0.txt", "1.txt", "3.txt"]
+            for _ in items:
+                frontier.task_done()
+            await frontier.join()
+            assert frontier.empty()
+            count = frontier.connection.execute(
+                "SELECT count(*) FROM frontier"
+            ).fetchone()
+            assert count == (0,)
+            frontier.close()
+
+
+class TestManagerFrontier(Test):
+    @pytest.mark.asyncio
+    async def test_router_spills_successfully(self):
+        """
+        Given: Manager with frontier threshold below observations maxsize
+        When: Routing more Observations than threshold without waiting
+        Expected: Observations above threshold are spilled
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            configuration = context["settings"].QUEUE_CONFIGURATION
+            assert (
+                configuration["frontier"]["threshold"]
+                < configuration["maxsize"]["observations"]
+            )
+            configuration["frontier"]["threshold"] = 2
+            configuration["maxsize"]["observations"] = 4
+            manager = Manager(**context, sessions={})
+            for i in range(4):
+                await asyncio.wait_for(
+                    manager._Manager__router(
+                        FileObservation(f"{i}.txt", callback=print), "start"
+                    ),
+                    1,
+                )
+            queue = manager._Manager__observe_queue
+            assert queue.spilled == 2
+            assert queue.qsize() == 4
+            queue.close()
@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+from illuminate.manager import AutoThrottle
+from illuminate.manager import Throttle
+from illuminate.manager import TokenBucket
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_acquire_burst_without_waiting(self):
+        """
+        Given: TokenBucket is initialized with burst of 3 tokens
+        When: Acquiring 3 tokens
+        Expected: Tokens are acquired without waiting
+        """
+        bucket = TokenBucket(rate=1, burst=3)
+        start = IOLoop.current().time()
+        for _ in range(3):
+            await bucket.acquire()
+        assert IOLoop.current().time() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """
+        Given: TokenBucket is initialized with rate of 20 tokens per second
+        When: Acquiring 3 tokens with burst of 1 token
+        Expected: Acquisition waits for tokens to be refilled
+        """
+        bucket = TokenBucket(rate=20, burst=1)
+        start = IOLoop.current().time()
+        await gen.multi([bucket.acquire() for _ in range(3)])
+        assert IOLoop.current().time() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_acquire_without_rate(self):
+        """
+        Given: TokenBucket is initialized with rate of 0
+        When: Acquiring tokens
+        Expected: Tokens are acquired without limit
+        """
+        bucket = TokenBucket(rate=0, burst=1)
+        for _ in range(100):
+            await bucket.acquire()
+        assert bucket.tokens == 1
+
+
+class TestThrottle:
+    def test_bucket_per_host(self):
+        """
+        Given: Throttle is initialized
+        When: Acquiring buckets for URLs of different and same hosts
+        Expected: Bucket is shared only between URLs of the same host
+        """
+        throttle = Throttle(rate=1, burst=1)
+        bucket_1 = throttle.bucket("https://example.com/a")
+        bucket_2 = throttle.bucket("https://EXAMPLE.com/b")
+        bucket_3 = throttle.bucket("https://example.org/a")
+        assert bucket_1 is bucket_2
+        assert bucket_1 is not bucket_3
+
+    @pytest.mark.asyncio
+    async def test_acquire_different_hosts_without_waiting(self):
+        """
+        Given: Throttle is initialized with rate of 1 request per second
+        When: Acquiring requests towards different hosts
+        Expected: Requests are allowed without waiting
+        """
+        throttle = Throttle(rate=1, burst=1)
+        start = IOLoop.current().time()
+        await gen.multi(
+            [throttle.acquire(f"https://{i}.example.com") for i in range(10)]
+        )
+        assert IOLoop.current().time() - start < 0.5
+
+
+class TestAutoThrottle:
+
+    url = "https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_release_increases_on_fast_responses(self):
+        """
+        Given: AutoThrottle is initialized with target latency of 1 second
+        When: Releasing requests with latency below the target
+        Expected: Host's rate and concurrency are increased up to the limits
+        """
+        throttle = AutoThrottle(rate=1, concurrency=3, max_rate=2.5)
+        for _ in range(5):
+            await throttle.acquire(self.url)
+            throttle.release(self.url, 0.1, 200)
+        host = throttle.state(self.url)
+        assert host.limit == 3
+        assert host.bucket.rate == 2.5
+
+    @pytest.mark.asyncio
+    async def test_release_decreases_on_errors(self):
+        """
+        Given: AutoThrottle host has reached maximum rate and concurrency
+        When: Releasing request with server error response
+        Expected: Host's rate and concurrency are decreased
+        """
+        throttle = AutoThrottle(rate=8, concurrency=8, max_rate=8)
+        host = throttle.state(self.url)
+        host.limit = 8
+        await throttle.acquire(self.url)
+        throttle.release(self.url, 0.1, 503)
+        assert host.limit == 4
+        assert host.bucket.rate == 4
+
+    @pytest.mark.asyncio
+    async def test_release_decreases_on_slow_responses(self):
+        """
+        Given: AutoThrottle is initialized with target latency of 1 second
+        When: Releasing request with latency above the target
+        Expected: Host's rate is decreased but not below minimum rate
+        """
+        throttle = AutoThrottle(rate=1, min_rate=0.75)
+        await throttle.acquire(self.url)
+        throttle.release(self.url, 5.0, 200)
+        assert throttle.state(self.url).bucket.rate == 0.75
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_concurrency(self):
+        """
+        Given: AutoThrottle host allows a single concurrent request
+        When: Acquiring second request before the first is released
+        Expected: Second request waits until the first one is released
+        """
+        throttle = AutoThrottle(rate=0)
+        await throttle.acquire(self.url)
+        waiting = gen.convert_yielded(throttle.acquire(self.url))
+        await gen.sleep(0.01)
+        assert not waiting.done()
+        throttle.release(self.url, 0.1, 200)
+        await waiting
+        assert throttle.state(self.url).running == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_cancelled_releases_concurrency(self):
+        """
+        Given: AutoThrottle host allows two concurrent requests at rate of one
+        request per second
+        When: Second request is cancelled while waiting for the rate
+        Expected: Second request's concurrency slot is given back
+        """
+        throttle = AutoThrottle(rate=1)
+        throttle.state(self.url).limit = 2
+        await throttle.acquire(self.url)
+        waiting = asyncio.ensure_future(throttle.acquire(self.url))
+        await gen.sleep(0.01)
+        assert throttle.state(self.url).running == 2
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert throttle.state(self.url).running == 1
@@ -0,0 +1,129 @@
+import random
+
+import pytest
+
+from illuminate.manager import Assistant
+from illuminate.manager import BloomVisited
+from illuminate.manager import CompactVisited
+from illuminate.manager import Manager
+from illuminate.manager import SetVisited
+from illuminate.manager.manager import UNSUCCESSFUL
+from illuminate.observation import FileObservation
+from tests.unit import Test
+
+
+class TestVisited:
+    @pytest.mark.parametrize(
+        "visited",
+        [SetVisited(), CompactVisited(size=16), BloomVisited(1000, 0.001)],
+    )
+    def test_add_successfully(self, visited):
+        """
+        Given: Store of visited fingerprints
+        When: Adding signed 64-bit fingerprints twice
+        Expected: Fingerprints are added only the first time and are found
+        """
+        keys = [random.getrandbits(64) - (1 << 63) for _ in range(500)]
+        assert all(visited.add(i) for i in keys)
+        assert not any(visited.add(i) for i in keys)
+        assert all(i in visited for i in keys)
+        assert len(visited) == 500
+
+    def test_compact_flush_successfully(self):
+        """
+        Given: CompactVisited with hot set of four fingerprints
+        When: Adding fingerprints over many flushes
+        Expected: Blocks are sorted, merged and hold every fingerprint
+        """
+        visited = CompactVisited(size=4)
+        for i in range(100):
+            visited.add(i)
+        assert len(visited.blocks) < 25
+        assert sum(i.size for i in visited.blocks) + len(visited.hot) == 100
+        assert all((i[1:] > i[:-1]).all() for i in visited.blocks)
+        assert 100 not in visited
+
+    def test_bloom_error_rate_successfully(self):
+        """
+        Given: BloomVisited filled to capacity
+        When: Checking fingerprints that were not added
+        Expected: Share reported as visited is close to error rate
+        """
+        visited = BloomVisited(10000, 0.01)
+        for i in range(10000):
+            visited.add(random.getrandbits(64))
+        false = sum(random.getrandbits(64) in visited for _ in range(10000))
+        assert false < 200
+
+
+class TestManagerVisited(Test):
+    @pytest.mark.asyncio
+    async def test_router_deduplicates_successfully(self):
+        """
+        Given: Manager configured with compact visited store
+        When: Routing the same Observation twice
+        Expected: Observation is queued once
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            configuration = context["settings"].OBSERVATION_CONFIGURATION
+            configuration["visited"]["implementation"] = "compact"
+            manager = Manager(**context, sessions={})
+            assert isinstance(manager._Manager__observing, CompactVisited)
+            for _ in range(2):
+                await manager._Manager__router(
+                    FileObservation("a", callback=print), "start"
+                )
+            assert manager._Manager__observe_queue.qsize() == 1
+
+    def test_provide_visited_fallback(self):
+        """
+        Given: Manager configured with unsupported visited store
+        When: Manager is initialized
+        Expected: Exact set is used instead
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            configuration = context["settings"].OBSERVATION_CONFIGURATION
+            configuration["visited"]["implementation"] = "unknown"
+            manager = Manager(**context, sessions={})
+            assert isinstance(manager._Manager__observing, SetVisited)
+
+    def test_provide_visited_bloom(self):
+        """
+        Given: Manager configured with Bloom filter visited store
+        When: Manager is initialized
+        Expected: Bloom filters are used for routed, observed and not observed
+        Observations, with parameters of other stores left out
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            configuration = context["settings"].OBSERVATION_CONFIGURATION
+            configuration["visited"]["implementation"] = "bloom"
+            manager = Manager(**context, sessions={})
+            assert isinstance(manager._Manager__observing, BloomVisited)
+            assert isinstance(manager.observed, BloomVisited)
+            assert isinstance(manager.not_observed, BloomVisited)
+
+    @pytest.mark.asyncio
+    async def test_resolve_unsuccessfully(self):
+        """
+        Given: Manager is initialized
+        When: Resolving Observations without Result
+        Expected: Fingerprints are kept as not observed and URLs of the last
+        unsuccessful Observations are kept for logging
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={})
+            resolve = manager._Manager__observation_resolve
+            for i in range(UNSUCCESSFUL + 1):
+                item = FileObservation(f"{i}.txt", callback=print)
+                assert not await resolve(None, item)
+            assert len(manager.not_observed) == UNSUCCESSFUL + 1
+            assert len(manager.unsuccessful) == UNSUCCESSFUL
+            assert manager.unsuccessful[-1] == f"{UNSUCCESSFUL}.txt"
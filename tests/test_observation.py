@@ -1,6 +1,11 @@
+import os
+import subprocess
+import sys
+
 import pytest
 
 from illuminate.exceptions import BasicObservationException
+from illuminate.observation import FileObservation
 from illuminate.observation import Observation
 
 
@@ -15,3 +20,58 @@ class TestObservation:
         """
         observer = Observation("https://www.example.com")
         observer.observe()
+
+    @pytest.mark.xfail(raises=BasicObservationException)
+    def test_not_implemented_identity(self):
+        """
+        Given: Observation class is not inherited and instantiated
+        When: calling fingerprint method
+        Expected: BasicObservationException is raised
+        """
+        observer = Observation("https://www.example.com")
+        observer.fingerprint()
+
+    def test_fingerprint_successfully(self):
+        """
+        Given: FileObservation is fingerprinted in processes with different
+        hash seeds
+        When: Comparing fingerprints
+        Expected: They are the same 64-bit int, computed once per instance
+        """
+        code = (
+            "from illuminate.observation import FileObservation;"
+            "print(FileObservation('a', callback=print).fingerprint())"
+        )
+        fingerprints = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                cwd=os.path.dirname(os.path.dirname(__file__)),
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                text=True,
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        observation = FileObservation("a", callback=print)
+        assert fingerprints == {str(observation.fingerprint())}
+        assert 0 <= observation.fingerprint() < 1 << 64
+        observation.url = "b"
+        assert observation.fingerprint() == int(fingerprints.pop())
+
+    def test_fingerprint_hash_successfully(self):
+        """
+        Given: Observation child class implementing __hash__ instead of
+        identity
+        When: calling fingerprint method
+        Expected: Fingerprint is 64-bit int of hash value
+        """
+
+        class ObservationHash(Observation):
+            def __hash__(self):
+                return hash(self.url.lower())
+
+        first = ObservationHash("https://www.example.com")
+        second = ObservationHash("https://www.EXAMPLE.com")
+        assert first.fingerprint() == second.fingerprint()
+        assert 0 <= first.fingerprint() < 1 << 64
@@ -159,3 +159,31 @@ class TestHTTPObservationClass:
         )
         result = await observation.observe()
         assert not result
+
+    @pytest.mark.asyncio
+    async def test_observe_measure_successfully(self, async_http_response_ok):
+        """
+        Given: HTTPObservations is initialized
+        When: Instance calls observe function
+        Expected: Response code and request time are kept
+        """
+        observation = HTTPObservation(
+            self.url, allowed=(self.url,), callback=int
+        )
+        await observation.observe()
+        assert observation.code == 200
+
+    @pytest.mark.asyncio
+    async def test_observe_measure_unsuccessfully(
+        self, async_http_response_not_ok
+    ):
+        """
+        Given: HTTPObservations is initialized
+        When: Instance calls observe function but HTTPClientError is raised
+        Expected: Error code is kept
+        """
+        observation = HTTPObservation(
+            self.url, allowed=(self.url,), callback=int
+        )
+        await observation.observe()
+        assert observation.code == 509
@@ -0,0 +1,140 @@
+import pandas as pd
+import pytest
+
+from illuminate.manager import Assistant
+from illuminate.manager import Manager
+from illuminate.observation import InfluxDBObservation
+from illuminate.observer import Finding
+from tests.unit import Test
+
+
+def chunk(values):
+    """
+    Creates InfluxDB JSON response chunk.
+
+    :param values: list
+    :return: dict
+    """
+    return {
+        "results": [
+            {
+                "statement_id": 0,
+                "series": [
+                    {
+                        "name": "example",
+                        "columns": ["time", "load_time"],
+                        "values": values,
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class Session:
+    """
+    InfluxDBClient stand-in that answers chunked queries.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+        self.queries = []
+
+    async def query(self, query, **kwargs):
+        self.queries.append((query, kwargs))
+
+        async def generator():
+            try:
+                for _chunk in self.chunks:
+                    yield _chunk
+            finally:
+                self.closed = True
+
+        return generator()
+
+
+async def callback(chunks, *args, **kwargs):
+    async for _chunk in chunks:
+        for value in _chunk["results"][0]["series"][0]["values"]:
+            yield Finding()
+
+
+class TestInfluxDBObservationClass(Test):
+
+    query = "SELECT * FROM example"
+
+    def test_observation_hash(self):
+        """
+        Given: InfluxDBObservations are initialized with different URLs and
+        the same query
+        When: Comparing hash values of InfluxDBObservation objects
+        Expected: They are not the same
+        """
+        observation_1 = InfluxDBObservation(self.query, "a", callback)
+        observation_2 = InfluxDBObservation(self.query, "b", callback)
+        assert hash(observation_1) != hash(observation_2)
+
+    @pytest.mark.asyncio
+    async def test_observe_successfully(self):
+        """
+        Given: InfluxDBObservation is initialized with chunk size
+        When: Callback iterates over chunks
+        Expected: Query is sent chunked and response is released on exit
+        """
+        session = Session([chunk([[1, 1.0]]), chunk([[2, 2.0], [3, 3.0]])])
+        observation = InfluxDBObservation(
+            self.query, "measurements", callback, chunk_size=2
+        )
+        async with observation.observe(session) as result:
+            findings = [i async for i in result]
+        assert len(findings) == 3
+        assert session.queries == [
+            (
+                self.query,
+                {"chunk_size": 2, "chunked": True, "epoch": "ns"},
+            )
+        ]
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_observe_dataframe_successfully(self):
+        """
+        Given: InfluxDBObservation is initialized with dataframe flag
+        When: Callback iterates over chunks
+        Expected: Chunks are parsed into DataFrames
+        """
+        frames = []
+
+        async def _callback(chunks):
+            async for _chunk in chunks:
+                frames.append(_chunk)
+            yield Finding()
+
+        session = Session([chunk([[1, 1.0]]), chunk([[2, 2.0]])])
+        observation = InfluxDBObservation(
+            self.query, "measurements", _callback, dataframe=True
+        )
+        async with observation.observe(session) as result:
+            [i async for i in result]
+        assert all(isinstance(i, pd.DataFrame) for i in frames)
+        assert [i["load_time"].tolist() for i in frames] == [[1.0], [2.0]]
+
+    @pytest.mark.asyncio
+    async def test_observe_with_manager_successfully(self):
+        """
+        Given: Manager with InfluxDB session
+        When: Manager observes InfluxDBObservation
+        Expected: Findings yielded by callback are routed to adapt queue
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            context = Assistant.provide_context(sessions=False)
+            session = Session([chunk([[1, 1.0], [2, 2.0]])])
+            manager = Manager(**context, sessions={"measurements": session})
+            observation = InfluxDBObservation(
+                self.query, "measurements", callback
+            )
+            await manager._Manager__observation_switch(observation)
+            assert manager._Manager__adapt_queue.qsize() == 2
+            assert session.closed
@@ -1,10 +1,22 @@
 import os
+from datetime import datetime
+from decimal import Decimal
 
+import numpy as np
 import pytest
+from sqlalchemy import select
 from sqlalchemy.sql import text
 
+from illuminate.exceptions import BasicObservationException
+from illuminate.exporter import SQLExporter
+from illuminate.manager import Assistant
 from illuminate.manager import Manager
+from illuminate.manager import Watermarks
+from illuminate.observation import SQLIncrementalObservation
+from illuminate.observation import SQLKeysetObservation
 from illuminate.observation import SQLObservation
+from illuminate.observer import Finding
+from illuminate.observer import Observer
 from tests.unit import Test
 
 
@@ -84,3 +96,525 @@ class TestSQLObservationClass(Test):
             os.remove(os.path.join(path, f"{self.db}.db"))
             results = await observation.observe(self.session_async)
             assert not results
+
+    @pytest.mark.asyncio
+    async def test_stream_successfully(self):
+        """
+        Given: SQLObservation is initialized with partition of a single row
+        When: Instance calls stream function
+        Expected: Callback receives rows in partitions while cursor is open
+        """
+
+        partitions = []
+
+        async def callback(results, *args, **kwargs):
+            async for partition in results:
+                partitions.append(partition)
+                for r in partition:
+                    yield r
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            observation = SQLObservation(
+                self.query, "main", callback, partition=1
+            )
+            async with observation.stream(self.session_async) as results:
+                rows = [r async for r in results]
+            assert len(rows) == 2
+            assert [len(i) for i in partitions] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_stream_unsuccessfully(self):
+        """
+        Given: SQLObservation is initialized with partition
+        When: Instance calls stream function but SQLAlchemyError is raised
+        Expected: Context manager returns None
+        """
+
+        with self.path():
+            name = "example"
+            Manager.project_setup(name, ".")
+            observation = SQLObservation(
+                self.query, "main", callback_with_assert, partition=1
+            )
+            async with observation.stream(self.session_async) as results:
+                assert not results
+
+    @pytest.mark.asyncio
+    async def test_stream_with_manager_successfully(self):
+        """
+        Given: Manager with SQL session
+        When: Manager observes SQLObservation with partition
+        Expected: Objects yielded by callback are routed while streaming
+        """
+
+        async def callback(results, *args, **kwargs):
+            async for partition in results:
+                for _ in partition:
+                    yield Finding()
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={"main": self.session_async})
+            observation = SQLObservation(
+                self.query, "main", callback, partition=1
+            )
+            await manager._Manager__observation_switch(observation)
+            assert manager._Manager__adapt_queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_observe_columnar_successfully(self):
+        """
+        Given: SQLObservation is initialized with columnar dataframe
+        When: Instance calls observe function
+        Expected: Callback receives DataFrame with selected columns
+        """
+        frames = []
+
+        async def callback(results, *args, **kwargs):
+            frames.append(results)
+            yield Finding()
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            observation = SQLObservation(
+                text("SELECT id, url FROM example ORDER BY id"),
+                "main",
+                callback,
+                columnar="dataframe",
+            )
+            results = await observation.observe(self.session_async)
+            [r async for r in results]
+            assert list(frames[0].columns) == ["id", "url"]
+            assert frames[0]["id"].tolist() == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stream_columnar_successfully(self):
+        """
+        Given: SQLObservation is initialized with partition and columnar
+        records
+        When: Instance calls stream function
+        Expected: Callback receives NumPy record array per partition
+        """
+        partitions = []
+
+        async def callback(results, *args, **kwargs):
+            async for partition in results:
+                partitions.append(partition)
+            yield Finding()
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            observation = SQLObservation(
+                text("SELECT id FROM example ORDER BY id"),
+                "main",
+                callback,
+                partition=1,
+                columnar="records",
+            )
+            async with observation.stream(self.session_async) as results:
+                [r async for r in results]
+            assert all(isinstance(i, np.recarray) for i in partitions)
+            assert [i.id.tolist() for i in partitions] == [[1], [2]]
+
+    def test_columnar_unsuccessfully(self):
+        """
+        Given: Unsupported columnar format
+        When: Initializing SQLObservation
+        Expected: BasicObservationException is raised
+        """
+        with pytest.raises(BasicObservationException):
+            SQLObservation(
+                self.query, "main", callback_with_assert, columnar="arrow"
+            )
+
+
+class TestSQLKeysetObservationClass(Test):
+    def test_observation_hash(self):
+        """
+        Given: SQLKeysetObservations are initialized with the same query and
+        different last keys
+        When: Comparing hash values of SQLKeysetObservation objects
+        Expected: They are not the same
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            from models.example import ModelExample
+
+            query = select(ModelExample.id, ModelExample.url)
+            observation_1 = SQLKeysetObservation(
+                query, "main", callback_with_assert, key=ModelExample.id
+            )
+            observation_2 = SQLKeysetObservation(
+                query,
+                "main",
+                callback_with_assert,
+                key=ModelExample.id,
+                last=1,
+            )
+            assert hash(observation_1) != hash(observation_2)
+
+    @pytest.mark.asyncio
+    async def test_observe_successfully(self):
+        """
+        Given: SQLKeysetObservation is initialized with page of a single row
+        When: Observing pages until page is not full
+        Expected: Each page holds the next row and the last one has no
+        following page
+        """
+
+        async def callback(results, *args, **kwargs):
+            for r in results.fetchall():
+                yield r
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            for query in (select(ModelExample.id), select(ModelExample)):
+                observation = SQLKeysetObservation(
+                    query, "main", callback, key=ModelExample.id, size=1
+                )
+                pages = []
+                while observation:
+                    results = await observation.observe(self.session_async)
+                    pages.append([r async for r in results])
+                    observation = observation.following
+                assert [len(i) for i in pages] == [1, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_observe_ordered_successfully(self):
+        """
+        Given: SQLKeysetObservation is initialized with query ordered by
+        other than key column
+        When: Observing pages until page is not full
+        Expected: Pages are ordered by key column and no row is skipped or
+        repeated
+        """
+
+        async def callback(results, *args, **kwargs):
+            for r in results.fetchall():
+                yield r
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            query = select(ModelExample.id).order_by(ModelExample.id.desc())
+            observation = SQLKeysetObservation(
+                query, "main", callback, key=ModelExample.id, size=1
+            )
+            keys = []
+            while observation:
+                results = await observation.observe(self.session_async)
+                keys.extend([r.id async for r in results])
+                observation = observation.following
+            assert keys == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_observe_with_manager_successfully(self):
+        """
+        Given: Manager with SQL session
+        When: Manager observes full page of SQLKeysetObservation
+        Expected: Next page is routed to observe queue
+        """
+
+        async def callback(results, *args, **kwargs):
+            for _ in results.fetchall():
+                yield Finding()
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={"main": self.session_async})
+            observation = SQLKeysetObservation(
+                select(ModelExample.id),
+                "main",
+                callback,
+                key=ModelExample.id,
+                size=1,
+            )
+            await manager._Manager__observation_switch(observation)
+            queue = manager._Manager__observe_queue
+            assert queue.qsize() == 1
+            assert (await queue.get()).last == 1
+            assert manager._Manager__adapt_queue.qsize() == 1
+
+
+class TestSQLObservationPartitioning(Test):
+    def test_bounds(self):
+        """
+        Given: Integer, float and datetime bounds
+        When: Calculating boundaries of ranges
+        Expected: Boundaries split bounds into equal ranges
+        """
+        assert SQLObservation.bounds(0, 10, 4) == [2, 5, 7]
+        assert SQLObservation.bounds(0, 2, 4) == [1]
+        assert SQLObservation.bounds(0.0, 1.0, 4) == [0.25, 0.5, 0.75]
+        assert SQLObservation.bounds(10, 0, 4) == []
+        lower = datetime(2024, 1, 1)
+        assert SQLObservation.bounds(lower, datetime(2024, 1, 3), 2) == [
+            datetime(2024, 1, 2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_split_successfully(self):
+        """
+        Given: Table with NULL values and values out of bounds
+        When: Observing partitioned SQLObservation through Manager
+        Expected: Every row is read exactly once, across all ranges
+        """
+        rows = []
+
+        async def callback(results, *args, **kwargs):
+            rows.extend(results.fetchall())
+            yield Finding()
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            values = [None, -5.0, 0.0, 1.5, 2.5, 5.0, 9.9, 10.0, 100.0]
+            with self.session as session:
+                session.add_all(
+                    [ModelExample(load_time=i, url=f"{i}") for i in values]
+                )
+                session.commit()
+            observation = SQLObservation(
+                select(ModelExample.id),
+                "main",
+                callback,
+                partitioning={
+                    "column": ModelExample.load_time,
+                    "lower": 0.0,
+                    "upper": 10.0,
+                    "partitions": 4,
+                },
+            )
+            assert len(observation.split()) == 4
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={"main": self.session_async})
+            await manager._Manager__observation_switch(observation)
+            assert sorted(i.id for i in rows) == list(range(1, 10))
+            assert manager._Manager__adapt_queue.qsize() == 4
+
+    def test_split_unsuccessfully(self):
+        """
+        Given: Partitioned SQLObservation with text query
+        When: Splitting observation
+        Expected: BasicObservationException is raised
+        """
+        observation = SQLObservation(
+            text("SELECT * FROM example"),
+            "main",
+            callback_with_assert,
+            partitioning={
+                "column": "id",
+                "lower": 0,
+                "upper": 10,
+                "partitions": 2,
+            },
+        )
+        with pytest.raises(BasicObservationException):
+            observation.split()
+
+
+class TestSQLIncrementalObservationClass(Test):
+    def test_observation_hash(self):
+        """
+        Given: SQLIncrementalObservation is initialized
+        When: Comparing hash values of observation and its next run
+        Expected: They are not the same
+        """
+        with self.path():
+            Manager.project_setup("example", ".")
+            from models.example import ModelExample
+
+            observation = SQLIncrementalObservation(
+                select(ModelExample.id),
+                "main",
+                callback_with_assert,
+                column=ModelExample.id,
+            )
+            following = observation.poll()
+            assert hash(observation) != hash(following)
+            assert following.name == observation.name
+
+    def test_watermarks_successfully(self):
+        """
+        Given: Watermarks database
+        When: Marks are set and database is opened again
+        Expected: Marks are restored with their type, marks of unsupported
+        type are rejected
+        """
+        with self.path():
+            watermarks = Watermarks("watermarks.db")
+            assert watermarks.get("a") is None
+            watermarks.set("a", 1)
+            watermarks.set("a", datetime(2024, 1, 1))
+            watermarks.set("b", Decimal("1.10"))
+            with pytest.raises(TypeError):
+                watermarks.set("c", object())
+            watermarks.close()
+            watermarks = Watermarks("watermarks.db")
+            assert watermarks.get("a") == datetime(2024, 1, 1)
+            assert str(watermarks.get("b")) == "1.10"
+            assert watermarks.get("c") is None
+
+    @pytest.mark.asyncio
+    async def test_observe_with_manager_successfully(self):
+        """
+        Given: Manager with SQL session
+        When: Manager observes SQLIncrementalObservation with interval twice
+        Expected: First run reads all rows and keeps the highest id as pending
+        mark, stored once queues are drained, second run reads no rows and
+        next run is scheduled
+        """
+
+        async def callback(results, *args, **kwargs):
+            for _ in results.fetchall():
+                yield Finding()
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={"main": self.session_async})
+            observation = SQLIncrementalObservation(
+                select(ModelExample.id),
+                "main",
+                callback,
+                column=ModelExample.id,
+                interval=60,
+            )
+            await manager._Manager__observation_switch(observation)
+            assert manager._Manager__adapt_queue.qsize() == 2
+            assert Watermarks("watermarks.db").get(observation.name) is None
+            manager._Manager__watermark(True)
+            assert Watermarks("watermarks.db").get(observation.name) == 2
+            await manager._Manager__observation_switch(observation.poll())
+            assert manager._Manager__adapt_queue.qsize() == 2
+            assert len(manager._Manager__pollers) == 2
+
+    @pytest.mark.asyncio
+    async def test_observe_with_manager_unsuccessfully(self):
+        """
+        Given: Manager with SQL session
+        When: Callback of SQLIncrementalObservation throws an exception
+        Expected: Mark is not stored
+        """
+
+        async def callback(results, *args, **kwargs):
+            raise ValueError
+            yield  # noqa
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            context = Assistant.provide_context(sessions=False)
+            manager = Manager(**context, sessions={"main": self.session_async})
+            observation = SQLIncrementalObservation(
+                select(ModelExample.id),
+                "main",
+                callback,
+                column=ModelExample.id,
+            )
+            await manager._Manager__observation_switch(observation)
+            manager._Manager__watermark(True)
+            assert Watermarks("watermarks.db").get(observation.name) is None
+            assert not manager._Manager__pollers
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fail,expected", [(False, 2), (True, None)])
+    async def test_observe_start_exporter_fails(self, fail, expected):
+        """
+        Given: Manager with SQL session
+        When: Exporters yielded by SQLIncrementalObservation's callback are
+        exported successfully or fail
+        Expected: Mark is stored only if Exporters did not fail
+        """
+
+        class ExporterFailing(SQLExporter):
+            name = "main"
+
+            async def write(self, session, *args, **kwargs):
+                raise ValueError
+
+        async def callback(results, *args, **kwargs):
+            for _ in results.fetchall():
+                if fail:
+                    yield ExporterFailing([])
+
+        with self.path() as path:
+            name = "example"
+            Manager.project_setup(name, ".")
+            from models.example import ModelExample
+
+            class ObserverIncremental(Observer):
+                NAME = "incremental"
+
+                def __init__(self, manager=None):
+                    super().__init__(manager=manager)
+                    self.initial_observations = [
+                        SQLIncrementalObservation(
+                            select(ModelExample.id),
+                            "main",
+                            callback,
+                            column=ModelExample.id,
+                            name="incremental",
+                        )
+                    ]
+
+            Manager.db_revision(path, "head", "main", self.url)
+            Manager.db_upgrade(path, "head", "main", self.url)
+            Manager.db_populate(["fixtures/example.json"], "main", self.url)
+            context = Assistant.provide_context(sessions=False)
+            context["observers"] = [ObserverIncremental]
+            manager = Manager(**context, sessions={"main": self.session_async})
+            await manager._observe_start()
+            assert bool(manager._Manager__failures) == fail
+            assert Watermarks("watermarks.db").get("incremental") == expected